@@ -0,0 +1,237 @@
+"""
+한국마사회 API 과거 데이터 백필 명령어
+
+기간 내 모든 월 x 경마장 x 엔드포인트를 작업 풀로 병렬 조회해 원본 페이지를
+압축 아카이브에 기록한다. 완료한 작업은 체크포인트 파일에 남겨 중단 후 이어서 진행하고,
+이미 아카이브에 있는 지난 달 데이터는 네트워크 대신 아카이브에서 재생한다.
+
+아카이브 기록과 DB 적재(--ingest)는 체크포인트를 따로 둔다. 적재 없이 받아 둔 달도 나중에
+--ingest로 다시 실행하면 아카이브에서 재생해 적재하며, 적재 완료는 그 달 전체 기간을
+적재한 경우에만 기록한다 (기간 일부만 적재한 달은 더 넓은 기간으로 다시 실행하면 나머지를 적재).
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from apps.racing.services import KRAAPIService
+from apps.racing.services.archive import BackfillCheckpoint, RawArchive
+from apps.racing.services.budget import Priority
+
+
+# 엔드포인트별 월 단위 조회 파라미터 이름 (None: 날짜 없이 전체 조회)
+MONTH_PARAMS = {
+    'race_schedule': 'rc_month',
+    'entry_sheet': 'rc_month',
+    'race_results': 'rc_date',
+    'race_records': 'rc_date',
+    'horse_info': None,
+}
+
+# 엔드포인트별 적재 메서드 (--ingest)
+INGEST_METHODS = {
+    'race_schedule': 'upsert_races',
+    'entry_sheet': 'upsert_entries',
+    'race_results': 'upsert_results',
+    'race_records': 'upsert_records',
+    'horse_info': 'upsert_horses',
+}
+
+
+class Command(BaseCommand):
+    help = '기간 내 KRA API 데이터를 병렬로 받아 압축 아카이브에 기록 (체크포인트로 이어받기)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start',
+            type=str,
+            required=True,
+            help='시작일 (YYYYMMDD 또는 YYYYMM)'
+        )
+        parser.add_argument(
+            '--end',
+            type=str,
+            help='종료일 (YYYYMMDD 또는 YYYYMM, 기본: 오늘)'
+        )
+        parser.add_argument(
+            '--meet',
+            type=int,
+            action='append',
+            choices=list(KRAAPIService.TRACKS.keys()),
+            help='경마장 (여러 번 지정 가능, 기본: 전체)'
+        )
+        parser.add_argument(
+            '--endpoint',
+            action='append',
+            choices=list(KRAAPIService.ENDPOINTS.keys()),
+            help='엔드포인트 (여러 번 지정 가능, 기본: 전체)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='동시 작업 수'
+        )
+        parser.add_argument(
+            '--archive-dir',
+            type=str,
+            help='아카이브 경로 (기본: settings.KRA_ARCHIVE_DIR)'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=str,
+            help='체크포인트 파일 경로 (기본: 아카이브 경로/backfill-checkpoint.json)'
+        )
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='체크포인트/아카이브를 무시하고 다시 조회'
+        )
+        parser.add_argument(
+            '--ingest',
+            action='store_true',
+            help='받은 데이터를 로컬 DB에도 적재'
+        )
+
+    def handle(self, *args, **options):
+        start = self.parse_date(options['start'], end=False)
+        end = self.parse_date(options['end'], end=True) if options['end'] else datetime.now().strftime('%Y%m%d')
+        if start > end:
+            raise CommandError('시작일이 종료일보다 늦습니다')
+
+        self.start, self.end = start, end
+        self.refresh = options['refresh']
+        self.current_month = datetime.now().strftime('%Y%m')
+        self.archive = RawArchive(root=options['archive_dir'])
+        self.checkpoint = BackfillCheckpoint(
+            options['checkpoint'] or os.path.join(self.archive.root, 'backfill-checkpoint.json')
+        )
+        self.api_service = KRAAPIService(priority=Priority.BACKFILL)
+        self.ingestion = None
+        if options['ingest']:
+            from apps.racing.services.ingestion import KRAIngestionService
+            self.ingestion = KRAIngestionService(self.api_service)
+
+        meets = options['meet'] or list(KRAAPIService.TRACKS.keys())
+        endpoints = options['endpoint'] or list(KRAAPIService.ENDPOINTS.keys())
+        months = self.month_range(start[:6], end[:6])
+
+        tasks = []
+        for endpoint in endpoints:
+            # 날짜 구분이 없는 엔드포인트는 현재 스냅샷 한 번만
+            task_months = months if MONTH_PARAMS[endpoint] else [self.current_month]
+            for meet in meets:
+                for month in task_months:
+                    tasks.append((endpoint, meet, month))
+
+        self.stdout.write(
+            f"백필: {start}~{end}, 경마장 {meets}, 엔드포인트 {len(endpoints)}개, "
+            f"작업 {len(tasks)}개 (완료 기록 {len(self.checkpoint)}개), 아카이브 {self.archive.root}"
+        )
+
+        summary = {'fetched': 0, 'replayed': 0, 'skipped': 0, 'failed': 0}
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as executor:
+            futures = {executor.submit(self.run_task, *task): task for task in tasks}
+            for future in as_completed(futures):
+                endpoint, meet, month = futures[future]
+                try:
+                    status, count = future.result()
+                except Exception as e:
+                    status, count = 'failed', 0
+                    self.stderr.write(f"{endpoint} {meet} {month}: 오류 {str(e)}")
+                summary[status] += 1
+                self.stdout.write(f"[{status}] {endpoint} {KRAAPIService.TRACKS[meet]} {month}: {count}건")
+
+        style = self.style.SUCCESS if not summary['failed'] else self.style.WARNING
+        self.stdout.write(style(f"백필 종료: {summary}"))
+
+    def run_task(self, endpoint: str, meet: int, month: str):
+        """
+        월 x 경마장 x 엔드포인트 하나를 처리
+
+        Returns:
+            (상태, item 수) - 상태: fetched/replayed/skipped/failed
+        """
+        task_id = f"{endpoint}:{meet}:{month}"
+        ingest_id = f"ingest:{task_id}"
+        # 이번 달 이후는 데이터가 계속 바뀌므로 체크포인트/재생 대상이 아님
+        settled = month < self.current_month
+        resumable = settled and not self.refresh
+
+        archived = resumable and self.checkpoint.is_done(task_id)
+        ingested = self.ingestion is None or (resumable and self.checkpoint.is_done(ingest_id))
+        if archived and ingested:
+            return 'skipped', 0
+
+        pages = None
+        if resumable:
+            pages = self.archive.read_unit(endpoint, meet, month, unit=month)
+        status = 'replayed' if pages is not None else 'fetched'
+
+        if pages is None:
+            params = {'meet': meet}
+            if MONTH_PARAMS[endpoint]:
+                params[MONTH_PARAMS[endpoint]] = month
+            pages = list(self.api_service.iter_pages(endpoint, params))
+            if not pages:
+                return 'failed', 0
+
+            # 페이지 일부가 실패하면 iter_pages가 건너뛰므로 건수로 완전성 확인
+            received = sum(len(page.get('items', [])) for page in pages)
+            complete = received >= int(pages[0].get('totalCount') or 0)
+            self.archive.append(endpoint, meet, month, unit=month, params=params,
+                                pages=pages, complete=complete)
+            if not complete:
+                self.stderr.write(f"{task_id}: 일부 페이지 누락 ({received}/{pages[0].get('totalCount')})")
+                return 'failed', received
+
+        items = [item for page in pages for item in page.get('items', [])]
+
+        if not ingested:
+            try:
+                getattr(self.ingestion, INGEST_METHODS[endpoint])(self.in_range(items), meet=meet)
+            finally:
+                # 작업 스레드별 DB 연결 정리
+                connections.close_all()
+            # 기간이 달의 일부만 덮으면 나머지 날짜가 적재되지 않았으므로 완료로 기록하지 않음
+            if settled and (not MONTH_PARAMS[endpoint] or self.covers_month(month)):
+                self.checkpoint.mark_done(ingest_id)
+
+        if settled:
+            self.checkpoint.mark_done(task_id)
+        return status, len(items)
+
+    def covers_month(self, month: str) -> bool:
+        """요청 기간이 그 달 전체를 포함하는지"""
+        return self.start <= f"{month}01" and self.end >= f"{month}31"
+
+    def in_range(self, items):
+        """요청 기간 밖의 경주일 item 제외 (경주일이 없는 item은 유지)"""
+        for item in items:
+            rc_date = str(item.get('rcDate') or '').replace('-', '')[:8]
+            if not rc_date or self.start <= rc_date <= self.end:
+                yield item
+
+    @staticmethod
+    def parse_date(value: str, end: bool) -> str:
+        """YYYYMMDD 또는 YYYYMM을 YYYYMMDD로 (월만 주면 시작일은 1일, 종료일은 말일)"""
+        try:
+            if len(value) == 6:
+                datetime.strptime(value, '%Y%m')
+                return value + ('31' if end else '01')
+            return datetime.strptime(value, '%Y%m%d').strftime('%Y%m%d')
+        except ValueError:
+            raise CommandError(f'날짜 형식이 올바르지 않습니다: {value}')
+
+    @staticmethod
+    def month_range(start_month: str, end_month: str):
+        """YYYYMM 범위의 월 목록"""
+        year, month = int(start_month[:4]), int(start_month[4:])
+        months = []
+        while f"{year:04d}{month:02d}" <= end_month:
+            months.append(f"{year:04d}{month:02d}")
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return months
@@ -0,0 +1,124 @@
+"""
+한국마사회 API 응답 형식(xml/json) 디코딩 벤치마크 명령어
+
+엔드포인트마다 두 형식의 응답을 한 번씩 받아 디코딩 시간을 비교하고,
+더 빠른 형식을 공유 캐시에 저장해 이후 요청에 사용한다.
+"""
+
+import time
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand
+
+from apps.racing.services import KRAAPIService
+from apps.racing.services.decoders import (
+    FORMATS, DecodeError, KRAAPIError, decode_response, get_preferred_format, set_preferred_format
+)
+
+
+class Command(BaseCommand):
+    help = '한국마사회 API 응답 형식별 디코딩 속도 비교 및 엔드포인트별 형식 선택'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--meet',
+            type=int,
+            default=1,
+            help='경마장 (1:서울, 2:제주, 3:부경)'
+        )
+        parser.add_argument(
+            '--date',
+            type=str,
+            help='경주일자 (YYYYMMDD, 기본값: 지난 일요일)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='형식별 디코딩 반복 횟수'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='결과만 출력하고 선택한 형식은 저장하지 않음'
+        )
+
+    def handle(self, *args, **options):
+        api_service = KRAAPIService()
+        meet = options['meet']
+        date = options['date'] or self.last_sunday()
+        repeat = max(1, options['repeat'])
+        
+        self.stdout.write(self.style.SUCCESS(f'🏁 응답 디코딩 벤치마크 시작 (경마장 {meet}, {date}, {repeat}회 반복)'))
+        
+        for name, endpoint in api_service.ENDPOINTS.items():
+            self.stdout.write(f"\n📊 {name} ({endpoint})")
+            params = self.sample_params(name, meet, date)
+            
+            timings = {}
+            for fmt in FORMATS:
+                content = self.fetch_raw(api_service, endpoint, params, fmt)
+                if content is None:
+                    self.stdout.write(self.style.ERROR(f"  {fmt}: 응답 조회 실패"))
+                    continue
+                
+                try:
+                    elapsed, rows = self.measure(content, repeat, api_service.session.CHUNK_SIZE)
+                except (DecodeError, KRAAPIError) as e:
+                    self.stdout.write(self.style.ERROR(f"  {fmt}: 디코딩 실패 ({e})"))
+                    continue
+                
+                timings[fmt] = elapsed
+                self.stdout.write(
+                    f"  {fmt}: {rows}건, {len(content) / 1024:.1f}KB, 1회 평균 {elapsed * 1000:.2f}ms"
+                )
+            
+            if len(timings) < len(FORMATS):
+                self.stdout.write(f"  ⚠️ 비교 불가, 현재 형식 유지: {get_preferred_format(endpoint)}")
+                continue
+            
+            best = min(timings, key=timings.get)
+            self.stdout.write(self.style.SUCCESS(f"  ✅ 선택: {best}"))
+            if not options['dry_run']:
+                set_preferred_format(endpoint, best)
+
+    def sample_params(self, name, meet, date):
+        """엔드포인트별 벤치마크용 파라미터"""
+        if name == 'horse_info':
+            return {'meet': meet}
+        if name in ('race_results', 'race_records'):
+            return {'meet': meet, 'race_date': date}
+        return {'meet': meet, 'rc_date': date}
+
+    def fetch_raw(self, api_service, endpoint, params, fmt):
+        """지정 형식으로 응답 원문 조회 (1페이지)"""
+        request_params = {
+            'ServiceKey': api_service.API_KEY,
+            'pageNo': 1,
+            'numOfRows': api_service.NUM_OF_ROWS,
+            '_type': fmt,
+            **params
+        }
+        try:
+            response = api_service.session.get(f"{api_service.BASE_URL}{endpoint}", params=request_params)
+            response.raise_for_status()
+            return response.content
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"  {fmt}: {str(e)}"))
+            return None
+
+    def measure(self, content, repeat, chunk_size):
+        """디코딩 평균 시간(초)과 행 수 측정"""
+        chunks = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+        
+        rows = 0
+        started = time.perf_counter()
+        for _ in range(repeat):
+            data = decode_response(chunks)
+            rows = len(data['items']) if data else 0
+        return (time.perf_counter() - started) / repeat, rows
+
+    def last_sunday(self):
+        today = datetime.now()
+        days_since_sunday = (today.weekday() - 6) % 7 or 7
+        return (today - timedelta(days=days_since_sunday)).strftime('%Y%m%d')
@@ -0,0 +1,135 @@
+"""
+예측 모델 일괄 점수 계산 벤치마크 명령어
+
+경주별 predict() 반복과 여러 경주를 한 행렬로 묶은 일괄 계산의 처리량을 비교하고
+두 방식의 결과가 같은지 확인한다.
+"""
+
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.racing.services.batch_scoring import BatchScorer
+from apps.racing.services.prediction_models import AIPredictionModel, UserParameterModel
+from apps.racing.services.runners import to_runners
+
+
+class Command(BaseCommand):
+    help = '예측 모델 경주별 계산과 일괄(행렬) 계산의 처리량 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--races',
+            type=int,
+            default=5000,
+            help='경주 수'
+        )
+        parser.add_argument(
+            '--runners',
+            type=int,
+            default=12,
+            help='경주당 출전마 수 (합성 데이터)'
+        )
+        parser.add_argument(
+            '--db',
+            action='store_true',
+            help='합성 데이터 대신 로컬 저장소의 최근 경주 성적 사용'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='합성 데이터 난수 시드'
+        )
+
+    def handle(self, *args, **options):
+        if options['db']:
+            races = self.load_races(options['races'])
+        else:
+            races = self.synthetic_races(options['races'], options['runners'], options['seed'])
+        if not races:
+            self.stdout.write(self.style.ERROR('경주 데이터가 없습니다'))
+            return
+
+        runner_races = [to_runners(race) for race in races]
+        count = sum(len(race) for race in races)
+        self.stdout.write(self.style.SUCCESS(f'🏁 일괄 점수 계산 벤치마크 ({len(races)}경주, {count}두)'))
+
+        ai_model, user_model = AIPredictionModel(), UserParameterModel()
+        scorer = BatchScorer(ai_model, user_model)
+
+        started = time.perf_counter()
+        per_race = [
+            (ai_model.predict({'runners': race}), user_model.predict({'runners': race}))
+            for race in runner_races
+        ]
+        self.report('경주별 predict()', len(races), time.perf_counter() - started)
+
+        started = time.perf_counter()
+        batched = scorer.predict_many(runner_races)
+        self.report('일괄 predict_many()', len(races), time.perf_counter() - started)
+
+        started = time.perf_counter()
+        scorer.score_many(runner_races, 'ai')
+        scorer.score_many(runner_races, 'user')
+        self.report('일괄 score_many() (점수/순위만)', len(races), time.perf_counter() - started)
+
+        if json.dumps(per_race, default=str) == json.dumps(batched, default=str):
+            self.stdout.write(self.style.SUCCESS('✅ 경주별/일괄 결과 동일'))
+        else:
+            self.stdout.write(self.style.ERROR('❌ 경주별/일괄 결과 불일치'))
+
+    def report(self, label: str, races: int, elapsed: float):
+        self.stdout.write(
+            f"  {label}: {elapsed * 1000:.1f}ms, 초당 {races / max(elapsed, 1e-9):,.0f}경주"
+        )
+
+    def load_races(self, limit: int):
+        """로컬 저장소의 최근 경주 성적 원본 (경주별 출전마 목록)"""
+        from apps.racing.models import Result
+
+        races, keys = {}, []
+        rows = Result.objects.order_by('-rc_date', 'meet', 'rc_no', 'chul_no').values_list(
+            'meet', 'rc_date', 'rc_no', 'raw'
+        )
+        for meet, rc_date, rc_no, raw in rows.iterator(chunk_size=5000):
+            key = (meet, rc_date, rc_no)
+            if key not in races:
+                if len(keys) >= limit:
+                    break
+                keys.append(key)
+                races[key] = []
+            races[key].append(raw)
+        return [races[key] for key in keys]
+
+    @staticmethod
+    def synthetic_races(count: int, runners: int, seed: int):
+        """출전표/성적 형식이 섞인 합성 경주"""
+        rng = random.Random(seed)
+        names = ['김기수', '이기수', '박기수', '최조교', '정조교', '문세영', '유현명']
+        races = []
+        for _ in range(count):
+            entry = rng.random() < 0.5
+            race = []
+            for chul_no in range(1, runners + 1):
+                item = {
+                    'hrNo': str(rng.randint(10000, 99999)),
+                    'hrName': f'말{chul_no}',
+                    'chulNo': str(chul_no),
+                    'jkName': rng.choice(names),
+                    'trName': rng.choice(names),
+                    'wgHr': f"{rng.randint(420, 560)}({rng.randint(-9, 9):+d})",
+                }
+                if entry:
+                    item['hrAge'] = str(rng.randint(2, 9))
+                    item['hrSex'] = rng.choice(['M', 'F', 'G'])
+                else:
+                    starts = rng.randint(0, 30)
+                    item['win1'] = str(rng.randint(0, starts))
+                    item['totCnt1'] = str(starts)
+                    item['winOdds'] = f"{rng.uniform(1.1, 80):.1f}"
+                race.append(item)
+            races.append(race)
+        return races
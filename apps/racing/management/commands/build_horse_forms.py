@@ -0,0 +1,43 @@
+"""
+경주마 최근 성적 특성 집계 명령어
+
+로컬 저장소의 경주 성적 중 아직 반영하지 않은 경주를 경주마별 최근 성적에 누적한다.
+성적 적재(ingest_kra, backfill_kra --ingest) 시 자동으로 반영되므로, 기존에 적재된
+성적을 처음 반영하거나 반영에 실패한 경주를 다시 반영할 때 사용한다.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.racing.services.feature_store import get_horse_form_store
+
+
+class Command(BaseCommand):
+    help = '경주 성적으로 경주마별 최근 성적 특성(최근 착순, 승률, 거리/경마장별 성적) 누적'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='누적 값과 경주일 시점 스냅샷을 지우고 전체 성적으로 다시 계산 (과거 성적을 나중에 적재한 경우)'
+        )
+        parser.add_argument(
+            '--horse',
+            type=str,
+            action='append',
+            help='반영 후 특성을 출력할 마번 (여러 번 지정 가능)'
+        )
+
+    def handle(self, *args, **options):
+        store = get_horse_form_store()
+        if options['rebuild']:
+            self.stdout.write('🔄 경주마 최근 성적 전체 재계산')
+            applied = store.rebuild()
+        else:
+            applied = store.apply_pending()
+        self.stdout.write(self.style.SUCCESS(f'✅ 경주마 최근 성적 반영 완료: 경주 {applied}개'))
+
+        for hr_no, form in store.get_many(options['horse'] or []).items():
+            self.stdout.write(
+                f"  {hr_no}: {form['starts']}전 {form['wins']}승, 최근 착순 {form['recent_ords']}, "
+                f"최근 출전 {form['days_since_last']}일 전, 거리별 {form['distance_stats']}"
+            )
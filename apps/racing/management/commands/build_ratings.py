@@ -0,0 +1,41 @@
+"""
+기수/조교사 레이팅 집계 명령어
+
+로컬 저장소의 경주 성적 중 아직 레이팅에 반영하지 않은 경주를 누적한다.
+성적 적재(ingest_kra, backfill_kra --ingest) 시 자동으로 반영되므로, 기존에 적재된
+성적을 처음 반영하거나 반영에 실패한 경주를 다시 반영할 때 사용한다.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.racing.services.ratings import get_rating_table
+
+
+class Command(BaseCommand):
+    help = '경주 성적으로 기수/조교사 레이팅(출전/1착/3착 이내 수) 누적'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='누적 값을 지우고 전체 성적으로 다시 계산'
+        )
+
+    def handle(self, *args, **options):
+        table = get_rating_table()
+        if options['rebuild']:
+            self.stdout.write('🔄 레이팅 전체 재계산')
+            applied = table.rebuild()
+        else:
+            applied = table.apply_pending()
+        self.stdout.write(self.style.SUCCESS(f'✅ 레이팅 반영 완료: 경주 {applied}개'))
+
+        from apps.racing.models import Jockey, Trainer
+        for kind, label, model, ref_field in (('jockey', '기수', Jockey, 'jk_no'),
+                                              ('trainer', '조교사', Trainer, 'tr_no')):
+            for person in model.objects.filter(starts__gt=0).order_by('-wins', '-starts')[:5]:
+                strength = table.strength(kind, getattr(person, ref_field))
+                self.stdout.write(
+                    f"  {label} {person.name}: {person.starts}전 {person.wins}승 {person.places}입상 "
+                    f"(지표 {strength:.3f})"
+                )
@@ -0,0 +1,114 @@
+"""
+로컬 저장소의 과거 경마 데이터를 Arrow/Parquet 파티션으로 내보내는 명령어
+
+데이터셋 x 경마장 x 월 단위로 파일을 만든다. 이미 내보낸 지난 달 파티션은 건너뛰고
+(--force로 다시 생성), 이번 달은 데이터가 계속 바뀌므로 항상 다시 만든다.
+로컬 저장소가 비어 있으면 먼저 backfill_kra --ingest 또는 ingest_kra로 적재한다.
+"""
+
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.racing.services import KRAAPIService
+from apps.racing.services.columnar import DATASETS, FORMATS, ColumnarStore
+
+
+class Command(BaseCommand):
+    help = '로컬 저장소의 과거 데이터를 경마장/월 단위 Arrow/Parquet 파일로 내보내기'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start',
+            type=str,
+            required=True,
+            help='시작 월 (YYYYMM)'
+        )
+        parser.add_argument(
+            '--end',
+            type=str,
+            help='종료 월 (YYYYMM, 기본: 이번 달)'
+        )
+        parser.add_argument(
+            '--meet',
+            type=int,
+            action='append',
+            choices=list(KRAAPIService.TRACKS.keys()),
+            help='경마장 (여러 번 지정 가능, 기본: 전체)'
+        )
+        parser.add_argument(
+            '--dataset',
+            action='append',
+            choices=list(DATASETS.keys()),
+            help='데이터셋 (여러 번 지정 가능, 기본: 전체)'
+        )
+        parser.add_argument(
+            '--format',
+            action='append',
+            choices=list(FORMATS),
+            help='파일 형식 (여러 번 지정 가능, 기본: arrow)'
+        )
+        parser.add_argument(
+            '--dir',
+            type=str,
+            help='내보낼 경로 (기본: settings.KRA_EXPORT_DIR)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='이미 내보낸 지난 달 파티션도 다시 생성'
+        )
+
+    def handle(self, *args, **options):
+        current_month = datetime.now().strftime('%Y%m')
+        start = options['start'][:6]
+        end = (options['end'] or current_month)[:6]
+        if not (start.isdigit() and end.isdigit() and len(start) == len(end) == 6):
+            raise CommandError('월은 YYYYMM 형식으로 입력하세요')
+        if start > end:
+            raise CommandError('시작 월이 종료 월보다 늦습니다')
+
+        try:
+            store = ColumnarStore(root=options['dir'])
+        except ImportError as e:
+            raise CommandError(str(e))
+
+        meets = options['meet'] or list(KRAAPIService.TRACKS.keys())
+        datasets = options['dataset'] or list(DATASETS.keys())
+        formats = options['format'] or ['arrow']
+        months = self.month_range(start, end)
+
+        self.stdout.write(
+            f"내보내기: {start}~{end}, 경마장 {meets}, 데이터셋 {datasets}, 형식 {formats}, 경로 {store.root}"
+        )
+
+        summary = {'exported': 0, 'skipped': 0, 'empty': 0, 'rows': 0}
+        for dataset in datasets:
+            for meet in meets:
+                for month in months:
+                    settled = month < current_month
+                    if settled and not options['force'] and all(
+                        store.has_partition(dataset, meet, month, fmt) for fmt in formats
+                    ):
+                        summary['skipped'] += 1
+                        continue
+
+                    rows = store.export(dataset, meet, month, formats)
+                    summary['rows'] += rows
+                    if rows:
+                        summary['exported'] += 1
+                        self.stdout.write(f"{dataset} {KRAAPIService.TRACKS[meet]} {month}: {rows}행")
+                    else:
+                        summary['empty'] += 1
+
+        self.stdout.write(self.style.SUCCESS(f"내보내기 완료: {summary}"))
+
+    @staticmethod
+    def month_range(start: str, end: str):
+        """YYYYMM 범위의 월 목록"""
+        months = []
+        year, month = int(start[:4]), int(start[4:6])
+        while f"{year:04d}{month:02d}" <= end:
+            months.append(f"{year:04d}{month:02d}")
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return months
@@ -0,0 +1,65 @@
+"""
+KRA API 데이터를 로컬 DB로 적재하는 명령어
+"""
+
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.racing.services import KRAAPIService
+from apps.racing.services.ingestion import KRAIngestionService
+
+
+class Command(BaseCommand):
+    help = '경주계획/출전표/성적/기록을 로컬 DB로 적재 (bulk upsert)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--meet',
+            type=int,
+            action='append',
+            choices=list(KRAAPIService.TRACKS.keys()),
+            help='경마장 (1:서울, 2:제주, 3:부경, 여러 번 지정 가능, 기본: 전체)'
+        )
+        parser.add_argument(
+            '--date',
+            type=str,
+            help='경주일자 (YYYYMMDD, 기본: 어제)'
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=1,
+            help='--date부터 거슬러 올라가며 적재할 일수'
+        )
+        parser.add_argument(
+            '--horses',
+            action='store_true',
+            help='경주마 상세정보도 적재'
+        )
+
+    def handle(self, *args, **options):
+        meets = options['meet'] or list(KRAAPIService.TRACKS.keys())
+        try:
+            end = datetime.strptime(options['date'], '%Y%m%d') if options['date'] else datetime.now() - timedelta(days=1)
+        except ValueError:
+            raise CommandError('날짜 형식이 올바르지 않습니다 (YYYYMMDD)')
+
+        today = datetime.now().strftime('%Y%m%d')
+        service = KRAIngestionService()
+
+        for offset in range(options['days']):
+            rc_date = (end - timedelta(days=offset)).strftime('%Y%m%d')
+            # 경마는 금/토/일만 개최
+            if datetime.strptime(rc_date, '%Y%m%d').weekday() not in (4, 5, 6):
+                continue
+            for meet in meets:
+                counts = service.ingest_day(meet, rc_date, results=rc_date < today)
+                self.stdout.write(f"{KRAAPIService.TRACKS[meet]} {rc_date}: {counts}")
+
+        if options['horses']:
+            for meet in meets:
+                count = service.ingest_horses(meet)
+                self.stdout.write(f"{KRAAPIService.TRACKS[meet]} 경주마: {count}건")
+
+        self.stdout.write(self.style.SUCCESS('적재 완료'))
@@ -0,0 +1,54 @@
+"""
+모델 보관소 버전 조회/교체 명령어
+
+게시된 버전과 메타데이터(정확도, 학습 범위)를 보여 주고, --activate로 사용 중인 버전을
+바꾼다 (이전 버전으로 되돌리기 포함). 실행 중인 워커는 재시작 없이 다음 확인 주기에 새 버전을 읽는다.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.racing.services.model_registry import get_model_registry
+from apps.racing.services.prediction_models import AIPredictionModel
+
+
+class Command(BaseCommand):
+    help = '모델 보관소의 게시된 버전 조회 및 사용 중인 버전 교체'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--name',
+            type=str,
+            default=AIPredictionModel.REGISTRY_NAME,
+            help='모델 이름'
+        )
+        parser.add_argument(
+            '--activate',
+            type=str,
+            help='사용할 버전'
+        )
+
+    def handle(self, *args, **options):
+        registry = get_model_registry()
+        name = options['name']
+
+        if options['activate']:
+            try:
+                registry.activate(name, options['activate'])
+            except ValueError as e:
+                raise CommandError(str(e))
+            self.stdout.write(self.style.SUCCESS(f"✅ {name} 사용 버전 교체: {options['activate']}"))
+
+        versions = registry.versions(name)
+        if not versions:
+            self.stdout.write(f"{name}: 게시된 버전이 없습니다 ({registry.root})")
+            return
+
+        current = registry.current_version(name)
+        self.stdout.write(f"📦 {name} ({registry.root})")
+        for version in versions:
+            metadata = registry.metadata(name, version)
+            marker = '*' if version == current else ' '
+            self.stdout.write(
+                f"  {marker} {version}  정확도 {metadata.get('accuracy', 0):.3f}  "
+                f"{metadata.get('estimator', '')}  학습 {metadata.get('train_races', '-')}경주"
+            )
@@ -0,0 +1,68 @@
+"""
+경주일 출전표 변경 감지 명령어
+
+출전표를 주기적으로 조회해 바뀐 경주만 다시 예측하고 변경 내역을 기록한다.
+"""
+
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+
+from apps.racing.services import KRAAPIService
+from apps.racing.services.budget import Priority
+from apps.racing.services.change_feed import EntryChangeFeed
+
+
+class Command(BaseCommand):
+    help = '출전표 변경(출전 취소, 기수/중량 변경)을 감지해 바뀐 경주만 재예측'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--meet',
+            type=int,
+            action='append',
+            choices=list(KRAAPIService.TRACKS.keys()),
+            help='경마장 (여러 번 지정 가능, 기본: 전체)'
+        )
+        parser.add_argument(
+            '--date',
+            type=str,
+            help='경주일자 (YYYYMMDD, 기본: 오늘)'
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='조회 주기(초), 0이면 한 번만 조회'
+        )
+        parser.add_argument(
+            '--until',
+            type=str,
+            help='반복 종료 시각 (HH:MM, 기본: 자정까지)'
+        )
+
+    def handle(self, *args, **options):
+        feed = EntryChangeFeed(KRAAPIService(priority=Priority.PREFETCH))
+        meets = options['meet'] or list(KRAAPIService.TRACKS.keys())
+        until = options['until'] or '23:59'
+
+        while True:
+            date = options['date'] or datetime.now().strftime('%Y%m%d')
+            for meet in meets:
+                result = feed.poll(meet, date)
+                for event in result['events']:
+                    self.stdout.write(
+                        f"[{event['type']}] {KRAAPIService.TRACKS[meet]} {event['rc_no']}R "
+                        f"#{event['chul_no']} {event['hr_name']}: {event['before']} -> {event['after']}"
+                    )
+                self.stdout.write(
+                    f"{KRAAPIService.TRACKS[meet]} {date}: 재예측 {len(result['changed_races'])}경주 "
+                    f"{result['changed_races']}, 변경 없음 {result['unchanged_races']}경주"
+                )
+
+            if not options['interval'] or datetime.now().strftime('%H:%M') >= until:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS('출전표 변경 감지 종료'))
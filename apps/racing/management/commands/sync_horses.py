@@ -0,0 +1,41 @@
+"""
+경주마 등록부 델타 동기화 명령어 (cron 등으로 주기 실행)
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.racing.services import KRAAPIService
+from apps.racing.services.budget import Priority
+from apps.racing.services.horse_registry import get_horse_registry
+
+
+class Command(BaseCommand):
+    help = '경주마 상세정보를 로컬 등록부로 동기화 (바뀐 말만 갱신)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--meet',
+            type=int,
+            action='append',
+            choices=list(KRAAPIService.TRACKS.keys()),
+            help='경마장 (여러 번 지정 가능, 기본: 전체)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='upsert 배치 크기'
+        )
+
+    def handle(self, *args, **options):
+        api_service = KRAAPIService(priority=Priority.PREFETCH)
+        registry = get_horse_registry()
+
+        for meet in options['meet'] or list(KRAAPIService.TRACKS.keys()):
+            counts = registry.sync(api_service, meet, batch_size=options['batch_size'])
+            self.stdout.write(
+                f"{KRAAPIService.TRACKS[meet]}: 수신 {counts['received']}/{counts['total']}, "
+                f"변경 {counts['changed']}, 동일 {counts['unchanged']}"
+            )
+
+        self.stdout.write(self.style.SUCCESS('경주마 등록부 동기화 완료'))
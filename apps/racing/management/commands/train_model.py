@@ -0,0 +1,243 @@
+"""
+AI 예측 모델 학습/게시 명령어
+
+로컬 저장소의 경주 성적으로 출전마별 1착 여부 분류기를 학습하고 모델 보관소에 새 버전으로
+게시한다. 최근 경주 일부를 검증용으로 떼어 두고, 경주별 예측 1위가 실제 1착인 비율을
+정확도로 메타데이터에 기록한다.
+
+학습 행은 예측 시(출전표)와 같은 특성으로 만든다.
+- 성적 행을 출전표 형태(연령/성별, 승수/배당 없음)로 바꿔 AIPredictionModel의 출전표 특성을 계산
+- 경주마 최근 성적과 기수/조교사 레이팅은 경주일 전 성적만으로 (FormReplay/RatingReplay,
+  저장소의 누적 값은 이후 경주와 검증 기간 결과까지 포함하므로 쓰지 않음)
+- 출전표에 없는 배당 점수(odds_rating)는 특성에서 뺌
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from itertools import groupby
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.racing.services import KRAAPIService
+from apps.racing.services.batch_scoring import column_matrix
+from apps.racing.services.feature_store import FormReplay
+from apps.racing.services.model_registry import get_model_registry
+from apps.racing.services.prediction_models import AIPredictionModel
+from apps.racing.services.ratings import RatingReplay
+from apps.racing.services.runners import to_runners
+
+
+# 출전표에 없어 예측 시 상수(50)인 특성
+ENTRY_MISSING_FEATURES = ('odds_rating',)
+
+
+class Command(BaseCommand):
+    help = '경주 성적으로 AI 예측 모델을 학습해 모델 보관소에 게시'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start',
+            type=str,
+            help='학습 시작일 (YYYYMMDD, 기본: 전체)'
+        )
+        parser.add_argument(
+            '--end',
+            type=str,
+            help='학습 종료일 (YYYYMMDD, 기본: 전체)'
+        )
+        parser.add_argument(
+            '--meet',
+            type=int,
+            action='append',
+            choices=list(KRAAPIService.TRACKS.keys()),
+            help='경마장 (여러 번 지정 가능, 기본: 전체)'
+        )
+        parser.add_argument(
+            '--holdout',
+            type=float,
+            default=0.2,
+            help='검증용으로 떼어 둘 최근 경주 비율'
+        )
+        parser.add_argument(
+            '--min-races',
+            type=int,
+            default=100,
+            help='학습에 필요한 최소 경주 수'
+        )
+        parser.add_argument(
+            '--no-activate',
+            action='store_true',
+            help='게시만 하고 사용 중인 버전은 바꾸지 않음 (model_versions --activate로 교체)'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            from sklearn.linear_model import LogisticRegression
+            from sklearn.pipeline import make_pipeline
+            from sklearn.preprocessing import StandardScaler
+        except ImportError:
+            raise CommandError('scikit-learn 패키지가 설치되어 있지 않습니다 (pip install scikit-learn)')
+
+        races = self.load_races(options['start'], options['end'], options['meet'])
+        selected = [race for race in races if race[3]]
+        if len(selected) < options['min_races']:
+            raise CommandError(f"학습할 경주가 부족합니다: {len(selected)}경주 (최소 {options['min_races']})")
+
+        features = [name for name in AIPredictionModel.SCORE_WEIGHTS if name not in ENTRY_MISSING_FEATURES]
+        features.append('recent_races')
+        matrices = self.build_matrices(races, features)
+
+        split = int(len(selected) * (1 - options['holdout']))
+        train, test = selected[:split], selected[split:]
+        self.stdout.write(self.style.SUCCESS(
+            f'🧠 AI 예측 모델 학습 (학습 {len(train)}경주, 검증 {len(test)}경주)'
+        ))
+
+        x_train, y_train, _ = self.stack(train, matrices)
+        x_test, y_test, offsets = self.stack(test, matrices)
+
+        estimator = make_pipeline(StandardScaler(), LogisticRegression(max_iter=1000))
+        estimator.fit(x_train, y_train)
+
+        accuracy = self.top1_accuracy(estimator.predict_proba(x_test)[:, 1], y_test, offsets)
+        keys, weights = AIPredictionModel().score_weights()
+        baseline = self.top1_accuracy(
+            column_matrix(dict(zip(features, x_test.T)), keys, len(x_test)) @ np.asarray(weights),
+            y_test, offsets,
+        )
+        self.stdout.write(f"  검증 1위 적중률: 학습 모델 {accuracy:.3f}, 기존 가중합 {baseline:.3f}")
+
+        registry = get_model_registry()
+        try:
+            version = registry.publish(
+                AIPredictionModel.REGISTRY_NAME,
+                estimator,
+                {
+                    'features': features,
+                    'feature_source': 'entry_as_of_race_date',
+                    'accuracy': round(accuracy, 4),
+                    'accuracy_metric': 'holdout_top1_hit_rate',
+                    'baseline_accuracy': round(baseline, 4),
+                    'train_races': len(train),
+                    'test_races': len(test),
+                    'train_range': [str(train[0][0][1]), str(train[-1][0][1])],
+                    'test_range': [str(test[0][0][1]), str(test[-1][0][1])],
+                },
+                activate=not options['no_activate'],
+            )
+        except ImportError as e:
+            raise CommandError(str(e))
+
+        status = '게시 (사용 중인 버전 유지)' if options['no_activate'] else '게시 및 사용 중인 버전 교체'
+        self.stdout.write(self.style.SUCCESS(f"✅ 모델 {version} {status}: {registry.root}"))
+
+    def load_races(self, start: str, end: str, meets):
+        """
+        경주 성적을 경주일 순 [(경주 키, [출전마 행, ...], [착순, ...], 학습 대상 여부)] 로 읽기
+
+        경주마 최근 성적과 레이팅을 쌓기 위해 종료일까지의 전체 경주를 읽고, 시작일/경마장
+        조건에 맞는 경주만 학습 대상으로 표시한다. 출전마 행은 (raw item, 마번, 기수번호, 조교사번호).
+        """
+        from apps.racing.models import Result
+
+        start = datetime.strptime(start, '%Y%m%d').date() if start else None
+        rows = Result.objects.all()
+        if end:
+            rows = rows.filter(rc_date__lte=datetime.strptime(end, '%Y%m%d').date())
+
+        races = defaultdict(lambda: ([], []))
+        rows = rows.order_by('rc_date', 'meet', 'rc_no', 'chul_no').values_list(
+            'meet', 'rc_date', 'rc_no', 'raw', 'ord', 'horse_id', 'jockey_id', 'trainer_id'
+        )
+        for meet, rc_date, rc_no, raw, ord_, hr_no, jk_no, tr_no in rows.iterator(chunk_size=5000):
+            runners, ords = races[(meet, rc_date, rc_no)]
+            runners.append((raw or {}, hr_no, jk_no, tr_no))
+            ords.append(ord_)
+
+        # 1착이 있는 완료 경주만 사용
+        return [
+            (key, runners, ords, (start is None or key[1] >= start) and (not meets or key[0] in meets))
+            for key, (runners, ords) in races.items() if 1 in ords
+        ]
+
+    def build_matrices(self, races, features):
+        """
+        학습 대상 경주별 (출전마 x 특성) 행렬 {경주 키: 행렬}
+
+        경주일마다 그 날짜 전 성적으로 출전표 특성을 계산한 뒤 그 날짜의 성적을 더한다.
+        """
+        from apps.racing.models import Horse
+
+        horses = {hr_no: (sex, birthday) for hr_no, sex, birthday in Horse.objects.values_list('hr_no', 'sex', 'birthday')}
+        forms, ratings = FormReplay(), RatingReplay()
+        model = AIPredictionModel(ratings=ratings)
+
+        matrices = {}
+        for rc_date, day in groupby(races, key=lambda race: race[0][1]):
+            day = list(day)
+            selected = [race for race in day if race[3]]
+            if selected:
+                runners = to_runners(
+                    self.entry_item(row, rc_date, horses.get(row[1]))
+                    for _, race_runners, _, _ in selected for row in race_runners
+                )
+                for runner in runners:
+                    runner.form = forms.features(runner.hr_no, rc_date)
+                matrix = column_matrix(model.feature_columns(runners), features, len(runners))
+                offset = 0
+                for key, race_runners, _, _ in selected:
+                    matrices[key] = matrix[offset:offset + len(race_runners)]
+                    offset += len(race_runners)
+
+            forms.add(
+                (hr_no, rc_date, meet, rc_no, ord_, self._int(raw.get('rcDist')))
+                for (meet, _, rc_no), race_runners, ords, _ in day
+                for (raw, hr_no, _, _), ord_ in zip(race_runners, ords) if hr_no and ord_
+            )
+            ratings.add(
+                (kind, ref_no, raw.get(name_field), ord_)
+                for _, race_runners, ords, _ in day
+                for (raw, _, jk_no, tr_no), ord_ in zip(race_runners, ords)
+                for kind, ref_no, name_field in (('jockey', jk_no, 'jkName'), ('trainer', tr_no, 'trName'))
+            )
+        return matrices
+
+    @staticmethod
+    def entry_item(row, rc_date, horse) -> dict:
+        """출전마 행 -> 출전표 형태 item (경주일 기준 연령, 성별)"""
+        raw, hr_no, jk_no, tr_no = row
+        sex, birthday = horse or ('', None)
+        age = raw.get('age') or raw.get('hrAge')
+        if not age and birthday:
+            age = rc_date.year - birthday.year
+        item = {key: value for key, value in raw.items() if key not in ('win1', 'totCnt1', 'winOdds')}
+        item['hrAge'] = age or ''
+        item['hrSex'] = raw.get('hrSex') or raw.get('sex') or sex or 'M'
+        item['rcDate'] = rc_date.strftime('%Y%m%d')
+        item['hrNo'] = hr_no or raw.get('hrNo', '')
+        item['jkNo'] = jk_no or raw.get('jkNo', '')
+        item['trNo'] = tr_no or raw.get('trNo', '')
+        return item
+
+    @staticmethod
+    def _int(value):
+        try:
+            return int(str(value).strip())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def stack(races, matrices):
+        """(출전마 x 특성) 행렬, 1착 여부, 경주별 시작 위치"""
+        matrix = np.vstack([matrices[key] for key, _, _, _ in races])
+        target = np.array([ord_ == 1 for _, _, ords, _ in races for ord_ in ords], dtype=int)
+        offsets = np.cumsum([0] + [len(runners) for _, runners, _, _ in races])
+        return matrix, target, offsets
+
+    @staticmethod
+    def top1_accuracy(scores, target, offsets) -> float:
+        """경주별 점수 1위가 실제 1착인 비율"""
+        hits = [target[start + int(np.argmax(scores[start:end]))]
+                for start, end in zip(offsets, offsets[1:]) if end > start]
+        return float(np.mean(hits)) if hits else 0.0
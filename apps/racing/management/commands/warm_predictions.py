@@ -0,0 +1,42 @@
+"""
+경주일 예측 캐시 예열 명령어
+
+하루치 경주의 기본 가중치 예측/베팅 추천을 미리 계산해 예측 캐시에 넣는다.
+출전표/모델 입력이 바뀌지 않은 경주는 저장된 결과를 그대로 두므로 여러 번 실행해도 된다.
+"""
+
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+
+from apps.racing.services import KRAAPIService
+from apps.racing.services.budget import Priority
+from apps.racing.services.prediction_cache import PredictionCache
+
+
+class Command(BaseCommand):
+    help = '하루치 경주의 기본 가중치 예측을 미리 계산해 예측 캐시에 저장'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--meet',
+            type=int,
+            action='append',
+            choices=list(KRAAPIService.TRACKS.keys()),
+            help='경마장 (여러 번 지정 가능, 기본: 전체)'
+        )
+        parser.add_argument(
+            '--date',
+            type=str,
+            help='경주일자 (YYYYMMDD, 기본: 오늘)'
+        )
+
+    def handle(self, *args, **options):
+        api_service = KRAAPIService(priority=Priority.PREFETCH)
+        cache = PredictionCache()
+        date = options['date'] or datetime.now().strftime('%Y%m%d')
+
+        for meet in options['meet'] or list(KRAAPIService.TRACKS.keys()):
+            warmed = cache.warm_day(api_service.race_cards, meet, date)
+            self.stdout.write(f"{KRAAPIService.TRACKS[meet]} {date}: {len(warmed)}경주 예측 저장")
+        self.stdout.write(self.style.SUCCESS('✅ 예측 캐시 예열 완료'))
@@ -0,0 +1,210 @@
+# Generated by Django 5.0.7 on 2026-10-17 07:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Record',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('meet', models.PositiveSmallIntegerField(verbose_name='경마장')),
+                ('rc_date', models.DateField(verbose_name='경주일자')),
+                ('rc_no', models.PositiveSmallIntegerField(verbose_name='경주번호')),
+                ('chul_no', models.PositiveSmallIntegerField(verbose_name='출전번호')),
+                ('hr_name', models.CharField(blank=True, max_length=50, verbose_name='마명')),
+                ('raw', models.JSONField(blank=True, default=dict, verbose_name='원본 데이터')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('ord', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='착순')),
+                ('rc_time', models.FloatField(blank=True, null=True, verbose_name='경주기록(초)')),
+                ('rc_dist', models.PositiveIntegerField(blank=True, null=True, verbose_name='경주거리')),
+            ],
+            options={
+                'verbose_name': '경주기록',
+                'verbose_name_plural': '경주기록',
+                'ordering': ['meet', 'rc_date', 'rc_no', 'chul_no'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Result',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('meet', models.PositiveSmallIntegerField(verbose_name='경마장')),
+                ('rc_date', models.DateField(verbose_name='경주일자')),
+                ('rc_no', models.PositiveSmallIntegerField(verbose_name='경주번호')),
+                ('chul_no', models.PositiveSmallIntegerField(verbose_name='출전번호')),
+                ('hr_name', models.CharField(blank=True, max_length=50, verbose_name='마명')),
+                ('raw', models.JSONField(blank=True, default=dict, verbose_name='원본 데이터')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('ord', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='착순')),
+                ('rc_time', models.FloatField(blank=True, null=True, verbose_name='경주기록(초)')),
+                ('wg_hr', models.CharField(blank=True, max_length=20, verbose_name='마체중')),
+                ('win_odds', models.FloatField(blank=True, null=True, verbose_name='단승식 배당')),
+                ('plc_odds', models.FloatField(blank=True, null=True, verbose_name='연승식 배당')),
+            ],
+            options={
+                'verbose_name': '경주성적',
+                'verbose_name_plural': '경주성적',
+                'ordering': ['meet', 'rc_date', 'rc_no', 'chul_no'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Trainer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tr_no', models.CharField(max_length=10, unique=True, verbose_name='조교사번호')),
+                ('name', models.CharField(blank=True, max_length=50, verbose_name='조교사명')),
+                ('meet', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='경마장')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '조교사',
+                'verbose_name_plural': '조교사',
+            },
+        ),
+        migrations.CreateModel(
+            name='Horse',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hr_no', models.CharField(max_length=10, unique=True, verbose_name='마번')),
+                ('hr_name', models.CharField(blank=True, max_length=50, verbose_name='마명')),
+                ('meet', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='경마장')),
+                ('sex', models.CharField(blank=True, max_length=10, verbose_name='성별')),
+                ('age', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='연령')),
+                ('birthday', models.DateField(blank=True, null=True, verbose_name='생년월일')),
+                ('rank', models.CharField(blank=True, max_length=20, verbose_name='등급')),
+                ('rating', models.IntegerField(blank=True, null=True, verbose_name='레이팅')),
+                ('raw', models.JSONField(blank=True, default=dict, verbose_name='원본 데이터')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '경주마',
+                'verbose_name_plural': '경주마',
+                'indexes': [models.Index(fields=['hr_name'], name='racing_hors_hr_name_fe082e_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Jockey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jk_no', models.CharField(max_length=10, unique=True, verbose_name='기수번호')),
+                ('name', models.CharField(blank=True, max_length=50, verbose_name='기수명')),
+                ('meet', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='경마장')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '기수',
+                'verbose_name_plural': '기수',
+                'indexes': [models.Index(fields=['name'], name='racing_jock_name_221402_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Entry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('meet', models.PositiveSmallIntegerField(verbose_name='경마장')),
+                ('rc_date', models.DateField(verbose_name='경주일자')),
+                ('rc_no', models.PositiveSmallIntegerField(verbose_name='경주번호')),
+                ('chul_no', models.PositiveSmallIntegerField(verbose_name='출전번호')),
+                ('hr_name', models.CharField(blank=True, max_length=50, verbose_name='마명')),
+                ('raw', models.JSONField(blank=True, default=dict, verbose_name='원본 데이터')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('wg_budam', models.FloatField(blank=True, null=True, verbose_name='부담중량')),
+                ('rating', models.IntegerField(blank=True, null=True, verbose_name='레이팅')),
+                ('horse', models.ForeignKey(blank=True, db_column='hr_no', db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='racing.horse', to_field='hr_no')),
+                ('jockey', models.ForeignKey(blank=True, db_column='jk_no', db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='racing.jockey', to_field='jk_no')),
+            ],
+            options={
+                'verbose_name': '출전표',
+                'verbose_name_plural': '출전표',
+                'ordering': ['meet', 'rc_date', 'rc_no', 'chul_no'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Race',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('meet', models.PositiveSmallIntegerField(verbose_name='경마장')),
+                ('rc_date', models.DateField(verbose_name='경주일자')),
+                ('rc_no', models.PositiveSmallIntegerField(verbose_name='경주번호')),
+                ('rc_name', models.CharField(blank=True, max_length=100, verbose_name='경주명')),
+                ('rc_dist', models.PositiveIntegerField(blank=True, null=True, verbose_name='경주거리')),
+                ('rank', models.CharField(blank=True, max_length=30, verbose_name='등급')),
+                ('start_time', models.CharField(blank=True, max_length=10, verbose_name='출발시각')),
+                ('raw', models.JSONField(blank=True, default=dict, verbose_name='원본 데이터')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '경주',
+                'verbose_name_plural': '경주',
+                'ordering': ['meet', 'rc_date', 'rc_no'],
+                'indexes': [models.Index(fields=['rc_date', 'meet'], name='racing_race_rc_date_51bead_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='race',
+            constraint=models.UniqueConstraint(fields=('meet', 'rc_date', 'rc_no'), name='racing_race_natural_key'),
+        ),
+        migrations.AddField(
+            model_name='record',
+            name='horse',
+            field=models.ForeignKey(blank=True, db_column='hr_no', db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='racing.horse', to_field='hr_no'),
+        ),
+        migrations.AddField(
+            model_name='record',
+            name='jockey',
+            field=models.ForeignKey(blank=True, db_column='jk_no', db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='racing.jockey', to_field='jk_no'),
+        ),
+        migrations.AddField(
+            model_name='result',
+            name='horse',
+            field=models.ForeignKey(blank=True, db_column='hr_no', db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='racing.horse', to_field='hr_no'),
+        ),
+        migrations.AddField(
+            model_name='result',
+            name='jockey',
+            field=models.ForeignKey(blank=True, db_column='jk_no', db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='racing.jockey', to_field='jk_no'),
+        ),
+        migrations.AddIndex(
+            model_name='trainer',
+            index=models.Index(fields=['name'], name='racing_trai_name_85378e_idx'),
+        ),
+        migrations.AddField(
+            model_name='result',
+            name='trainer',
+            field=models.ForeignKey(blank=True, db_column='tr_no', db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='racing.trainer', to_field='tr_no'),
+        ),
+        migrations.AddField(
+            model_name='record',
+            name='trainer',
+            field=models.ForeignKey(blank=True, db_column='tr_no', db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='racing.trainer', to_field='tr_no'),
+        ),
+        migrations.AddField(
+            model_name='entry',
+            name='trainer',
+            field=models.ForeignKey(blank=True, db_column='tr_no', db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='racing.trainer', to_field='tr_no'),
+        ),
+        migrations.AddConstraint(
+            model_name='result',
+            constraint=models.UniqueConstraint(fields=('meet', 'rc_date', 'rc_no', 'chul_no'), name='racing_result_natural_key'),
+        ),
+        migrations.AddConstraint(
+            model_name='record',
+            constraint=models.UniqueConstraint(fields=('meet', 'rc_date', 'rc_no', 'chul_no'), name='racing_record_natural_key'),
+        ),
+        migrations.AddConstraint(
+            model_name='entry',
+            constraint=models.UniqueConstraint(fields=('meet', 'rc_date', 'rc_no', 'chul_no'), name='racing_entry_natural_key'),
+        ),
+    ]
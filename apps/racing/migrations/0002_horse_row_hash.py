@@ -0,0 +1,22 @@
+# Generated by Django 5.0.7 on 2026-10-17 07:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('racing', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='horse',
+            name='row_hash',
+            field=models.CharField(blank=True, default='', max_length=40, verbose_name='원본 해시'),
+        ),
+        migrations.AddIndex(
+            model_name='horse',
+            index=models.Index(fields=['meet', 'hr_name'], name='racing_hors_meet_c28757_idx'),
+        ),
+    ]
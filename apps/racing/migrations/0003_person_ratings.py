@@ -0,0 +1,61 @@
+# Generated by Django 5.0.7 on 2026-10-17 07:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('racing', '0002_horse_row_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RatedRace',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('meet', models.PositiveSmallIntegerField(verbose_name='경마장')),
+                ('rc_date', models.DateField(verbose_name='경주일자')),
+                ('rc_no', models.PositiveSmallIntegerField(verbose_name='경주번호')),
+                ('rated_at', models.DateTimeField(auto_now_add=True, verbose_name='반영일시')),
+            ],
+            options={
+                'verbose_name': '레이팅 반영 경주',
+                'verbose_name_plural': '레이팅 반영 경주',
+            },
+        ),
+        migrations.AddField(
+            model_name='jockey',
+            name='places',
+            field=models.PositiveIntegerField(default=0, verbose_name='3착 이내 수'),
+        ),
+        migrations.AddField(
+            model_name='jockey',
+            name='starts',
+            field=models.PositiveIntegerField(default=0, verbose_name='출전 수'),
+        ),
+        migrations.AddField(
+            model_name='jockey',
+            name='wins',
+            field=models.PositiveIntegerField(default=0, verbose_name='1착 수'),
+        ),
+        migrations.AddField(
+            model_name='trainer',
+            name='places',
+            field=models.PositiveIntegerField(default=0, verbose_name='3착 이내 수'),
+        ),
+        migrations.AddField(
+            model_name='trainer',
+            name='starts',
+            field=models.PositiveIntegerField(default=0, verbose_name='출전 수'),
+        ),
+        migrations.AddField(
+            model_name='trainer',
+            name='wins',
+            field=models.PositiveIntegerField(default=0, verbose_name='1착 수'),
+        ),
+        migrations.AddConstraint(
+            model_name='ratedrace',
+            constraint=models.UniqueConstraint(fields=('meet', 'rc_date', 'rc_no'), name='racing_ratedrace_natural_key'),
+        ),
+    ]
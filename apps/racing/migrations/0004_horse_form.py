@@ -0,0 +1,50 @@
+# Generated by Django 5.0.7 on 2026-10-17 07:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('racing', '0003_person_ratings'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HorseForm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hr_no', models.CharField(max_length=10, unique=True, verbose_name='마번')),
+                ('starts', models.PositiveIntegerField(default=0, verbose_name='출전 수')),
+                ('wins', models.PositiveIntegerField(default=0, verbose_name='1착 수')),
+                ('places', models.PositiveIntegerField(default=0, verbose_name='3착 이내 수')),
+                ('last_date', models.DateField(blank=True, null=True, verbose_name='최근 출전일')),
+                ('recent', models.JSONField(blank=True, default=list, verbose_name='최근 출전')),
+                ('distance_stats', models.JSONField(blank=True, default=dict, verbose_name='거리별 성적')),
+                ('track_stats', models.JSONField(blank=True, default=dict, verbose_name='경마장별 성적')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '경주마 최근 성적',
+                'verbose_name_plural': '경주마 최근 성적',
+            },
+        ),
+        migrations.CreateModel(
+            name='HorseFormRace',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('meet', models.PositiveSmallIntegerField(verbose_name='경마장')),
+                ('rc_date', models.DateField(verbose_name='경주일자')),
+                ('rc_no', models.PositiveSmallIntegerField(verbose_name='경주번호')),
+                ('applied_at', models.DateTimeField(auto_now_add=True, verbose_name='반영일시')),
+            ],
+            options={
+                'verbose_name': '최근 성적 반영 경주',
+                'verbose_name_plural': '최근 성적 반영 경주',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='horseformrace',
+            constraint=models.UniqueConstraint(fields=('meet', 'rc_date', 'rc_no'), name='racing_horseformrace_natural_key'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.7 on 2026-10-17 07:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('racing', '0004_horse_form'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HorseFormSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hr_no', models.CharField(max_length=10, verbose_name='마번')),
+                ('rc_date', models.DateField(verbose_name='경주일자')),
+                ('features', models.JSONField(blank=True, default=dict, verbose_name='특성')),
+            ],
+            options={
+                'verbose_name': '경주마 최근 성적 스냅샷',
+                'verbose_name_plural': '경주마 최근 성적 스냅샷',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='horseformsnapshot',
+            constraint=models.UniqueConstraint(fields=('hr_no', 'rc_date'), name='racing_horseformsnapshot_natural_key'),
+        ),
+    ]
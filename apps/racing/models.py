@@ -0,0 +1,262 @@
+"""
+경마 데이터 저장소 모델
+
+한국마사회 API 응답을 정규화하여 저장한다. 경주/출전 행은 API의 자연키
+(meet, rcDate, rcNo, chulNo)로 식별하며, 원본 item은 raw 필드에 그대로 보관한다.
+"""
+
+from django.db import models
+
+
+class Jockey(models.Model):
+    """기수"""
+
+    jk_no = models.CharField('기수번호', max_length=10, unique=True)
+    name = models.CharField('기수명', max_length=50, blank=True)
+    meet = models.PositiveSmallIntegerField('경마장', null=True, blank=True)
+    # 레이팅 집계 (경주 성적이 적재될 때마다 누적, services/ratings.py)
+    starts = models.PositiveIntegerField('출전 수', default=0)
+    wins = models.PositiveIntegerField('1착 수', default=0)
+    places = models.PositiveIntegerField('3착 이내 수', default=0)
+    updated_at = models.DateTimeField('수정일시', auto_now=True)
+
+    class Meta:
+        verbose_name = '기수'
+        verbose_name_plural = '기수'
+        indexes = [models.Index(fields=['name'])]
+
+    def __str__(self):
+        return f"{self.name} ({self.jk_no})"
+
+
+class Trainer(models.Model):
+    """조교사"""
+
+    tr_no = models.CharField('조교사번호', max_length=10, unique=True)
+    name = models.CharField('조교사명', max_length=50, blank=True)
+    meet = models.PositiveSmallIntegerField('경마장', null=True, blank=True)
+    # 레이팅 집계 (경주 성적이 적재될 때마다 누적, services/ratings.py)
+    starts = models.PositiveIntegerField('출전 수', default=0)
+    wins = models.PositiveIntegerField('1착 수', default=0)
+    places = models.PositiveIntegerField('3착 이내 수', default=0)
+    updated_at = models.DateTimeField('수정일시', auto_now=True)
+
+    class Meta:
+        verbose_name = '조교사'
+        verbose_name_plural = '조교사'
+        indexes = [models.Index(fields=['name'])]
+
+    def __str__(self):
+        return f"{self.name} ({self.tr_no})"
+
+
+class Horse(models.Model):
+    """경주마 (경주마 상세정보 API 기준)"""
+
+    hr_no = models.CharField('마번', max_length=10, unique=True)
+    hr_name = models.CharField('마명', max_length=50, blank=True)
+    meet = models.PositiveSmallIntegerField('경마장', null=True, blank=True)
+    sex = models.CharField('성별', max_length=10, blank=True)
+    age = models.PositiveSmallIntegerField('연령', null=True, blank=True)
+    birthday = models.DateField('생년월일', null=True, blank=True)
+    rank = models.CharField('등급', max_length=20, blank=True)
+    rating = models.IntegerField('레이팅', null=True, blank=True)
+    raw = models.JSONField('원본 데이터', default=dict, blank=True)
+    # 상세정보 원본의 해시 (동기화 시 바뀐 행만 갱신, 출전 행에서 이름만 만든 경우 빈 값)
+    row_hash = models.CharField('원본 해시', max_length=40, blank=True, default='')
+    updated_at = models.DateTimeField('수정일시', auto_now=True)
+
+    class Meta:
+        verbose_name = '경주마'
+        verbose_name_plural = '경주마'
+        indexes = [
+            models.Index(fields=['hr_name']),
+            models.Index(fields=['meet', 'hr_name']),
+        ]
+
+    def __str__(self):
+        return f"{self.hr_name} ({self.hr_no})"
+
+
+class Race(models.Model):
+    """경주 (경주계획표 API 기준)"""
+
+    meet = models.PositiveSmallIntegerField('경마장')
+    rc_date = models.DateField('경주일자')
+    rc_no = models.PositiveSmallIntegerField('경주번호')
+    rc_name = models.CharField('경주명', max_length=100, blank=True)
+    rc_dist = models.PositiveIntegerField('경주거리', null=True, blank=True)
+    rank = models.CharField('등급', max_length=30, blank=True)
+    start_time = models.CharField('출발시각', max_length=10, blank=True)
+    raw = models.JSONField('원본 데이터', default=dict, blank=True)
+    updated_at = models.DateTimeField('수정일시', auto_now=True)
+
+    class Meta:
+        verbose_name = '경주'
+        verbose_name_plural = '경주'
+        ordering = ['meet', 'rc_date', 'rc_no']
+        constraints = [
+            models.UniqueConstraint(fields=['meet', 'rc_date', 'rc_no'], name='racing_race_natural_key'),
+        ]
+        indexes = [models.Index(fields=['rc_date', 'meet'])]
+
+    def __str__(self):
+        return f"{self.meet} {self.rc_date:%Y%m%d} {self.rc_no}R"
+
+
+class RaceRunner(models.Model):
+    """경주별 출전마 행 공통 필드 (자연키: meet, rc_date, rc_no, chul_no)"""
+
+    meet = models.PositiveSmallIntegerField('경마장')
+    rc_date = models.DateField('경주일자')
+    rc_no = models.PositiveSmallIntegerField('경주번호')
+    chul_no = models.PositiveSmallIntegerField('출전번호')
+    # 마번/기수번호/조교사번호를 그대로 외래키 값으로 사용 (수집 순서와 무관하게 저장)
+    horse = models.ForeignKey(
+        Horse, to_field='hr_no', db_column='hr_no', db_constraint=False,
+        on_delete=models.DO_NOTHING, null=True, blank=True, related_name='+',
+    )
+    jockey = models.ForeignKey(
+        Jockey, to_field='jk_no', db_column='jk_no', db_constraint=False,
+        on_delete=models.DO_NOTHING, null=True, blank=True, related_name='+',
+    )
+    trainer = models.ForeignKey(
+        Trainer, to_field='tr_no', db_column='tr_no', db_constraint=False,
+        on_delete=models.DO_NOTHING, null=True, blank=True, related_name='+',
+    )
+    hr_name = models.CharField('마명', max_length=50, blank=True)
+    raw = models.JSONField('원본 데이터', default=dict, blank=True)
+    updated_at = models.DateTimeField('수정일시', auto_now=True)
+
+    class Meta:
+        abstract = True
+        ordering = ['meet', 'rc_date', 'rc_no', 'chul_no']
+
+    def __str__(self):
+        return f"{self.meet} {self.rc_date:%Y%m%d} {self.rc_no}R #{self.chul_no} {self.hr_name}"
+
+
+class Entry(RaceRunner):
+    """출전표 (예정 경주)"""
+
+    wg_budam = models.FloatField('부담중량', null=True, blank=True)
+    rating = models.IntegerField('레이팅', null=True, blank=True)
+
+    class Meta(RaceRunner.Meta):
+        verbose_name = '출전표'
+        verbose_name_plural = '출전표'
+        constraints = [
+            models.UniqueConstraint(fields=['meet', 'rc_date', 'rc_no', 'chul_no'], name='racing_entry_natural_key'),
+        ]
+
+
+class Result(RaceRunner):
+    """경주성적 (경주성적정보 API)"""
+
+    ord = models.PositiveSmallIntegerField('착순', null=True, blank=True)
+    rc_time = models.FloatField('경주기록(초)', null=True, blank=True)
+    wg_hr = models.CharField('마체중', max_length=20, blank=True)
+    win_odds = models.FloatField('단승식 배당', null=True, blank=True)
+    plc_odds = models.FloatField('연승식 배당', null=True, blank=True)
+
+    class Meta(RaceRunner.Meta):
+        verbose_name = '경주성적'
+        verbose_name_plural = '경주성적'
+        constraints = [
+            models.UniqueConstraint(fields=['meet', 'rc_date', 'rc_no', 'chul_no'], name='racing_result_natural_key'),
+        ]
+
+
+class Record(RaceRunner):
+    """경주기록 (경주기록정보 API)"""
+
+    ord = models.PositiveSmallIntegerField('착순', null=True, blank=True)
+    rc_time = models.FloatField('경주기록(초)', null=True, blank=True)
+    rc_dist = models.PositiveIntegerField('경주거리', null=True, blank=True)
+
+    class Meta(RaceRunner.Meta):
+        verbose_name = '경주기록'
+        verbose_name_plural = '경주기록'
+        constraints = [
+            models.UniqueConstraint(fields=['meet', 'rc_date', 'rc_no', 'chul_no'], name='racing_record_natural_key'),
+        ]
+
+
+class RatedRace(models.Model):
+    """기수/조교사 레이팅에 반영한 경주 (같은 경주를 두 번 누적하지 않기 위한 기록)"""
+
+    meet = models.PositiveSmallIntegerField('경마장')
+    rc_date = models.DateField('경주일자')
+    rc_no = models.PositiveSmallIntegerField('경주번호')
+    rated_at = models.DateTimeField('반영일시', auto_now_add=True)
+
+    class Meta:
+        verbose_name = '레이팅 반영 경주'
+        verbose_name_plural = '레이팅 반영 경주'
+        constraints = [
+            models.UniqueConstraint(fields=['meet', 'rc_date', 'rc_no'], name='racing_ratedrace_natural_key'),
+        ]
+
+    def __str__(self):
+        return f"{self.meet} {self.rc_date:%Y%m%d} {self.rc_no}R"
+
+
+class HorseForm(models.Model):
+    """경주마 최근 성적 특성 (경주 성적이 적재될 때마다 누적, services/feature_store.py)"""
+
+    hr_no = models.CharField('마번', max_length=10, unique=True)
+    starts = models.PositiveIntegerField('출전 수', default=0)
+    wins = models.PositiveIntegerField('1착 수', default=0)
+    places = models.PositiveIntegerField('3착 이내 수', default=0)
+    last_date = models.DateField('최근 출전일', null=True, blank=True)
+    # 최근 출전 [경주일자, 경마장, 경주번호, 착순, 거리] (최근 순, 최대 HorseFormStore.RECENT_RACES개)
+    recent = models.JSONField('최근 출전', default=list, blank=True)
+    # 거리 구간/경마장별 [출전 수, 1착 수]
+    distance_stats = models.JSONField('거리별 성적', default=dict, blank=True)
+    track_stats = models.JSONField('경마장별 성적', default=dict, blank=True)
+    updated_at = models.DateTimeField('수정일시', auto_now=True)
+
+    class Meta:
+        verbose_name = '경주마 최근 성적'
+        verbose_name_plural = '경주마 최근 성적'
+
+    def __str__(self):
+        return f"{self.hr_no} {self.starts}전 {self.wins}승"
+
+
+class HorseFormRace(models.Model):
+    """경주마 최근 성적에 반영한 경주 (같은 경주를 두 번 누적하지 않기 위한 기록)"""
+
+    meet = models.PositiveSmallIntegerField('경마장')
+    rc_date = models.DateField('경주일자')
+    rc_no = models.PositiveSmallIntegerField('경주번호')
+    applied_at = models.DateTimeField('반영일시', auto_now_add=True)
+
+    class Meta:
+        verbose_name = '최근 성적 반영 경주'
+        verbose_name_plural = '최근 성적 반영 경주'
+        constraints = [
+            models.UniqueConstraint(fields=['meet', 'rc_date', 'rc_no'], name='racing_horseformrace_natural_key'),
+        ]
+
+    def __str__(self):
+        return f"{self.meet} {self.rc_date:%Y%m%d} {self.rc_no}R"
+
+
+class HorseFormSnapshot(models.Model):
+    """경주일 시점 경주마 최근 성적 특성 (지난 출전표용, build_horse_forms --snapshots로 미리 계산)"""
+
+    hr_no = models.CharField('마번', max_length=10)
+    rc_date = models.DateField('경주일자')
+    # 경주일 전 성적의 특성 (HorseFormStore.features, 기록이 없으면 빈 딕셔너리)
+    features = models.JSONField('특성', default=dict, blank=True)
+
+    class Meta:
+        verbose_name = '경주마 최근 성적 스냅샷'
+        verbose_name_plural = '경주마 최근 성적 스냅샷'
+        constraints = [
+            models.UniqueConstraint(fields=['hr_no', 'rc_date'], name='racing_horseformsnapshot_natural_key'),
+        ]
+
+    def __str__(self):
+        return f"{self.hr_no} {self.rc_date:%Y%m%d}"
@@ -1,3 +1,4 @@
 from .kra_api import KRAAPIService
+from .kra_async import AsyncKRAAPIService
 
-__all__ = ['KRAAPIService']
\ No newline at end of file
+__all__ = ['KRAAPIService', 'AsyncKRAAPIService']
\ No newline at end of file
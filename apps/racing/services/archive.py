@@ -0,0 +1,193 @@
+"""
+KRA API 원본 응답 아카이브
+
+파싱된 페이지를 엔드포인트/경마장/월 단위 파티션의 압축 JSONL 파일에 추가 기록한다.
+
+- 경로: {root}/{endpoint}/{meet}/{YYYYMM}.jsonl.zst (zstandard 미설치 시 .jsonl.gz)
+- 한 번 조회한 단위(unit)의 모든 페이지를 하나의 압축 프레임으로 추가하므로
+  기존 데이터는 다시 쓰지 않는다 (append-only). 같은 단위를 다시 받으면 마지막 배치가 우선한다.
+- 중단으로 잘린 마지막 프레임은 읽을 때 무시한다.
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import zlib
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set
+
+from django.conf import settings
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성: 없으면 gzip 사용
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+class RawArchive:
+    """압축 JSONL 원본 응답 아카이브"""
+
+    def __init__(self, root: str = None, codec: str = None):
+        self.root = str(root or getattr(settings, 'KRA_ARCHIVE_DIR', None)
+                        or os.path.join(settings.BASE_DIR, 'archive', 'kra'))
+        if codec is None:
+            codec = 'zst' if zstandard is not None else 'gz'
+        if codec == 'zst' and zstandard is None:
+            raise ValueError('zstandard 패키지가 설치되어 있지 않습니다')
+        self.codec = codec
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def partition_path(self, endpoint: str, meet: int, month: str) -> str:
+        """파티션 파일 경로"""
+        return os.path.join(self.root, endpoint, str(meet), f"{month}.jsonl.{self.codec}")
+
+    def append(self, endpoint: str, meet: int, month: str, unit: str,
+               params: Dict, pages: List[Dict], complete: bool = True) -> str:
+        """
+        한 조회 단위의 페이지들을 파티션에 추가
+
+        Args:
+            endpoint: ENDPOINTS 이름
+            meet: 경마장 코드
+            month: 파티션 월 (YYYYMM)
+            unit: 조회 단위 식별자 (예: 월 'YYYYMM')
+            params: 요청 파라미터
+            pages: 파싱된 페이지 목록
+            complete: 모든 페이지를 받았는지 여부
+
+        Returns:
+            기록한 파일 경로
+        """
+        path = self.partition_path(endpoint, meet, month)
+        batch = datetime.now().isoformat(timespec='microseconds')
+        lines = []
+        for page in pages:
+            record = {
+                'endpoint': endpoint,
+                'meet': meet,
+                'unit': unit,
+                'params': params,
+                'batch': batch,
+                'complete': complete,
+                'page': page,
+            }
+            lines.append(json.dumps(record, ensure_ascii=False, default=str))
+        payload = ('\n'.join(lines) + '\n').encode('utf-8') if lines else b''
+
+        with self._lock_for(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'ab') as f:
+                f.write(self._compress(payload))
+                f.flush()
+                os.fsync(f.fileno())
+        return path
+
+    def iter_records(self, endpoint: str, meet: int, month: str) -> Iterator[Dict]:
+        """파티션의 모든 레코드를 기록 순서대로 반환"""
+        path = self.partition_path(endpoint, meet, month)
+        if not os.path.exists(path):
+            return
+
+        with self._lock_for(path):
+            with open(path, 'rb') as f:
+                raw = f.read()
+
+        for line in self._decompress_lines(raw, path):
+            try:
+                yield json.loads(line)
+            except ValueError:
+                logger.warning(f"아카이브 레코드 손상, 건너뜀: {path}")
+
+    def read_unit(self, endpoint: str, meet: int, month: str, unit: str) -> Optional[List[Dict]]:
+        """
+        조회 단위의 마지막 완전한 배치 페이지 반환
+
+        Returns:
+            페이지 목록, 아카이브에 없으면 None
+        """
+        batches: Dict[str, List[Dict]] = {}
+        complete: Set[str] = set()
+        for record in self.iter_records(endpoint, meet, month):
+            if record.get('unit') != unit:
+                continue
+            batches.setdefault(record['batch'], []).append(record['page'])
+            if record.get('complete'):
+                complete.add(record['batch'])
+
+        if not complete:
+            return None
+        return batches[max(complete)]
+
+    def has_unit(self, endpoint: str, meet: int, month: str, unit: str) -> bool:
+        return self.read_unit(endpoint, meet, month, unit) is not None
+
+    def _lock_for(self, path: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(path)
+            if lock is None:
+                lock = self._locks[path] = threading.Lock()
+            return lock
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.codec == 'zst':
+            return zstandard.ZstdCompressor(level=3).compress(payload)
+        return gzip.compress(payload)
+
+    def _decompress_lines(self, raw: bytes, path: str) -> Iterator[str]:
+        """연결된 압축 프레임을 하나씩 풀어 줄 단위로 반환 (잘린 마지막 프레임은 무시)"""
+        zst = path.endswith('.zst')
+        data = raw
+        while data:
+            decompressor = (zstandard.ZstdDecompressor().decompressobj() if zst
+                            else zlib.decompressobj(wbits=31))
+            try:
+                payload = decompressor.decompress(data)
+            except Exception as e:
+                logger.warning(f"아카이브 프레임 손상, 이후 무시: {path} - {str(e)}")
+                return
+            if not decompressor.eof:
+                logger.warning(f"아카이브 끝부분이 잘려 있음 (중단된 기록), 이후 무시: {path}")
+                return
+            for line in payload.split(b'\n'):
+                if line:
+                    yield line.decode('utf-8')
+            data = decompressor.unused_data
+
+
+class BackfillCheckpoint:
+    """완료한 백필 작업 목록 (중단 후 재실행 시 이어서 진행)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._done: Set[str] = set()
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._done = set(json.load(f).get('done', []))
+            except (OSError, ValueError) as e:
+                logger.warning(f"체크포인트 파일을 읽을 수 없어 처음부터 진행: {path} - {str(e)}")
+
+    def is_done(self, task_id: str) -> bool:
+        with self._lock:
+            return task_id in self._done
+
+    def mark_done(self, task_id: str):
+        """작업 완료 기록 (임시 파일에 쓴 뒤 교체하므로 중단되어도 파일이 깨지지 않음)"""
+        with self._lock:
+            self._done.add(task_id)
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'done': sorted(self._done),
+                           'updated_at': datetime.now().isoformat(timespec='seconds')}, f)
+            os.replace(tmp_path, self.path)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._done)
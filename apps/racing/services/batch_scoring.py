@@ -0,0 +1,198 @@
+"""
+예측 모델 일괄 점수 계산
+
+출전마 레코드 열에서 (출전마 x 특성) 행렬을 만들어 가중합과 순위를 한 번에 계산한다.
+하루치/수천 경주를 한 행렬로 묶어 백테스트와 사전 계산에 사용한다.
+
+결과는 출전마별로 계산하던 기존 방식과 비트 단위까지 같아야 하므로
+- 가중합은 행렬곱(BLAS, 합산 순서/FMA가 구현마다 다름) 대신 특성 열을 기존 합산 순서대로
+  더한다 (출전마 방향으로 벡터화)
+- 반올림은 Python round()로 (NumPy 반올림과 결과가 다를 수 있음)
+- 순위는 반올림한 값의 내림차순 안정 정렬 (기존 list.sort(reverse=True)와 같은 동점 처리)
+
+특성 행렬은 각 모델의 feature_columns가 출전마별 계산식과 같은 순서의 float64 연산으로 만든다.
+예측 결과(predict_many)는 출력에 출전마별 특성 딕셔너리도 필요하므로 딕셔너리는 따로 만든다.
+한 경주 예측(model.predict)은 출전마 수가 적어 NumPy 호출 비용이 더 크므로 기존 방식 그대로 둔다.
+AI 모델에 학습 모델(model_registry)이 게시되어 있으면 경주별/일괄 모두 같은 특성 행렬로 그 모델의
+점수를 쓴다.
+"""
+
+import logging
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .runners import to_runners
+
+
+logger = logging.getLogger(__name__)
+
+
+def column_matrix(columns: Dict[str, np.ndarray], keys: Sequence[str], rows: int,
+                  default: float = 50) -> np.ndarray:
+    """특성 이름 -> 열 배열을 (행 x 특성) 행렬로 쌓기 (없는 특성은 default)"""
+    matrix = np.full((rows, len(keys)), default, dtype=np.float64)
+    for i, key in enumerate(keys):
+        if key in columns:
+            matrix[:, i] = columns[key]
+    return matrix
+
+
+def py_max0(values: np.ndarray) -> np.ndarray:
+    """Python max(0, x)와 같은 결과 (NaN -> 0)"""
+    return np.where(values > 0, values, 0.0)
+
+
+def py_min100(values: np.ndarray) -> np.ndarray:
+    """Python min(100, x)와 같은 결과 (NaN -> 100)"""
+    return np.where(values < 100, values, 100.0)
+
+
+def runner_columns(runners: Sequence) -> Dict[str, np.ndarray]:
+    """출전마 레코드 목록을 열 배열로 변환 (마체중을 읽을 수 없으면 has_weight False)"""
+    return {
+        'is_entry': np.array([runner.is_entry for runner in runners], dtype=bool),
+        'valid': np.array([runner.valid for runner in runners], dtype=bool),
+        'has_weight': np.array([runner.weight is not None for runner in runners], dtype=bool),
+        'weight': np.array([500.0 if runner.weight is None else runner.weight for runner in runners],
+                           dtype=np.float64),
+        'age': np.array([runner.age for runner in runners], dtype=np.float64),
+        'is_male': np.array([runner.sex == 'M' for runner in runners], dtype=bool),
+        'is_female': np.array([runner.sex == 'F' for runner in runners], dtype=bool),
+        'wins': np.array([runner.wins for runner in runners], dtype=np.float64),
+        'starts': np.array([runner.starts for runner in runners], dtype=np.float64),
+        'win_odds': np.array([runner.win_odds for runner in runners], dtype=np.float64),
+        'has_form': np.array([bool(runner.form) for runner in runners], dtype=bool),
+        'form_recent_wins': np.array([runner.form['recent_wins'] if runner.form else 0.0 for runner in runners],
+                                     dtype=np.float64),
+        'form_recent_races': np.array([runner.form['recent_races'] if runner.form else 0.0 for runner in runners],
+                                      dtype=np.float64),
+        'form_win_rate': np.array([runner.form['win_rate'] if runner.form else 0.0 for runner in runners],
+                                  dtype=np.float64),
+    }
+
+
+def name_scores(keys: Sequence[tuple], score: Callable) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    기수/조교사별 점수 (같은 키는 한 번만 계산)
+
+    Args:
+        keys: 출전마별 score 인자 튜플 (이름, 구분, 번호)
+        score: 점수 함수
+
+    Returns:
+        (점수 배열, 계산 성공 여부 배열)
+    """
+    memo = {}
+    values = np.empty(len(keys), dtype=np.float64)
+    ok = np.ones(len(keys), dtype=bool)
+    for i, key in enumerate(keys):
+        if key not in memo:
+            try:
+                memo[key] = score(*key)
+            except Exception:
+                memo[key] = None
+        if memo[key] is None:
+            values[i], ok[i] = 50.0, False
+        else:
+            values[i] = memo[key]
+    return values, ok
+
+
+def weighted_sum(matrix: np.ndarray, weights: Sequence[float]) -> np.ndarray:
+    """
+    행별 가중합 (특성 순서대로 열을 누적해 Python sum()과 같은 결과)
+    """
+    total = np.zeros(matrix.shape[0], dtype=np.float64)
+    for column, weight in enumerate(weights):
+        total += matrix[:, column] * weight
+    return total
+
+
+def rounded_scores(values: np.ndarray, clip: bool = False) -> List[float]:
+    """
+    출력용 점수 (기존 round(max(0, min(100, x)), 1)과 같은 값/타입)
+
+    clip이면 0~100 범위로 자르며, 경계에서는 기존 코드처럼 정수 0/100이 된다.
+    """
+    if not clip:
+        return [round(value, 1) for value in values.tolist()]
+    # max(0, min(100, x)): 100 이상/NaN은 정수 100, 0 이하는 정수 0
+    return [
+        100 if not value < 100 else 0 if value <= 0 else round(value, 1)
+        for value in values.tolist()
+    ]
+
+
+class BatchScorer:
+    """여러 경주를 한 행렬로 묶어 두 예측 모델 점수/순위를 계산"""
+
+    def __init__(self, ai_model=None, user_model=None):
+        from .prediction_models import AIPredictionModel, UserParameterModel
+        self.ai_model = ai_model or AIPredictionModel()
+        self.user_model = user_model or UserParameterModel()
+
+    @staticmethod
+    def _offsets(races: Sequence[Sequence]) -> List[int]:
+        offsets = [0]
+        for runners in races:
+            offsets.append(offsets[-1] + len(runners))
+        return offsets
+
+    def _scores(self, model, runners: List) -> List[float]:
+        """출전마 전체의 출력용 점수 (특성 행렬 x 가중치, AI 모델은 학습 모델이 있으면 그 점수)"""
+        return rounded_scores(model.batch_scores(runners), clip=(model is self.ai_model))
+
+    def score_many(self, races: Sequence[Sequence], model: str = 'ai') -> List[Tuple[List[float], np.ndarray]]:
+        """
+        경주 목록의 점수와 순위 (예측 결과 딕셔너리를 만들지 않는 백테스트용)
+
+        Args:
+            races: 경주별 출전마 목록 (Runner 또는 item)
+            model: 'ai' 또는 'user'
+
+        Returns:
+            경주별 (출전마 순서의 점수 목록, 점수 내림차순 인덱스)
+        """
+        runners = to_runners(runner for race in races for runner in race)
+        model = self.ai_model if model == 'ai' else self.user_model
+        scores = self._scores(model, model.prepare(runners))
+
+        # 경주 번호, 점수 내림차순으로 한 번에 안정 정렬
+        offsets = self._offsets(races)
+        race_index = np.repeat(np.arange(len(races)), [len(race) for race in races])
+        order = np.lexsort((-np.asarray(scores, dtype=np.float64), race_index)) if scores else race_index
+
+        results = []
+        for start, end in zip(offsets, offsets[1:]):
+            results.append((scores[start:end], order[start:end] - start))
+        return results
+
+    def predict_many(self, races: Sequence[Sequence]) -> List[Tuple[List[Dict], List[Dict]]]:
+        """
+        경주 목록 예측 (경주별 model.predict()와 같은 결과)
+
+        Returns:
+            경주별 (AI 모델 예측, 사용자 파라미터 모델 예측)
+        """
+        runners = to_runners(runner for race in races for runner in race)
+        offsets = self._offsets(races)
+
+        outputs = []
+        for model, extract in (
+            (self.ai_model, self.ai_model.extract_features),
+            (self.user_model, self.user_model._calculate_parameter_scores),
+        ):
+            try:
+                model.prepare(runners)
+                rows = [extract(runner) for runner in runners]
+                scores = self._scores(model, runners)
+                outputs.append([
+                    model.build_predictions(runners[start:end], rows[start:end], scores[start:end])
+                    for start, end in zip(offsets, offsets[1:])
+                ])
+            except Exception as e:
+                logger.error(f"일괄 예측 오류 ({model.model_name}): {str(e)}")
+                outputs.append([[] for _ in races])
+
+        return list(zip(*outputs))
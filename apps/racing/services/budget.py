@@ -0,0 +1,213 @@
+"""
+data.go.kr API 키 호출량 관리
+
+- 엔드포인트별 일일 호출 수를 워커 공유 캐시에 집계하고 일일 한도를 적용
+- 토큰 버킷으로 초당 호출 속도 제한 (워커 단위)
+- 우선순위(화면 요청 > 미리 가져오기 > 백필)별로 대기열 순서를 정하고,
+  한도에 가까워지면 낮은 우선순위 요청부터 거부
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from enum import IntEnum
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """호출 우선순위 (값이 작을수록 우선)"""
+    
+    INTERACTIVE = 0   # 사용자 화면 요청
+    PREFETCH = 1      # 미리 가져오기/캐시 갱신
+    BACKFILL = 2      # 과거 데이터 대량 수집
+
+
+class BudgetExceeded(Exception):
+    """호출 한도 초과로 요청을 보내지 않음"""
+    
+    def __init__(self, endpoint: str, reason: str):
+        self.endpoint = endpoint
+        self.reason = reason
+        super().__init__(f"호출 한도 초과 ({reason}): {endpoint}")
+
+
+class CallBudget:
+    """엔드포인트별 일일 호출 한도 + 우선순위 토큰 버킷"""
+    
+    DAILY_QUOTA = 10000   # 엔드포인트별 일일 호출 한도 (운영 계정 기준)
+    RATE = 20.0           # 초당 호출 수 (워커 단위)
+    BURST = 40            # 토큰 버킷 최대 크기
+    
+    # 우선순위별로 사용할 수 있는 일일 한도 비율 (나머지는 상위 우선순위용으로 남겨둠)
+    QUOTA_SHARE = {
+        Priority.INTERACTIVE: 1.0,
+        Priority.PREFETCH: 0.9,
+        Priority.BACKFILL: 0.7,
+    }
+    
+    # 우선순위별 토큰 대기 시간(초), None이면 토큰이 생길 때까지 대기
+    WAIT_TIMEOUT = {
+        Priority.INTERACTIVE: 5.0,
+        Priority.PREFETCH: 30.0,
+        Priority.BACKFILL: None,
+    }
+    
+    def __init__(self, counter_cache, daily_quota: int = None, quotas: Dict[str, int] = None,
+                 rate: float = None, burst: int = None):
+        """
+        Args:
+            counter_cache: 일일 호출 수를 집계할 Django 캐시 (워커 공유)
+            daily_quota: 엔드포인트별 기본 일일 한도
+            quotas: 엔드포인트 이름별 일일 한도
+            rate: 초당 호출 수
+            burst: 토큰 버킷 최대 크기
+        """
+        self.counter_cache = counter_cache
+        self.daily_quota = daily_quota or self.DAILY_QUOTA
+        self.quotas = quotas or {}
+        self.rate = rate or self.RATE
+        self.burst = burst or self.BURST
+        
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._waiters = []                 # (우선순위, 순번) 힙
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._rejected = {priority.name: 0 for priority in Priority}
+    
+    def quota_for(self, endpoint: str) -> int:
+        return self.quotas.get(endpoint, self.daily_quota)
+    
+    def _counter_key(self, endpoint: str) -> str:
+        return f"kra_budget:{timezone.localdate():%Y%m%d}:{endpoint}"
+    
+    def used(self, endpoint: str) -> int:
+        """오늘 사용한 호출 수"""
+        return int(self.counter_cache.get(self._counter_key(endpoint)) or 0)
+    
+    def acquire(self, endpoint: str, priority: Priority = Priority.INTERACTIVE,
+                timeout: Optional[float] = -1):
+        """
+        호출 전 한도 확인 및 토큰 획득
+        
+        Args:
+            endpoint: 엔드포인트 이름
+            priority: 호출 우선순위
+            timeout: 토큰 대기 시간(초), 기본값은 우선순위별 WAIT_TIMEOUT
+            
+        Raises:
+            BudgetExceeded: 일일 한도 또는 대기 시간 초과
+        """
+        limit = int(self.quota_for(endpoint) * self.QUOTA_SHARE[priority])
+        if self.used(endpoint) >= limit:
+            self._reject(priority)
+            raise BudgetExceeded(endpoint, f"일일 한도 {limit}회 ({priority.name})")
+        
+        if timeout == -1:
+            timeout = self.WAIT_TIMEOUT[priority]
+        if not self._take_token(priority, timeout):
+            self._reject(priority)
+            raise BudgetExceeded(endpoint, f"속도 제한 대기 {timeout}초 초과 ({priority.name})")
+    
+    def record_call(self, endpoint: str):
+        """실제로 보낸 호출 집계 (워커 공유 카운터)"""
+        key = self._counter_key(endpoint)
+        # 날짜가 바뀌면 새 키를 쓰므로 이틀 뒤 자동 만료
+        self.counter_cache.add(key, 0, 2 * 24 * 60 * 60)
+        try:
+            self.counter_cache.incr(key)
+        except ValueError:
+            self.counter_cache.set(key, 1, 2 * 24 * 60 * 60)
+    
+    def _reject(self, priority: Priority):
+        with self._cond:
+            self._rejected[priority.name] += 1
+    
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+    
+    def _take_token(self, priority: Priority, timeout: Optional[float]) -> bool:
+        """우선순위 순서대로 토큰 1개 획득 (대기열 맨 앞 요청만 토큰을 가져감)"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        entry = (int(priority), next(self._seq))
+        
+        with self._cond:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    self._refill()
+                    if self._waiters[0] == entry and self._tokens >= 1:
+                        self._tokens -= 1
+                        return True
+                    
+                    # 다음 토큰이 생길 때까지 (또는 앞 요청이 끝날 때까지) 대기
+                    wait = max(0.001, (1 - self._tokens) / self.rate)
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        wait = min(wait, remaining)
+                    self._cond.wait(wait)
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+    
+    def stats(self, endpoints=None) -> Dict[str, Any]:
+        """오늘 호출량과 대기/거부 현황"""
+        with self._cond:
+            self._refill()
+            tokens = round(self._tokens, 1)
+            waiting = len(self._waiters)
+            rejected = dict(self._rejected)
+        
+        usage = {}
+        for endpoint in endpoints or self.quotas.keys():
+            quota = self.quota_for(endpoint)
+            used = self.used(endpoint)
+            usage[endpoint] = {
+                'used': used,
+                'quota': quota,
+                'remaining': max(0, quota - used),
+            }
+        
+        return {
+            'date': f"{timezone.localdate():%Y-%m-%d}",
+            'usage': usage,
+            'rate': self.rate,
+            'tokens': tokens,
+            'waiting': waiting,
+            'rejected': rejected,
+        }
+
+
+# 프로세스 공용 인스턴스
+_budget: Optional[CallBudget] = None
+_budget_lock = threading.Lock()
+
+
+def get_call_budget() -> CallBudget:
+    """프로세스 공용 호출량 관리자 반환"""
+    global _budget
+    if _budget is None:
+        with _budget_lock:
+            if _budget is None:
+                from .response_cache import get_response_cache
+                _budget = CallBudget(
+                    counter_cache=get_response_cache().l2,
+                    daily_quota=getattr(settings, 'KRA_DAILY_QUOTA', None),
+                    quotas=getattr(settings, 'KRA_DAILY_QUOTAS', None),
+                    rate=getattr(settings, 'KRA_RATE_LIMIT', None),
+                    burst=getattr(settings, 'KRA_RATE_BURST', None),
+                )
+    return _budget
@@ -0,0 +1,182 @@
+"""
+출전표 변경 감지 (change feed)
+
+경주일에 출전표(entrySheet_2)를 주기적으로 조회해 경주별 출전마 행의 내용 해시를 이전 조회와
+비교하고, 바뀐 경주에서만 변경 내역(출전 취소, 기수 변경, 부담중량/마체중 변경 등)을 만들고
+예측/베팅 추천을 다시 계산한다. 바뀌지 않은 경주의 저장된 예측은 그대로 유효하다.
+
+- 이전 조회 상태/변경 내역은 공유 캐시(L2)에 두어 모든 워커가 같은 값을 본다
+- 바뀐 경주의 예측은 예측 캐시(prediction_cache, 내용 해시 키)에 미리 계산해 둔다
+- 상태 갱신은 poll_entries 명령 하나가 담당한다 (여러 프로세스가 동시에 갱신하지 않음)
+- 출전표 응답은 TTL 정책(당일 1분)만큼 캐시되므로 조회 주기는 그보다 짧게 잡을 필요가 없다
+"""
+
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, List
+
+from .ingestion import row_hash
+from .prediction_cache import PredictionCache
+from .race_card import RaceCardIndex
+from .response_cache import get_response_cache
+from .ttl_policy import DAY
+
+
+logger = logging.getLogger(__name__)
+
+# 출전마 변경 구분 판단에 쓰는 필드
+_SNAPSHOT_FIELDS = ('hrNo', 'hrName', 'jkNo', 'jkName', 'wgBudam', 'wgHr')
+
+
+def race_fingerprint(runners: List[Dict]) -> str:
+    """경주 출전마 목록의 내용 해시 (출전번호순 행 해시를 이어 붙인 해시)"""
+    digest = hashlib.sha1()
+    for runner in runners:
+        digest.update(row_hash(runner).encode('ascii'))
+    return digest.hexdigest()
+
+
+def _snapshot(runner: Dict) -> Dict:
+    snapshot = {field: str(runner.get(field) or '').strip() for field in _SNAPSHOT_FIELDS}
+    snapshot['hash'] = row_hash(runner)
+    return snapshot
+
+
+def diff_runners(previous: Dict[str, Dict], current: Dict[str, Dict]) -> List[Dict]:
+    """
+    출전번호별 스냅샷 비교
+
+    Returns:
+        [{'type', 'chul_no', 'hr_name', 'before', 'after'}, ...]
+        type: scratch(출전 취소) / added(추가) / horse_change / jockey_change / weight_change / update
+    """
+    changes = []
+    for chul_no, before in previous.items():
+        if chul_no not in current:
+            changes.append({'type': 'scratch', 'chul_no': chul_no, 'hr_name': before['hrName'],
+                            'before': before['hrNo'], 'after': None})
+
+    for chul_no, after in current.items():
+        before = previous.get(chul_no)
+        if before is None:
+            changes.append({'type': 'added', 'chul_no': chul_no, 'hr_name': after['hrName'],
+                            'before': None, 'after': after['hrNo']})
+            continue
+        if before['hash'] == after['hash']:
+            continue
+
+        detected = False
+        if before['hrNo'] != after['hrNo']:
+            changes.append({'type': 'horse_change', 'chul_no': chul_no, 'hr_name': after['hrName'],
+                            'before': before['hrName'], 'after': after['hrName']})
+            detected = True
+        if (before['jkNo'], before['jkName']) != (after['jkNo'], after['jkName']):
+            changes.append({'type': 'jockey_change', 'chul_no': chul_no, 'hr_name': after['hrName'],
+                            'before': before['jkName'], 'after': after['jkName']})
+            detected = True
+        for field in ('wgBudam', 'wgHr'):
+            if before[field] != after[field]:
+                changes.append({'type': 'weight_change', 'chul_no': chul_no, 'hr_name': after['hrName'],
+                                'field': field, 'before': before[field], 'after': after[field]})
+                detected = True
+        if not detected:
+            changes.append({'type': 'update', 'chul_no': chul_no, 'hr_name': after['hrName'],
+                            'before': None, 'after': None})
+    return changes
+
+
+class EntryChangeFeed:
+    """출전표 변경 감지 및 바뀐 경주만 재예측"""
+
+    STATE_TIMEOUT = 2 * DAY
+    EVENTS_LIMIT = 1000  # 날짜별 보관할 변경 내역 수
+
+    def __init__(self, api_service, predictions: PredictionCache = None):
+        self.api = api_service
+        self.cache = get_response_cache()
+        self.race_cards = getattr(api_service, 'race_cards', None) or RaceCardIndex(api_service)
+        self.predictions = predictions or PredictionCache()
+
+    def _state_key(self, meet: int, date: str) -> str:
+        return f"kra_change_feed:state:{meet}:{date}"
+
+    def _events_key(self, meet: int, date: str) -> str:
+        return f"kra_change_feed:events:{meet}:{date}"
+
+    def poll(self, meet: int, date: str = None) -> Dict:
+        """
+        출전표를 조회해 이전 조회와 비교하고 바뀐 경주만 재예측
+
+        첫 조회는 기준 상태만 저장하고(변경 내역 없음) 모든 경주의 예측을 만든다.
+
+        Returns:
+            {'events': [새 변경 내역], 'changed_races': [경주번호], 'unchanged_races': 수}
+        """
+        date = date or datetime.now().strftime('%Y%m%d')
+        rows = self.api.get_entry_sheet(meet=meet, rc_date=date)
+        if not rows:
+            # 빈 응답은 조회 실패일 수 있으므로 출전 취소로 보지 않음
+            logger.info(f"출전표 변경 감지: {meet} {date} 출전표 없음")
+            return {'events': [], 'changed_races': [], 'unchanged_races': 0}
+
+        card = self.race_cards.store(meet, date, rows, source='entry_sheet')
+        state_key = self._state_key(meet, date)
+        previous = self.cache.get(state_key, l1=False)
+        first_poll = previous is None
+        previous = previous or {}
+
+        state, events, changed_races = {}, [], []
+        detected_at = datetime.now().isoformat(timespec='seconds')
+        for rc_no in set(previous) | set(card['races']):
+            runners = card['races'].get(rc_no, [])
+            fingerprint = race_fingerprint(runners)
+            before = previous.get(rc_no)
+            if runners:
+                snapshots = {str(runner.get('chulNo')): _snapshot(runner) for runner in runners}
+                state[rc_no] = {'fingerprint': fingerprint, 'runners': snapshots}
+            if before is not None and before['fingerprint'] == fingerprint:
+                continue
+
+            changed_races.append(rc_no)
+            if not first_poll:
+                for change in diff_runners(before['runners'] if before else {},
+                                           state[rc_no]['runners'] if runners else {}):
+                    events.append(dict(change, meet=meet, rc_date=date, rc_no=rc_no, detected_at=detected_at))
+            if runners:
+                self.predictions.get_or_compute(card['runners'].get(rc_no) or runners)
+
+        self.cache.set(state_key, state, self.STATE_TIMEOUT, l1=False)
+        if events:
+            self._append_events(meet, date, events)
+
+        changed_races.sort(key=lambda rc_no: int(rc_no) if rc_no.isdigit() else 0)
+        logger.info(
+            f"출전표 변경 감지 {meet} {date}: 변경 경주 {changed_races}, 변경 내역 {len(events)}건"
+        )
+        return {
+            'events': events,
+            'changed_races': changed_races,
+            'unchanged_races': len(set(previous) | set(card['races'])) - len(changed_races),
+        }
+
+    def _append_events(self, meet: int, date: str, events: List[Dict]):
+        key = self._events_key(meet, date)
+        stored = self.cache.get(key, l1=False) or []
+        seq = stored[-1]['seq'] if stored else 0
+        for event in events:
+            seq += 1
+            event['seq'] = seq
+        stored = (stored + events)[-self.EVENTS_LIMIT:]
+        self.cache.set(key, stored, self.STATE_TIMEOUT, l1=False)
+
+    def events(self, meet: int, date: str = None, since: int = 0) -> List[Dict]:
+        """
+        저장된 변경 내역
+
+        Args:
+            since: 이 순번 이후의 내역만 (클라이언트가 마지막으로 받은 seq)
+        """
+        date = date or datetime.now().strftime('%Y%m%d')
+        stored = self.cache.get(self._events_key(meet, date), l1=False) or []
+        return [event for event in stored if event['seq'] > since]
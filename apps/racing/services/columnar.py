@@ -0,0 +1,266 @@
+"""
+경마 데이터 열 지향(Arrow/Parquet) 보관소
+
+로컬 저장소(Race/Entry/Result/Record)에 적재된 과거 데이터를 데이터셋/경마장/월 단위
+파티션 파일로 내보내고, 분석/학습 시 메모리 매핑으로 읽는다.
+
+- 경로: {root}/{dataset}/meet={meet}/{YYYYMM}.{arrow|parquet}
+- arrow: 압축하지 않은 Arrow IPC 파일. 메모리 매핑으로 읽으므로 파일 내용을 복사하지 않음
+- parquet: zstd 압축. 보관/전송용 (읽을 때 압축 해제)
+- 수치 필드는 정수/실수/날짜 타입으로 저장 (결측은 null)
+
+pyarrow는 선택 의존성이며, 없으면 ColumnarStore 생성 시 오류를 낸다.
+"""
+
+import logging
+import os
+from datetime import date
+from typing import Dict, Iterable, List
+
+from django.conf import settings
+
+from .runners import parse_weight
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # 선택 의존성
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ('arrow', 'parquet')
+
+# 출전 행 공통 열: (열 이름, 모델 필드, 타입 이름)
+_RUNNER_COLUMNS = [
+    ('meet', 'meet', 'int16'),
+    ('rc_date', 'rc_date', 'date32'),
+    ('rc_no', 'rc_no', 'int16'),
+    ('chul_no', 'chul_no', 'int16'),
+    ('hr_no', 'horse_id', 'string'),
+    ('jk_no', 'jockey_id', 'string'),
+    ('tr_no', 'trainer_id', 'string'),
+    ('hr_name', 'hr_name', 'string'),
+]
+
+# 데이터셋: 모델 이름과 열 목록
+DATASETS = {
+    'schedules': ('Race', [
+        ('meet', 'meet', 'int16'),
+        ('rc_date', 'rc_date', 'date32'),
+        ('rc_no', 'rc_no', 'int16'),
+        ('rc_name', 'rc_name', 'string'),
+        ('rc_dist', 'rc_dist', 'int32'),
+        ('rank', 'rank', 'string'),
+        ('start_time', 'start_time', 'string'),
+    ]),
+    'entries': ('Entry', _RUNNER_COLUMNS + [
+        ('wg_budam', 'wg_budam', 'float64'),
+        ('rating', 'rating', 'int32'),
+    ]),
+    'results': ('Result', _RUNNER_COLUMNS + [
+        ('ord', 'ord', 'int16'),
+        ('rc_time', 'rc_time', 'float64'),
+        ('wg_hr', 'wg_hr', 'string'),
+        ('win_odds', 'win_odds', 'float64'),
+        ('plc_odds', 'plc_odds', 'float64'),
+    ]),
+    'records': ('Record', _RUNNER_COLUMNS + [
+        ('ord', 'ord', 'int16'),
+        ('rc_time', 'rc_time', 'float64'),
+        ('rc_dist', 'rc_dist', 'int32'),
+    ]),
+}
+
+# 원본 문자열에서 계산해 추가하는 열: 데이터셋 -> [(열 이름, 원본 열, 변환 함수, 타입 이름)]
+_DERIVED_COLUMNS = {
+    'results': [('wg_hr_kg', 'wg_hr', lambda value: parse_weight(value) if value else None, 'float64')],
+}
+
+
+def _month_bounds(month: str):
+    """YYYYMM -> (월 첫날, 다음 달 첫날)"""
+    year, mon = int(month[:4]), int(month[4:6])
+    first = date(year, mon, 1)
+    following = date(year + mon // 12, mon % 12 + 1, 1)
+    return first, following
+
+
+class ColumnarStore:
+    """데이터셋/경마장/월 단위 Arrow/Parquet 파티션 보관소"""
+
+    def __init__(self, root: str = None):
+        if pa is None:
+            raise ImportError('pyarrow 패키지가 설치되어 있지 않습니다 (pip install pyarrow)')
+        self.root = str(root or getattr(settings, 'KRA_EXPORT_DIR', None)
+                        or os.path.join(settings.BASE_DIR, 'export', 'kra'))
+
+    # ---- 스키마 ----
+
+    @staticmethod
+    def schema(dataset: str) -> 'pa.Schema':
+        """데이터셋 스키마"""
+        _, columns = DATASETS[dataset]
+        fields = [pa.field(name, getattr(pa, type_name)()) for name, _, type_name in columns]
+        fields += [pa.field(name, getattr(pa, type_name)())
+                   for name, _, _, type_name in _DERIVED_COLUMNS.get(dataset, [])]
+        return pa.schema(fields)
+
+    def partition_path(self, dataset: str, meet: int, month: str, fmt: str = 'arrow') -> str:
+        """파티션 파일 경로"""
+        return os.path.join(self.root, dataset, f"meet={meet}", f"{month}.{fmt}")
+
+    def has_partition(self, dataset: str, meet: int, month: str, fmt: str = 'arrow') -> bool:
+        return os.path.exists(self.partition_path(dataset, meet, month, fmt))
+
+    # ---- 내보내기 ----
+
+    def build_table(self, dataset: str, meet: int, month: str) -> 'pa.Table':
+        """로컬 저장소에서 한 파티션(경마장 x 월)을 읽어 타입이 지정된 테이블로 변환"""
+        from .. import models
+
+        model_name, columns = DATASETS[dataset]
+        model = getattr(models, model_name)
+        first, following = _month_bounds(month)
+        rows = (
+            model.objects.filter(meet=meet, rc_date__gte=first, rc_date__lt=following)
+            .order_by(*model._meta.ordering)
+            .values_list(*[field for _, field, _ in columns])
+        )
+
+        values: Dict[str, List] = {name: [] for name, _, _ in columns}
+        names = list(values)
+        for row in rows.iterator(chunk_size=5000):
+            for name, value in zip(names, row):
+                values[name].append(value)
+
+        for name, source, convert, _ in _DERIVED_COLUMNS.get(dataset, []):
+            values[name] = [convert(value) for value in values[source]]
+
+        schema = self.schema(dataset)
+        return pa.Table.from_arrays(
+            [pa.array(values[field.name], type=field.type) for field in schema],
+            schema=schema,
+        )
+
+    def write_table(self, table: 'pa.Table', dataset: str, meet: int, month: str,
+                    fmt: str = 'arrow') -> str:
+        """
+        파티션 파일 기록 (임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 항상 완전한 파일을 봄)
+
+        Returns:
+            기록한 파일 경로
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {fmt}")
+        path = self.partition_path(dataset, meet, month, fmt)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        if fmt == 'arrow':
+            # 압축하지 않아야 메모리 매핑 후 복사 없이 사용 가능
+            with pa.OSFile(tmp_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        else:
+            pq.write_table(table, tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+        return path
+
+    def export(self, dataset: str, meet: int, month: str,
+               formats: Iterable[str] = ('arrow',)) -> int:
+        """
+        한 파티션 내보내기 (데이터가 없으면 파일을 만들지 않음)
+
+        Returns:
+            행 수
+        """
+        table = self.build_table(dataset, meet, month)
+        if table.num_rows:
+            for fmt in formats:
+                self.write_table(table, dataset, meet, month, fmt)
+        logger.info(f"열 지향 내보내기 {dataset} {meet} {month}: {table.num_rows}행")
+        return table.num_rows
+
+    # ---- 읽기 ----
+
+    def partitions(self, dataset: str, meets: Iterable[int] = None, start_month: str = None,
+                   end_month: str = None, fmt: str = 'arrow') -> List[str]:
+        """조건에 맞는 파티션 파일 경로 (경마장, 월 순)"""
+        base = os.path.join(self.root, dataset)
+        if not os.path.isdir(base):
+            return []
+        wanted = {int(meet) for meet in meets} if meets else None
+        paths = []
+        for meet_dir in sorted(os.listdir(base)):
+            if not meet_dir.startswith('meet='):
+                continue
+            if wanted is not None and int(meet_dir[5:]) not in wanted:
+                continue
+            suffix = f".{fmt}"
+            for name in sorted(os.listdir(os.path.join(base, meet_dir))):
+                if not name.endswith(suffix):
+                    continue
+                month = name[:-len(suffix)]
+                if (start_month and month < start_month) or (end_month and month > end_month):
+                    continue
+                paths.append(os.path.join(base, meet_dir, name))
+        return paths
+
+    def load(self, dataset: str, meets: Iterable[int] = None, start_month: str = None,
+             end_month: str = None, columns: List[str] = None, fmt: str = 'arrow') -> 'pa.Table':
+        """
+        파티션들을 하나의 테이블로 읽기
+
+        arrow 형식은 파일을 메모리 매핑하므로 열 데이터가 페이지 캐시를 그대로 가리키며
+        (복사 없음), 파티션들은 복사 없이 청크로 이어 붙인다.
+
+        Args:
+            dataset: schedules/entries/results/records
+            meets: 경마장 코드 목록 (기본: 전체)
+            start_month, end_month: 조회 월 범위 YYYYMM (포함)
+            columns: 읽을 열 (기본: 전체)
+            fmt: 'arrow' 또는 'parquet'
+        """
+        tables = []
+        for path in self.partitions(dataset, meets, start_month, end_month, fmt):
+            if fmt == 'arrow':
+                table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+                if columns:
+                    table = table.select(columns)
+            else:
+                table = pq.read_table(path, columns=columns, memory_map=True)
+            tables.append(table)
+
+        if not tables:
+            schema = self.schema(dataset)
+            if columns:
+                schema = pa.schema([schema.field(name) for name in columns])
+            return schema.empty_table()
+        return pa.concat_tables(tables)
+
+    def load_frame(self, dataset: str, **kwargs):
+        """
+        pandas DataFrame으로 읽기
+
+        결측이 없는 수치 열이 파티션 하나에 들어 있으면 메모리 매핑된 버퍼를 그대로 사용한다.
+        """
+        table = self.load(dataset, **kwargs)
+        return table.to_pandas(split_blocks=True, date_as_object=False)
+
+    def load_arrays(self, dataset: str, **kwargs) -> Dict[str, 'object']:
+        """
+        열 이름 -> NumPy 배열로 읽기
+
+        결측이 없는 정수/실수 열이 파티션 하나에 들어 있으면 복사 없는 읽기 전용 배열,
+        그 외(여러 파티션, 결측, 날짜, 문자열)는 한 번 복사해 변환한다.
+        """
+        table = self.load(dataset, **kwargs)
+        arrays = {}
+        for name, column in zip(table.column_names, table.columns):
+            if (column.num_chunks == 1 and column.null_count == 0
+                    and (pa.types.is_integer(column.type) or pa.types.is_floating(column.type))):
+                arrays[name] = column.chunk(0).to_numpy(zero_copy_only=True)
+            else:
+                arrays[name] = column.to_numpy()
+        return arrays
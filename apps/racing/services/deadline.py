@@ -0,0 +1,118 @@
+"""
+요청 마감 시간과 지연 시간 통계
+
+- Deadline: 뷰가 정한 응답 마감 시각. upstream 타임아웃/재시도/대기가 이를 넘지 않도록 한다.
+- LatencyTracker: 엔드포인트별 최근 응답 시간으로 p95 계산 (헤지 요청 기준)
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+
+class DeadlineExceeded(Exception):
+    """마감 시간이 지나 요청을 보내지 않음"""
+
+
+class Deadline:
+    """monotonic 시계 기준 마감 시각"""
+    
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+    
+    @classmethod
+    def after(cls, seconds: Optional[float]) -> Optional['Deadline']:
+        """seconds 초 뒤 마감 (None이면 마감 없음)"""
+        return cls(seconds) if seconds else None
+    
+    def remaining(self) -> float:
+        """남은 시간(초), 지났으면 0"""
+        return max(0.0, self.expires_at - time.monotonic())
+    
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+    
+    def timeout(self, cap: float) -> float:
+        """cap과 남은 시간 중 짧은 쪽 (소켓 타임아웃 등에 사용)"""
+        return min(cap, self.remaining())
+    
+    def __repr__(self):
+        return f"Deadline(remaining={self.remaining():.2f}s)"
+
+
+class LatencyTracker:
+    """엔드포인트별 최근 응답 시간 통계"""
+    
+    WINDOW = 200        # 보관할 최근 표본 수
+    MIN_SAMPLES = 20    # 백분위를 계산할 최소 표본 수
+    
+    def __init__(self, window: int = None, min_samples: int = None):
+        self.window = window or self.WINDOW
+        self.min_samples = min_samples or self.MIN_SAMPLES
+        self._samples: Dict[str, deque] = {}
+        self._hedges: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, endpoint: str, seconds: float):
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+    
+    def record_hedge(self, endpoint: str, won: bool):
+        """헤지 요청 전송/승리 횟수 집계"""
+        with self._lock:
+            counters = self._hedges.setdefault(endpoint, {'sent': 0, 'won': 0})
+            counters['sent'] += 1
+            if won:
+                counters['won'] += 1
+    
+    def percentile(self, endpoint: str, pct: float = 95) -> Optional[float]:
+        """최근 응답 시간의 백분위(초), 표본이 부족하면 None"""
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(len(samples) - 1, math.ceil(len(samples) * pct / 100) - 1)
+        return samples[index]
+    
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            endpoints = list(self._samples.keys())
+        result = {}
+        for endpoint in endpoints:
+            p50 = self.percentile(endpoint, 50)
+            p95 = self.percentile(endpoint, 95)
+            result[endpoint] = {
+                'samples': len(self._samples[endpoint]),
+                'p50': round(p50, 3) if p50 is not None else None,
+                'p95': round(p95, 3) if p95 is not None else None,
+                'hedges': dict(self._hedges.get(endpoint, {'sent': 0, 'won': 0})),
+            }
+        return result
+
+
+# 프로세스 공용 인스턴스
+_latency_tracker = LatencyTracker()
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_lock = threading.Lock()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """프로세스 공용 응답 시간 통계 반환"""
+    return _latency_tracker
+
+
+def get_hedge_executor() -> ThreadPoolExecutor:
+    """헤지 요청용 공용 스레드 풀 반환"""
+    global _hedge_executor
+    if _hedge_executor is None:
+        with _hedge_lock:
+            if _hedge_executor is None:
+                _hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='kra-hedge')
+    return _hedge_executor
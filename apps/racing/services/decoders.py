@@ -0,0 +1,285 @@
+"""
+한국마사회 API 응답 디코더
+
+- XMLStreamDecoder: XMLPullParser 기반 증분 파서. 소켓에서 청크가 들어오는
+  대로 item 딕셔너리를 만들고 처리한 요소는 부모에서 떼어 내 전체 트리를 만들지 않는다.
+- JSONDecoder: orjson(설치된 경우) 또는 json 으로 한 번에 파싱
+- 엔드포인트별 응답 형식(xml/json) 선호도는 벤치마크 결과를 공유 캐시에 저장해 사용
+"""
+
+import json
+import logging
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+SOAP_FAULT_TAG = '{http://schemas.xmlsoap.org/soap/envelope/}Fault'
+
+# 지원 응답 형식
+FORMATS = ('xml', 'json')
+DEFAULT_FORMAT = 'xml'
+
+# 데이터 없음 결과 코드 (오류가 아닌 빈 결과)
+NO_DATA_CODE = '03'
+
+
+class DecodeError(ValueError):
+    """응답 본문을 해석할 수 없음"""
+
+
+class KRAAPIError(Exception):
+    """API가 오류 코드로 응답함 (data.go.kr 공통 resultCode)"""
+    
+    # 일시적 오류 (재시도 대상): 어플리케이션/DB/HTTP/서비스 타임아웃/기타 오류
+    RETRYABLE_CODES = {'01', '02', '04', '05', '99'}
+    # 요청 자체의 문제 (재시도/서킷 브레이커 집계 제외): 잘못된 파라미터, 필수값 누락, 없는 서비스
+    CLIENT_ERROR_CODES = {'10', '11', '12'}
+    
+    def __init__(self, code: str, message: str = None):
+        self.code = code
+        self.message = message or '알 수 없는 오류'
+        super().__init__(f"{code} - {self.message}")
+    
+    @property
+    def retryable(self) -> bool:
+        return self.code in self.RETRYABLE_CODES
+    
+    @property
+    def client_error(self) -> bool:
+        return self.code in self.CLIENT_ERROR_CODES
+
+
+class KRAResponseDecoder:
+    """응답 디코더 베이스 클래스"""
+    
+    format = None
+    
+    def iter_items(self, chunks: Iterable[bytes], meta: Dict[str, Any]) -> Iterator[Dict]:
+        """
+        응답 청크에서 item 딕셔너리를 순서대로 반환
+        
+        Args:
+            chunks: 응답 본문 바이트 청크
+            meta: 결과 코드/페이징 정보가 채워질 딕셔너리
+        """
+        raise NotImplementedError
+    
+    def decode(self, chunks: Iterable[bytes]) -> Dict:
+        """
+        응답 전체를 페이지 데이터로 변환
+        
+        Returns:
+            {'items', 'totalCount', 'pageNo', 'numOfRows'}
+            
+        Raises:
+            KRAAPIError: API 오류 코드 응답 (데이터 없음 '03'은 빈 결과로 처리)
+            DecodeError: 응답 구조를 해석할 수 없는 경우
+        """
+        meta = {}
+        items = list(self.iter_items(chunks, meta))
+        
+        if meta.get('fault'):
+            raise KRAAPIError('99', f"SOAP Fault: {meta['fault']}")
+        
+        result_code = meta.get('resultCode')
+        if result_code == NO_DATA_CODE:
+            return {'items': [], 'totalCount': 0, 'pageNo': 1, 'numOfRows': 0}
+        if result_code is not None and result_code != '00':
+            raise KRAAPIError(result_code, meta.get('resultMsg'))
+        
+        if not meta.get('has_body'):
+            raise DecodeError('응답에서 header 또는 body를 찾을 수 없음')
+        
+        return {
+            'items': items,
+            'totalCount': _to_int(meta.get('totalCount'), len(items)),
+            'pageNo': _to_int(meta.get('pageNo'), 1),
+            'numOfRows': _to_int(meta.get('numOfRows'), len(items)),
+        }
+
+
+class XMLStreamDecoder(KRAResponseDecoder):
+    """증분 XML 디코더"""
+    
+    format = 'xml'
+    
+    # item 밖에서 값을 읽을 요소
+    META_TAGS = {
+        'resultCode', 'resultMsg', 'totalCount', 'pageNo', 'numOfRows',
+        # data.go.kr 공통 오류 응답 (cmmMsgHeader)
+        'returnReasonCode', 'returnAuthMsg', 'errMsg', 'faultstring',
+    }
+    
+    def iter_items(self, chunks: Iterable[bytes], meta: Dict[str, Any]) -> Iterator[Dict]:
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        depth_in_item = 0
+        # 열려 있는 요소 (처리한 item을 부모에서 떼어 내기 위함)
+        path = []
+        
+        for chunk in chunks:
+            if not chunk:
+                continue
+            try:
+                parser.feed(chunk)
+                events = list(parser.read_events())
+            except ET.ParseError as e:
+                raise DecodeError(str(e))
+            
+            for event, elem in events:
+                tag = elem.tag
+                if event == 'start':
+                    path.append(elem)
+                    if tag == 'item':
+                        depth_in_item += 1
+                    elif tag == 'body':
+                        meta['has_body'] = True
+                    elif tag == SOAP_FAULT_TAG:
+                        meta['fault'] = meta.get('fault') or 'SOAP Fault'
+                    continue
+                
+                path.pop()
+                if tag == 'item':
+                    depth_in_item -= 1
+                    item = {child.tag: child.text for child in elem}
+                    # 처리한 item은 비우고 부모에서 떼어 내 트리가 행 수만큼 커지지 않도록 함
+                    elem.clear()
+                    if path:
+                        path[-1].remove(elem)
+                    yield item
+                elif not depth_in_item and tag in self.META_TAGS:
+                    meta[tag] = elem.text
+        
+        try:
+            parser.close()
+        except ET.ParseError as e:
+            raise DecodeError(str(e))
+        
+        if meta.get('faultstring'):
+            meta['fault'] = meta['faultstring']
+        # 공통 오류 응답은 resultCode 형식으로 맞춤
+        if 'returnReasonCode' in meta and 'resultCode' not in meta:
+            meta['resultCode'] = meta['returnReasonCode']
+            meta['resultMsg'] = meta.get('returnAuthMsg') or meta.get('errMsg')
+
+
+class JSONDecoder(KRAResponseDecoder):
+    """JSON 디코더 (orjson 사용 가능 시 orjson)"""
+    
+    format = 'json'
+    
+    def iter_items(self, chunks: Iterable[bytes], meta: Dict[str, Any]) -> Iterator[Dict]:
+        content = b''.join(chunks)
+        try:
+            data = orjson.loads(content) if orjson is not None else json.loads(content)
+        except ValueError as e:
+            raise DecodeError(str(e))
+        
+        response = data.get('response') if isinstance(data, dict) else None
+        if not isinstance(response, dict):
+            raise DecodeError(f"응답 구조 오류: {str(data)[:200]}")
+        
+        header = response.get('header') or {}
+        body = response.get('body')
+        meta['resultCode'] = header.get('resultCode', '00')
+        meta['resultMsg'] = header.get('resultMsg')
+        if not isinstance(body, dict):
+            return
+        
+        meta['has_body'] = True
+        for key in ('totalCount', 'pageNo', 'numOfRows'):
+            meta[key] = body.get(key)
+        
+        # items를 XML 응답과 같은 리스트 형태로 정규화
+        items = body.get('items') or []
+        if isinstance(items, dict):
+            items = items.get('item') or []
+        if isinstance(items, dict):
+            items = [items]
+        
+        for item in items:
+            # XML 응답과 같이 값은 문자열로 통일
+            yield {k: (None if v is None else str(v)) for k, v in item.items()}
+
+
+DECODERS = {
+    'xml': XMLStreamDecoder(),
+    'json': JSONDecoder(),
+}
+
+
+def sniff_format(first_chunk: bytes) -> str:
+    """응답 첫 바이트로 형식 판별 (json 요청에도 오류는 XML로 오는 경우가 있음)"""
+    head = first_chunk.lstrip()[:1]
+    if head in (b'{', b'['):
+        return 'json'
+    return 'xml'
+
+
+def decode_response(chunks: Iterable[bytes]) -> Dict:
+    """
+    응답 청크를 형식에 맞는 디코더로 변환
+    
+    Raises:
+        KRAAPIError: API 오류 코드 응답
+        DecodeError: 본문을 해석할 수 없는 경우
+    """
+    iterator = iter(chunks)
+    first_chunk = b''
+    for chunk in iterator:
+        if chunk.strip():
+            first_chunk = chunk
+            break
+    if not first_chunk:
+        raise DecodeError('빈 응답')
+    
+    def _chained():
+        yield first_chunk
+        yield from iterator
+    
+    return DECODERS[sniff_format(first_chunk)].decode(_chained())
+
+
+def _to_int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _format_key(endpoint: str) -> str:
+    return f"kra_decoder_format:{endpoint}"
+
+
+def get_preferred_format(endpoint: str) -> str:
+    """
+    엔드포인트별 요청 형식 반환
+    
+    우선순위: settings.KRA_RESPONSE_FORMATS > 벤치마크 결과(공유 캐시) > xml
+    """
+    from django.conf import settings
+    from .response_cache import get_response_cache
+    
+    configured = getattr(settings, 'KRA_RESPONSE_FORMATS', {}).get(endpoint)
+    if configured in FORMATS:
+        return configured
+    
+    measured = get_response_cache().get(_format_key(endpoint))
+    if measured in FORMATS:
+        return measured
+    return DEFAULT_FORMAT
+
+
+def set_preferred_format(endpoint: str, fmt: str):
+    """벤치마크로 선택한 형식을 공유 캐시에 저장 (만료 없음)"""
+    from .response_cache import get_response_cache
+    
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    get_response_cache().set(_format_key(endpoint), fmt, None)
@@ -0,0 +1,352 @@
+"""
+경주마 최근 성적 특성 저장소 (feature store)
+
+로컬 저장소의 경주 성적(Result)을 경주마(hrNo)별 최근 성적 특성으로 미리 누적해 두고,
+예측 시에는 경주 출전마 전체를 한 번의 조회로 읽는다 (요청 시 과거 성적을 훑지 않음).
+
+- 누적: 성적이 적재될 때 아직 반영하지 않은 경주만 더함 (HorseFormRace로 중복 방지)
+  통산 출전/1착/3착 이내 수, 최근 RECENT_RACES개 출전(착순/거리), 최근 출전일,
+  거리 구간별/경마장별 [출전, 1착]
+- 순서: 과거 성적이 나중에 적재되어도 최근 출전 목록은 경주일자 순으로 끼워 넣음
+- 조회: get_many(마번 목록) -> 마번별 특성 딕셔너리 (기록이 없는 말은 빠짐)
+- 시점: 누적할 때 경주일마다 그 날짜 전 특성을 스냅샷(HorseFormSnapshot)으로 남겨 두고,
+  기준일(as_of) 당일/이후 출전이 이미 누적된 말은 스냅샷을 읽음 (지난 경주의 출전표에 그 경주와
+  이후 결과가 섞이지 않음, 요청 시 과거 성적을 다시 훑지 않음). 과거 성적을 나중에 적재해
+  스냅샷이 어긋나면 build_horse_forms --rebuild로 다시 만든다.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from django.db import router, transaction
+from django.utils import timezone
+
+from .ratings import RaceKey
+from .response_cache import get_response_cache
+
+
+logger = logging.getLogger(__name__)
+
+# 거리 구간 (상한 m, 이름), 마지막 구간 초과는 'long'
+DISTANCE_BUCKETS = ((1200, 'sprint'), (1600, 'mile'), (2000, 'middle'))
+
+
+def distance_bucket(distance: Optional[int]) -> Optional[str]:
+    """경주거리 -> 거리 구간 이름 (거리를 모르면 None)"""
+    if not distance:
+        return None
+    for upper, name in DISTANCE_BUCKETS:
+        if distance <= upper:
+            return name
+    return 'long'
+
+
+def _int(value) -> Optional[int]:
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_date(value) -> Optional[date]:
+    try:
+        return datetime.strptime(str(value).strip()[:8], '%Y%m%d').date()
+    except (TypeError, ValueError):
+        return None
+
+
+class HorseFormStore:
+    """경주마별 최근 성적 특성 저장소"""
+
+    RECENT_RACES = 10
+    VERSION_KEY = 'kra_horse_form:version'
+
+    def __init__(self):
+        self.cache = get_response_cache()
+
+    # ---- 조회 ----
+
+    def version(self):
+        """누적 값 버전 (성적 반영 시 바뀜, 예측 캐시 키에 사용)"""
+        return self.cache.get(self.VERSION_KEY, l1=False)
+
+    def get_many(self, hr_nos: Iterable[str], as_of: date = None) -> Dict[str, Dict]:
+        """
+        마번 목록의 기준일 시점 특성 (기준일 전 출전만 반영)
+
+        Args:
+            hr_nos: 마번 목록
+            as_of: 기준일 (경주일자, 기본: 오늘)
+
+        Returns:
+            {마번: 특성 딕셔너리} (기준일 전 기록이 없는 말은 빠짐)
+        """
+        return {hr_no: form for hr_no, form in self._features_as_of(hr_nos, as_of or date.today()).items() if form}
+
+    def _features_as_of(self, hr_nos: Iterable[str], as_of: date) -> Dict[str, Dict]:
+        """
+        기준일 시점 특성 (누적 값 한 번 조회, 기준일 당일/이후 출전이 누적된 말만 스냅샷 조회)
+
+        스냅샷이 없는 말은 빈 딕셔너리 (이후 결과가 섞인 누적 값은 쓰지 않음)
+        """
+        from ..models import HorseFormSnapshot
+
+        result, stale = {}, []
+        for hr_no, form in self._load(hr_nos).items():
+            if form.last_date and form.last_date >= as_of:
+                stale.append(hr_no)
+            else:
+                result[hr_no] = self.features(form, as_of)
+        if stale:
+            snapshots = dict(
+                HorseFormSnapshot.objects.filter(hr_no__in=stale, rc_date=as_of).values_list('hr_no', 'features')
+            )
+            for hr_no in stale:
+                result[hr_no] = snapshots.get(hr_no) or {}
+        return result
+
+    @staticmethod
+    def _load(hr_nos: Iterable[str]) -> Dict[str, object]:
+        from ..models import HorseForm
+
+        hr_nos = {str(hr_no).strip() for hr_no in hr_nos if hr_no}
+        if not hr_nos:
+            return {}
+        return {form.hr_no: form for form in HorseForm.objects.filter(hr_no__in=hr_nos)}
+
+    @staticmethod
+    def features(form, as_of: date) -> Dict:
+        """누적 값 -> 예측용 특성"""
+        recent_ords = [run[3] for run in form.recent]
+        return {
+            'starts': form.starts,
+            'wins': form.wins,
+            'places': form.places,
+            'win_rate': form.wins / form.starts if form.starts else 0.0,
+            'place_rate': form.places / form.starts if form.starts else 0.0,
+            'recent_ords': recent_ords,
+            'recent_races': float(len(recent_ords)),
+            'recent_wins': float(sum(1 for ord_ in recent_ords if ord_ == 1)),
+            'recent_avg_ord': sum(recent_ords) / len(recent_ords) if recent_ords else None,
+            'days_since_last': (as_of - form.last_date).days if form.last_date else None,
+            'distance_stats': form.distance_stats,
+            'track_stats': form.track_stats,
+        }
+
+    def attach(self, runners: Sequence) -> Sequence:
+        """
+        출전표 레코드에 경주일자 시점 특성 연결 (runner.form, 기록이 없으면 빈 딕셔너리)
+
+        item의 경주일자(rcDate, 없으면 오늘) 전 출전만 반영한다. 성적 레코드는 특성을 쓰지 않으므로
+        조회하지 않고 빈 딕셔너리를 둔다. 이미 연결된 레코드는 다시 조회하지 않으며, 조회 실패 시에는
+        연결하지 않는다(기본값 사용).
+        """
+        by_date = defaultdict(list)
+        for runner in runners:
+            if runner.form is not None:
+                continue
+            if not runner.is_entry:
+                runner.form = {}
+            elif runner.hr_no:
+                by_date[_parse_date(runner.item.get('rcDate')) or date.today()].append(runner)
+
+        for as_of, pending in by_date.items():
+            try:
+                forms = self._features_as_of((runner.hr_no for runner in pending), as_of)
+            except Exception as e:
+                logger.warning(f"경주마 최근 성적 조회 실패 (기본값 사용): {str(e)}")
+                continue
+            for runner in pending:
+                runner.form = forms.get(str(runner.hr_no).strip(), {})
+        return runners
+
+    # ---- 갱신 ----
+
+    def apply_races(self, race_keys: Iterable[RaceKey]) -> int:
+        """
+        경주 성적을 경주마별로 누적 (이미 반영한 경주와 1착이 없는 미완료 경주는 건너뜀)
+
+        Args:
+            race_keys: (경마장, 경주일자, 경주번호) 목록
+
+        Returns:
+            새로 반영한 경주 수
+        """
+        from ..models import HorseForm, HorseFormRace, HorseFormSnapshot, Race, Result
+
+        race_keys = set(race_keys)
+        if not race_keys:
+            return 0
+        meets = {key[0] for key in race_keys}
+        dates = {key[1] for key in race_keys}
+
+        with transaction.atomic(using=router.db_for_write(HorseFormRace)):
+            applied = set(
+                HorseFormRace.objects.filter(meet__in=meets, rc_date__in=dates)
+                .values_list('meet', 'rc_date', 'rc_no')
+            )
+            pending = race_keys - applied
+            if not pending:
+                return 0
+
+            distances = {
+                (meet, rc_date, rc_no): rc_dist
+                for meet, rc_date, rc_no, rc_dist in Race.objects.filter(meet__in=meets, rc_date__in=dates)
+                .values_list('meet', 'rc_date', 'rc_no', 'rc_dist')
+            }
+            races = defaultdict(list)
+            rows = Result.objects.filter(meet__in=meets, rc_date__in=dates).values_list(
+                'meet', 'rc_date', 'rc_no', 'horse_id', 'ord', 'raw'
+            )
+            for meet, rc_date, rc_no, hr_no, ord_, raw in rows:
+                race_key = (meet, rc_date, rc_no)
+                if race_key in pending:
+                    distance = distances.get(race_key) or _int((raw or {}).get('rcDist'))
+                    races[race_key].append((hr_no, ord_, distance))
+
+            # 1착이 있는 경주만 완료로 보고 반영 (착순이 없는 행은 출전 취소 등으로 제외)
+            runs = defaultdict(list)
+            finished = []
+            for (meet, rc_date, rc_no), runners in races.items():
+                if not any(ord_ == 1 for _, ord_, _ in runners):
+                    continue
+                finished.append((meet, rc_date, rc_no))
+                for hr_no, ord_, distance in runners:
+                    if hr_no and ord_:
+                        runs[hr_no].append((rc_date, meet, rc_no, ord_, distance))
+
+            existing = {form.hr_no: form for form in HorseForm.objects.filter(hr_no__in=list(runs))}
+            updated, created, snapshots = [], [], []
+            for hr_no, horse_runs in runs.items():
+                form = existing.get(hr_no)
+                if form is None:
+                    form = HorseForm(hr_no=hr_no, recent=[], distance_stats={}, track_stats={})
+                    created.append(form)
+                else:
+                    updated.append(form)
+                # 경주일 순으로 더하면서 그 날짜 전 특성을 스냅샷으로 남김
+                # (이미 더 최근 출전이 누적된 경우는 시점 특성을 알 수 없으므로 남기지 않음)
+                by_day = defaultdict(list)
+                for run in horse_runs:
+                    by_day[run[0]].append(run)
+                for rc_date in sorted(by_day):
+                    if form.last_date is None or form.last_date < rc_date:
+                        snapshots.append(HorseFormSnapshot(
+                            hr_no=hr_no, rc_date=rc_date,
+                            features=self.features(form, rc_date) if form.starts else {},
+                        ))
+                    self._fold(form, by_day[rc_date])
+            HorseForm.objects.bulk_update(
+                updated, ['starts', 'wins', 'places', 'last_date', 'recent', 'distance_stats', 'track_stats',
+                          'updated_at'],
+                batch_size=500,
+            )
+            HorseForm.objects.bulk_create(created, batch_size=500)
+            HorseFormSnapshot.objects.bulk_create(snapshots, batch_size=500, ignore_conflicts=True)
+            HorseFormRace.objects.bulk_create([
+                HorseFormRace(meet=meet, rc_date=rc_date, rc_no=rc_no) for meet, rc_date, rc_no in finished
+            ])
+
+        if finished:
+            self.cache.set(self.VERSION_KEY, time.time(), None, l1=False)
+            logger.info(f"경주마 최근 성적 반영: 경주 {len(finished)}개, 경주마 {len(runs)}두")
+        return len(finished)
+
+    def _fold(self, form, runs: List[tuple]):
+        """경주마 한 두의 새 출전 기록을 누적 값에 더함"""
+        recent = [tuple(run) for run in form.recent]
+        for rc_date, meet, rc_no, ord_, distance in runs:
+            form.starts += 1
+            form.wins += ord_ == 1
+            form.places += ord_ <= 3
+            if form.last_date is None or rc_date > form.last_date:
+                form.last_date = rc_date
+            recent.append((rc_date.isoformat(), meet, rc_no, ord_, distance))
+
+            for stats, key in ((form.distance_stats, distance_bucket(distance)), (form.track_stats, str(meet))):
+                if key is None:
+                    continue
+                counts = stats.setdefault(key, [0, 0])
+                counts[0] += 1
+                counts[1] += ord_ == 1
+
+        recent.sort(key=lambda run: (run[0], run[1], run[2]), reverse=True)
+        form.recent = [list(run) for run in recent[:self.RECENT_RACES]]
+        form.updated_at = timezone.now()
+
+    def apply_pending(self, batch_days: int = 30) -> int:
+        """로컬 저장소의 성적 중 아직 반영하지 않은 경주를 모두 반영 (경주일 순)"""
+        from ..models import HorseFormRace, Result
+
+        applied = set(HorseFormRace.objects.values_list('meet', 'rc_date', 'rc_no'))
+        pending = set(Result.objects.values_list('meet', 'rc_date', 'rc_no').distinct()) - applied
+
+        by_date = defaultdict(list)
+        for race_key in pending:
+            by_date[race_key[1]].append(race_key)
+
+        count = 0
+        days = sorted(by_date)
+        for i in range(0, len(days), batch_days):
+            count += self.apply_races(key for day in days[i:i + batch_days] for key in by_date[day])
+        return count
+
+    def rebuild(self) -> int:
+        """누적 값과 스냅샷을 지우고 전체 성적으로 다시 계산 (경주일 순)"""
+        from ..models import HorseForm, HorseFormRace, HorseFormSnapshot
+
+        with transaction.atomic(using=router.db_for_write(HorseFormRace)):
+            HorseForm.objects.all().delete()
+            HorseFormRace.objects.all().delete()
+            HorseFormSnapshot.objects.all().delete()
+        return self.apply_pending()
+
+
+class FormReplay:
+    """
+    메모리에서 성적을 경주일 순으로 더해 가는 누적기 (저장하지 않음)
+
+    과거 경주 전체를 시점별 특성으로 만들 때(학습 데이터) 경주일마다 features()로 그 날짜 전
+    특성을 읽은 뒤 그 날짜의 성적을 add()로 더한다. 누적 방식은 저장소와 같다.
+    """
+
+    def __init__(self, store: HorseFormStore = None):
+        self.store = store or get_horse_form_store()
+        self.forms: Dict[str, object] = {}
+
+    def features(self, hr_no: str, as_of: date) -> Dict:
+        """지금까지 더한 성적의 특성 (기록이 없으면 빈 딕셔너리)"""
+        form = self.forms.get(str(hr_no).strip())
+        return self.store.features(form, as_of) if form is not None else {}
+
+    def add(self, runs: Iterable[tuple]):
+        """출전 기록 더하기 [(마번, 경주일자, 경마장, 경주번호, 착순, 거리), ...] (착순이 있는 완료 경주)"""
+        from ..models import HorseForm
+
+        by_horse = defaultdict(list)
+        for hr_no, rc_date, meet, rc_no, ord_, distance in runs:
+            by_horse[str(hr_no).strip()].append((rc_date, meet, rc_no, ord_, distance))
+        for hr_no, horse_runs in by_horse.items():
+            form = self.forms.get(hr_no)
+            if form is None:
+                form = self.forms[hr_no] = HorseForm(hr_no=hr_no, recent=[], distance_stats={}, track_stats={})
+            self.store._fold(form, horse_runs)
+
+
+# 프로세스 공용 인스턴스
+_horse_form_store: Optional[HorseFormStore] = None
+_horse_form_store_lock = threading.Lock()
+
+
+def get_horse_form_store() -> HorseFormStore:
+    """프로세스 공용 경주마 최근 성적 저장소 반환"""
+    global _horse_form_store
+    if _horse_form_store is None:
+        with _horse_form_store_lock:
+            if _horse_form_store is None:
+                _horse_form_store = HorseFormStore()
+    return _horse_form_store
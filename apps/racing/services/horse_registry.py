@@ -0,0 +1,210 @@
+"""
+경주마 등록부 로컬 미러
+
+경주마 상세정보(raceHorseInfo_2)를 경마장별로 로컬 DB(Horse)에 미러링하고,
+프로세스 메모리에 마번/마명 색인을 두어 상세정보 조회를 upstream 호출 없이 처리한다.
+
+- 동기화: 전체 페이지를 스트리밍으로 받아 행 해시가 바뀐 말만 upsert (sync_horses 명령으로 주기 실행)
+- 색인: 동기화가 끝나면 공유 캐시의 버전을 올리고, 각 워커는 버전이 바뀐 경마장만 다시 읽음
+- 등록부에 없는 말만 upstream으로 조회해 미러에 추가
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .ingestion import KRAIngestionService, row_hash
+from .name_index import get_name_index
+from .response_cache import get_response_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+class _MeetIndex:
+    """경마장 하나의 메모리 색인"""
+
+    __slots__ = ('by_no', 'by_name', 'version', 'checked_at')
+
+    def __init__(self, version):
+        self.by_no: Dict[str, Dict] = {}
+        self.by_name: Dict[str, List[str]] = {}
+        self.version = version
+        self.checked_at = time.monotonic()
+
+    def add(self, hr_no: str, hr_name: str, item: Dict):
+        previous = self.by_no.get(hr_no)
+        previous_name = str(previous.get('hrName', '')).strip() if previous is not None else None
+        if previous_name is not None and previous_name != hr_name:
+            names = self.by_name.get(previous_name, [])
+            if hr_no in names:
+                names.remove(hr_no)
+        self.by_no[hr_no] = item
+        names = self.by_name.setdefault(hr_name, [])
+        if hr_no not in names:
+            names.append(hr_no)
+
+
+class HorseRegistry:
+    """경주마 등록부 (로컬 DB 미러 + 메모리 색인)"""
+
+    VERSION_CHECK_INTERVAL = 30  # 다른 워커의 동기화 여부 확인 주기(초)
+
+    def __init__(self):
+        self.cache = get_response_cache()
+        self._indexes: Dict[int, _MeetIndex] = {}
+        self._lock = threading.Lock()
+
+    # ---- 조회 ----
+
+    def get(self, meet: int, hr_no: str) -> Optional[Dict]:
+        """마번으로 상세정보 조회 (등록부에 없으면 None)"""
+        item = self._index(meet).by_no.get(str(hr_no))
+        return dict(item) if item is not None else None
+
+    def find_by_name(self, meet: int, hr_name: str) -> List[Dict]:
+        """마명으로 상세정보 조회 (동명마가 있으면 여러 건)"""
+        index = self._index(meet)
+        return [dict(index.by_no[hr_no]) for hr_no in index.by_name.get(hr_name.strip(), [])]
+
+    def lookup(self, api_service, meet: int, hr_no: str = None, hr_name: str = None) -> List[Dict]:
+        """
+        마번/마명으로 상세정보 조회, 등록부에 없는 말만 upstream 조회 후 미러에 추가
+
+        Args:
+            api_service: upstream 조회에 사용할 KRAAPIService
+            meet: 경마장 코드
+            hr_no: 마번
+            hr_name: 마명 (마번이 없을 때 사용)
+
+        Returns:
+            경주마 상세정보 리스트
+        """
+        if hr_no:
+            item = self.get(meet, hr_no)
+            if item is not None:
+                return [item]
+            horses = api_service.get_horse_info(meet=meet, hr_no=hr_no)
+        else:
+            horses = self.find_by_name(meet, hr_name)
+            if horses:
+                return horses
+            # 등록부에 없는 이름: 전체 등록마(캐시된 전체 페이지)에서 찾음
+            horses = [h for h in api_service.get_horse_info(meet=meet) if h.get('hrName') == hr_name]
+
+        if horses:
+            self.add(api_service, meet, horses)
+        return horses
+
+    # ---- 갱신 ----
+
+    def add(self, api_service, meet: int, items: List[Dict]):
+        """upstream에서 받은 상세정보를 미러와 색인에 추가"""
+        try:
+            KRAIngestionService(api_service=api_service).upsert_horses(items, meet=meet)
+        except Exception as e:
+            logger.warning(f"경주마 등록부 저장 실패 (색인만 갱신): {str(e)}")
+        index = self._index(meet)
+        with self._lock:
+            for item in items:
+                if item.get('hrNo'):
+                    index.add(str(item['hrNo']), str(item.get('hrName', '')).strip(), item)
+        get_name_index(refresh=False).observe(items, meet)
+
+    def sync(self, api_service, meet: int, batch_size: int = 500) -> Dict[str, int]:
+        """
+        경마장 등록부 델타 동기화
+
+        전체 페이지를 순서대로 받으면서 저장된 행 해시와 다른 말만 모아 배치 upsert 한다.
+
+        Returns:
+            {'received', 'changed', 'unchanged', 'total'} 건수
+        """
+        from ..models import Horse
+
+        known = dict(
+            Horse.objects.filter(meet=meet).exclude(row_hash='').values_list('hr_no', 'row_hash')
+        )
+        ingestion = KRAIngestionService(api_service=api_service, batch_size=batch_size)
+
+        counts = {'received': 0, 'changed': 0, 'unchanged': 0, 'total': 0}
+        changed = []
+        for page in api_service.iter_pages('horse_info', {'meet': meet}):
+            counts['total'] = int(page.get('totalCount') or 0)
+            for item in page.get('items', []):
+                counts['received'] += 1
+                hr_no = str(item.get('hrNo') or '').strip()
+                if not hr_no:
+                    continue
+                if known.get(hr_no) == row_hash(item):
+                    counts['unchanged'] += 1
+                    continue
+                changed.append(item)
+                if len(changed) >= batch_size:
+                    counts['changed'] += ingestion.upsert_horses(changed, meet=meet)
+                    changed = []
+        if changed:
+            counts['changed'] += ingestion.upsert_horses(changed, meet=meet)
+
+        if counts['changed']:
+            self._bump_version(meet)
+        if counts['received'] < counts['total']:
+            logger.warning(f"경주마 등록부 일부 페이지 누락: {meet} {counts['received']}/{counts['total']}")
+        logger.info(f"경주마 등록부 동기화 {meet}: {counts}")
+        return counts
+
+    # ---- 내부 도우미 ----
+
+    def _version_key(self, meet: int) -> str:
+        return f"kra_horse_registry:version:{meet}"
+
+    def _bump_version(self, meet: int):
+        self.cache.set(self._version_key(meet), time.time(), None, l1=False)
+
+    def _index(self, meet: int) -> _MeetIndex:
+        """경마장 색인 반환 (처음 사용하거나 다른 워커가 동기화했으면 DB에서 다시 읽음)"""
+        index = self._indexes.get(meet)
+        now = time.monotonic()
+        if index is not None and now - index.checked_at < self.VERSION_CHECK_INTERVAL:
+            return index
+
+        version = self.cache.get(self._version_key(meet), l1=False)
+        if index is not None and index.version == version:
+            index.checked_at = now
+            return index
+
+        with self._lock:
+            index = self._indexes.get(meet)
+            if index is not None and index.version == version and now - index.checked_at < self.VERSION_CHECK_INTERVAL:
+                return index
+            index = self._load(meet, version)
+            self._indexes[meet] = index
+            return index
+
+    def _load(self, meet: int, version) -> _MeetIndex:
+        index = _MeetIndex(version)
+        try:
+            from ..models import Horse
+            rows = Horse.objects.filter(meet=meet).exclude(row_hash='').values_list('hr_no', 'hr_name', 'raw')
+            for hr_no, hr_name, raw in rows.iterator(chunk_size=2000):
+                index.add(hr_no, hr_name, raw)
+            logger.info(f"경주마 등록부 색인 로드: {meet} {len(index.by_no)}두")
+        except Exception as e:
+            logger.warning(f"경주마 등록부 색인 로드 실패 (upstream 사용): {str(e)}")
+        return index
+
+
+# 프로세스 공용 인스턴스
+_registry: Optional[HorseRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_horse_registry() -> HorseRegistry:
+    """프로세스 공용 경주마 등록부 반환"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = HorseRegistry()
+    return _registry
@@ -0,0 +1,211 @@
+"""
+한국마사회 API용 공유 HTTP 클라이언트
+
+워커 프로세스당 하나의 커넥션 풀을 공유해 apis.data.go.kr 요청마다
+TCP/TLS 핸드셰이크를 반복하지 않도록 한다.
+
+- requests + urllib3 커넥션 풀 (기본)
+- httpx + h2 가 설치되어 있고 KRA_HTTP2 설정이 켜져 있으면 HTTP/2 사용
+- 새로 연결한 커넥션 수 / 재사용한 요청 수 통계 제공
+"""
+
+import logging
+import os
+import socket
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from django.conf import settings
+
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx의 HTTP/2 지원에 필요)
+except ImportError:
+    httpx = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class _ConnectionCounter:
+    """커넥션 생성/요청 횟수 카운터 (스레드 안전)"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.requests = 0
+    
+    def connection_opened(self):
+        with self._lock:
+            self.opened += 1
+    
+    def request_sent(self):
+        with self._lock:
+            self.requests += 1
+
+
+def _counting_pool(base, counter: _ConnectionCounter):
+    """새 커넥션 생성 시 카운터를 올리는 커넥션 풀 클래스 생성"""
+    class CountingConnectionPool(base):
+        def _new_conn(self):
+            counter.connection_opened()
+            return super()._new_conn()
+    
+    return CountingConnectionPool
+
+
+class _PooledAdapter(HTTPAdapter):
+    """커넥션 통계와 TCP keep-alive 옵션을 적용한 HTTPAdapter"""
+    
+    def __init__(self, counter: _ConnectionCounter, **kwargs):
+        self.counter = counter
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        # 유휴 커넥션이 중간 장비에서 끊기지 않도록 TCP keep-alive 사용
+        pool_kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _counting_pool(HTTPConnectionPool, self.counter),
+            'https': _counting_pool(HTTPSConnectionPool, self.counter),
+        }
+
+
+class KRAHTTPClient:
+    """프로세스 공용 HTTP 클라이언트"""
+    
+    POOL_SIZE = 32          # 호스트당 최대 커넥션 수
+    KEEPALIVE_EXPIRY = 60   # HTTP/2 유휴 커넥션 유지 시간(초)
+    
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Racing-Prediction-System/1.0',
+        'Accept': 'application/json',
+        'Connection': 'keep-alive',
+    }
+    
+    def __init__(self, pool_size: int = None, http2: bool = None):
+        self.pool_size = pool_size or getattr(settings, 'KRA_HTTP_POOL_SIZE', self.POOL_SIZE)
+        if http2 is None:
+            http2 = getattr(settings, 'KRA_HTTP2', False)
+        self.http2 = bool(http2 and httpx is not None)
+        if http2 and not self.http2:
+            logger.warning("httpx/h2 패키지가 없어 HTTP/1.1 커넥션 풀 사용")
+        
+        self.counter = _ConnectionCounter()
+        if self.http2:
+            self._client = httpx.Client(
+                http2=True,
+                headers=self.DEFAULT_HEADERS,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                    keepalive_expiry=self.KEEPALIVE_EXPIRY,
+                ),
+            )
+        else:
+            self._client = requests.Session()
+            self._client.headers.update(self.DEFAULT_HEADERS)
+            adapter = _PooledAdapter(
+                self.counter,
+                pool_connections=4,
+                pool_maxsize=self.pool_size,
+                max_retries=0,
+            )
+            self._client.mount('https://', adapter)
+            self._client.mount('http://', adapter)
+        
+        logger.info(f"KRA HTTP 클라이언트 생성: pool_size={self.pool_size}, http2={self.http2}")
+    
+    CHUNK_SIZE = 64 * 1024  # 스트리밍 응답 읽기 단위
+    
+    def get(self, url: str, params: Dict[str, Any] = None, timeout: float = 30,
+            stream: bool = False):
+        """
+        GET 요청
+        
+        HTTP/2(httpx) 사용 시에도 예외는 requests 예외로 변환하므로
+        호출 측은 백엔드와 무관하게 같은 방식으로 처리할 수 있다.
+        
+        Args:
+            stream: True면 본문을 미리 읽지 않음 (iter_chunks로 읽기, requests 백엔드만 해당)
+            
+        Returns:
+            응답 객체 (content, json(), raise_for_status() 지원)
+        """
+        self.counter.request_sent()
+        
+        if not self.http2:
+            return self._client.get(url, params=params, timeout=timeout, stream=stream)
+        
+        try:
+            response = self._client.get(
+                url, params=params, timeout=timeout,
+                extensions={'trace': self._trace},
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e))
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+        
+        if response.is_error:
+            raise requests.exceptions.HTTPError(
+                f"{response.status_code} Error: {url}", response=response
+            )
+        return response
+    
+    def iter_chunks(self, response):
+        """응답 본문을 바이트 청크 단위로 반환"""
+        if self.http2:
+            return response.iter_bytes(self.CHUNK_SIZE)
+        return response.iter_content(self.CHUNK_SIZE)
+    
+    def _trace(self, event_name: str, info: Dict):
+        """httpcore trace 이벤트로 새 커넥션 수 집계"""
+        if event_name == 'connection.connect_tcp.complete':
+            self.counter.connection_opened()
+    
+    def stats(self) -> Dict[str, Any]:
+        """커넥션 풀 통계"""
+        opened = self.counter.opened
+        total = self.counter.requests
+        return {
+            'backend': 'httpx-http2' if self.http2 else 'requests',
+            'pool_size': self.pool_size,
+            'requests': total,
+            'connections_opened': opened,
+            'connections_reused': max(0, total - opened),
+            'reuse_ratio': round((total - opened) / total, 3) if total else 0.0,
+        }
+    
+    def close(self):
+        """커넥션 풀 종료"""
+        self._client.close()
+
+
+# 프로세스 공용 인스턴스
+_client: Optional[KRAHTTPClient] = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> KRAHTTPClient:
+    """
+    현재 워커 프로세스의 공용 HTTP 클라이언트 반환
+    
+    gunicorn --preload 등으로 fork된 경우 부모의 소켓을 공유하지 않도록
+    프로세스 ID가 바뀌면 새로 생성한다.
+    """
+    global _client, _client_pid
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _client_lock:
+            if _client is None or _client_pid != pid:
+                _client = KRAHTTPClient()
+                _client_pid = pid
+    return _client
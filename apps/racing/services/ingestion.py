@@ -0,0 +1,362 @@
+"""
+KRA API 응답을 로컬 DB로 적재하는 수집 서비스
+
+get_race_schedule/get_entry_sheet/get_race_results/get_race_records 결과를
+모델 인스턴스로 변환한 뒤 bulk_create(update_conflicts=True)로 배치 upsert 한다.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type
+
+from django.db import connections, models, router, transaction
+
+from ..models import Entry, Horse, Jockey, Race, Record, Result, Trainer
+from .budget import Priority
+from .kra_api import KRAAPIService
+from .feature_store import get_horse_form_store
+from .ratings import get_rating_table
+
+logger = logging.getLogger(__name__)
+
+
+def _text(value: Any, max_length: int = None) -> str:
+    text = '' if value is None else str(value).strip()
+    return text[:max_length] if max_length else text
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(float(str(value).strip()))
+    except (TypeError, ValueError):
+        return None
+
+
+def _float(value: Any) -> Optional[float]:
+    try:
+        return float(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _date(value: Any) -> Optional[date]:
+    """'YYYYMMDD' / 'YYYY-MM-DD' 문자열 또는 숫자를 date로 변환"""
+    text = _text(value).replace('-', '')[:8]
+    try:
+        return datetime.strptime(text, '%Y%m%d').date()
+    except ValueError:
+        return None
+
+
+def _race_time(value: Any) -> Optional[float]:
+    """경주기록을 초 단위로 변환 ('72.3' 또는 '1:12.3')"""
+    text = _text(value)
+    if ':' in text:
+        minutes, _, seconds = text.partition(':')
+        minutes, seconds = _float(minutes), _float(seconds)
+        if minutes is None or seconds is None:
+            return None
+        return minutes * 60 + seconds
+    seconds = _float(text)
+    return seconds if seconds else None
+
+
+def row_hash(item: Dict) -> str:
+    """원본 item 내용 해시 (키 순서/값 타입과 무관)"""
+    normalized = json.dumps({str(k): str(v) for k, v in item.items()}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+class KRAIngestionService:
+    """KRA API 데이터를 로컬 저장소로 적재하는 서비스"""
+
+    BATCH_SIZE = 500  # bulk_create 배치 크기
+
+    def __init__(self, api_service: KRAAPIService = None, batch_size: int = None):
+        # 수집은 화면 요청보다 낮은 우선순위로 호출 한도를 사용
+        self.api = api_service or KRAAPIService(priority=Priority.PREFETCH)
+        self.batch_size = batch_size or self.BATCH_SIZE
+
+    # ---- API 조회 + 적재 ----
+
+    def ingest_schedule(self, meet: int, rc_date: str = None, rc_month: str = None) -> int:
+        """경주계획표 적재"""
+        items = self.api.get_race_schedule(meet=meet, rc_date=rc_date, rc_month=rc_month)
+        return self.upsert_races(items, meet=meet)
+
+    def ingest_entries(self, meet: int, rc_date: str = None, rc_month: str = None) -> int:
+        """출전표 적재"""
+        items = self.api.get_entry_sheet(meet=meet, rc_date=rc_date, rc_month=rc_month)
+        return self.upsert_entries(items, meet=meet)
+
+    def ingest_results(self, meet: int, race_date: str) -> int:
+        """경주성적 적재 (race_date: YYYYMMDD 또는 YYYYMM)"""
+        items = self.api.get_race_results(meet=meet, **self._date_params(race_date))
+        return self.upsert_results(items, meet=meet)
+
+    def ingest_records(self, meet: int, race_date: str) -> int:
+        """경주기록 적재 (race_date: YYYYMMDD 또는 YYYYMM)"""
+        items = self.api.get_race_records(meet=meet, **self._date_params(race_date))
+        return self.upsert_records(items, meet=meet)
+
+    @staticmethod
+    def _date_params(race_date: str) -> Dict[str, str]:
+        """일자(YYYYMMDD)는 race_date, 월(YYYYMM)은 페이지 단위로 전체를 받는 rc_date 파라미터로"""
+        race_date = str(race_date).strip()
+        return {'rc_date': race_date} if len(race_date) == 6 else {'race_date': race_date}
+
+    def ingest_horses(self, meet: int, hr_no: str = None) -> int:
+        """경주마 상세정보 적재"""
+        items = self.api.get_horse_info(meet=meet, hr_no=hr_no)
+        return self.upsert_horses(items, meet=meet)
+
+    def ingest_day(self, meet: int, rc_date: str, results: bool = True) -> Dict[str, int]:
+        """
+        하루치 경주 데이터 적재
+
+        Args:
+            meet: 경마장 코드
+            rc_date: 경주일자 (YYYYMMDD)
+            results: 성적/기록까지 적재할지 여부 (지난 경주)
+
+        Returns:
+            종류별 적재 행 수
+        """
+        counts = {
+            'races': self.ingest_schedule(meet, rc_date=rc_date),
+            'entries': self.ingest_entries(meet, rc_date=rc_date),
+        }
+        if results:
+            counts['results'] = self.ingest_results(meet, rc_date)
+            counts['records'] = self.ingest_records(meet, rc_date)
+        logger.info(f"{meet} {rc_date} 적재 완료: {counts}")
+        return counts
+
+    # ---- item -> 모델 변환 + upsert ----
+
+    def upsert_races(self, items: Iterable[Dict], meet: int = None) -> int:
+        rows = {}
+        for item in items:
+            key = self._race_key(item, meet)
+            if key is None:
+                continue
+            rows[key] = Race(
+                meet=key[0], rc_date=key[1], rc_no=key[2],
+                rc_name=_text(item.get('rcName'), 100),
+                rc_dist=_int(item.get('rcDist')),
+                rank=_text(item.get('rank'), 30),
+                start_time=_text(item.get('schStTime'), 10),
+                raw=item,
+            )
+        return self._bulk_upsert(
+            Race, list(rows.values()),
+            unique_fields=['meet', 'rc_date', 'rc_no'],
+            update_fields=['rc_name', 'rc_dist', 'rank', 'start_time', 'raw', 'updated_at'],
+        )
+
+    def upsert_entries(self, items: Iterable[Dict], meet: int = None) -> int:
+        items = list(items)
+        rows = {}
+        for item in items:
+            key = self._runner_key(item, meet)
+            if key is None:
+                continue
+            rows[key] = Entry(
+                **self._runner_fields(key, item),
+                wg_budam=_float(item.get('wgBudam')),
+                rating=_int(item.get('rating')),
+            )
+        with transaction.atomic(using=router.db_for_write(Entry)):
+            self._upsert_people(items, meet)
+            return self._bulk_upsert(
+                Entry, list(rows.values()),
+                unique_fields=['meet', 'rc_date', 'rc_no', 'chul_no'],
+                update_fields=self._runner_update_fields(['wg_budam', 'rating']),
+            )
+
+    def upsert_results(self, items: Iterable[Dict], meet: int = None) -> int:
+        items = list(items)
+        rows = {}
+        for item in items:
+            key = self._runner_key(item, meet)
+            if key is None:
+                continue
+            rows[key] = Result(
+                **self._runner_fields(key, item),
+                ord=_int(item.get('ord')),
+                rc_time=_race_time(item.get('rcTime')),
+                wg_hr=_text(item.get('wgHr'), 20),
+                win_odds=_float(item.get('winOdds')),
+                plc_odds=_float(item.get('plcOdds')),
+            )
+        with transaction.atomic(using=router.db_for_write(Result)):
+            self._upsert_people(items, meet)
+            count = self._bulk_upsert(
+                Result, list(rows.values()),
+                unique_fields=['meet', 'rc_date', 'rc_no', 'chul_no'],
+                update_fields=self._runner_update_fields(['ord', 'rc_time', 'wg_hr', 'win_odds', 'plc_odds']),
+            )
+        self._apply_result_aggregates({key[:3] for key in rows})
+        return count
+
+    def upsert_records(self, items: Iterable[Dict], meet: int = None) -> int:
+        items = list(items)
+        rows = {}
+        for item in items:
+            key = self._runner_key(item, meet)
+            if key is None:
+                continue
+            rows[key] = Record(
+                **self._runner_fields(key, item),
+                ord=_int(item.get('ord')),
+                rc_time=_race_time(item.get('rcTime')),
+                rc_dist=_int(item.get('rcDist')),
+            )
+        with transaction.atomic(using=router.db_for_write(Record)):
+            self._upsert_people(items, meet)
+            return self._bulk_upsert(
+                Record, list(rows.values()),
+                unique_fields=['meet', 'rc_date', 'rc_no', 'chul_no'],
+                update_fields=self._runner_update_fields(['ord', 'rc_time', 'rc_dist']),
+            )
+
+    def upsert_horses(self, items: Iterable[Dict], meet: int = None) -> int:
+        rows = {}
+        for item in items:
+            hr_no = _text(item.get('hrNo'))
+            if not hr_no:
+                continue
+            rows[hr_no] = Horse(
+                hr_no=hr_no,
+                hr_name=_text(item.get('hrName'), 50),
+                meet=_int(item.get('meet')) or meet,
+                sex=_text(item.get('sex'), 10),
+                age=_int(item.get('age')),
+                birthday=_date(item.get('birthday')),
+                rank=_text(item.get('rank'), 20),
+                rating=_int(item.get('rating')),
+                raw=item,
+                row_hash=row_hash(item),
+            )
+        return self._bulk_upsert(
+            Horse, list(rows.values()),
+            unique_fields=['hr_no'],
+            update_fields=['hr_name', 'meet', 'sex', 'age', 'birthday', 'rank', 'rating', 'raw',
+                           'row_hash', 'updated_at'],
+        )
+
+    # ---- 내부 도우미 ----
+
+    @staticmethod
+    def _race_key(item: Dict, meet: int = None):
+        meet = _int(item.get('meet')) or meet
+        rc_date = _date(item.get('rcDate'))
+        rc_no = _int(item.get('rcNo'))
+        if not (meet and rc_date and rc_no):
+            return None
+        return meet, rc_date, rc_no
+
+    @classmethod
+    def _runner_key(cls, item: Dict, meet: int = None):
+        race_key = cls._race_key(item, meet)
+        chul_no = _int(item.get('chulNo'))
+        if race_key is None or chul_no is None:
+            return None
+        return race_key + (chul_no,)
+
+    @staticmethod
+    def _runner_fields(key, item: Dict) -> Dict[str, Any]:
+        meet, rc_date, rc_no, chul_no = key
+        return {
+            'meet': meet,
+            'rc_date': rc_date,
+            'rc_no': rc_no,
+            'chul_no': chul_no,
+            'horse_id': _text(item.get('hrNo')) or None,
+            'jockey_id': _text(item.get('jkNo')) or None,
+            'trainer_id': _text(item.get('trNo')) or None,
+            'hr_name': _text(item.get('hrName'), 50),
+            'raw': item,
+        }
+
+    @staticmethod
+    def _runner_update_fields(extra: List[str]) -> List[str]:
+        return ['horse', 'jockey', 'trainer', 'hr_name', 'raw', 'updated_at'] + extra
+
+    @staticmethod
+    def _apply_result_aggregates(race_keys):
+        """새로 적재된 경주 성적을 기수/조교사 레이팅, 경주마 최근 성적에 누적 (실패해도 적재는 유지)"""
+        if not race_keys:
+            return
+        try:
+            get_rating_table().apply_races(race_keys)
+        except Exception as e:
+            logger.warning(f"레이팅 반영 실패 (build_ratings로 다시 반영 가능): {str(e)}")
+        try:
+            get_horse_form_store().apply_races(race_keys)
+        except Exception as e:
+            logger.warning(f"경주마 최근 성적 반영 실패 (build_horse_forms로 다시 반영 가능): {str(e)}")
+
+    def _upsert_people(self, items: Sequence[Dict], meet: int = None):
+        """
+        출전 행에 등장한 경주마/기수/조교사 이름 반영 (상세정보 필드는 건드리지 않음)
+
+        이름이 빈 행은 기존 이름을 덮어쓰지 않고, 없는 번호만 새로 만든다.
+        """
+        horses, jockeys, trainers = {}, {}, {}
+        for item in items:
+            item_meet = _int(item.get('meet')) or meet
+            for people, model, ref_field, name_field, ref_key, name_key in (
+                (horses, Horse, 'hr_no', 'hr_name', 'hrNo', 'hrName'),
+                (jockeys, Jockey, 'jk_no', 'name', 'jkNo', 'jkName'),
+                (trainers, Trainer, 'tr_no', 'name', 'trNo', 'trName'),
+            ):
+                ref_no, name = _text(item.get(ref_key)), _text(item.get(name_key), 50)
+                # 같은 번호는 이름이 있는 행 우선
+                if ref_no and (name or ref_no not in people):
+                    people[ref_no] = model(**{ref_field: ref_no, name_field: name}, meet=item_meet)
+
+        for model, people, ref_field, name_field, update_fields in (
+            (Horse, horses, 'hr_no', 'hr_name', ['hr_name', 'updated_at']),
+            (Jockey, jockeys, 'jk_no', 'name', ['name', 'meet', 'updated_at']),
+            (Trainer, trainers, 'tr_no', 'name', ['name', 'meet', 'updated_at']),
+        ):
+            named = [obj for obj in people.values() if getattr(obj, name_field)]
+            unnamed = [obj for obj in people.values() if not getattr(obj, name_field)]
+            self._bulk_upsert(model, named, [ref_field], update_fields)
+            if unnamed:
+                model.objects.using(router.db_for_write(model)).bulk_create(
+                    unnamed, batch_size=self.batch_size, ignore_conflicts=True
+                )
+
+    def _bulk_upsert(self, model: Type[models.Model], objs: List[models.Model],
+                     unique_fields: List[str], update_fields: List[str]) -> int:
+        """
+        배치 upsert
+
+        MySQL/MariaDB는 충돌 대상 컬럼 지정을 지원하지 않으므로(ON DUPLICATE KEY UPDATE)
+        해당 백엔드에서는 unique_fields를 넘기지 않는다.
+
+        Returns:
+            처리한 행 수
+        """
+        if not objs:
+            return 0
+
+        using = router.db_for_write(model)
+        features = connections[using].features
+        kwargs = {}
+        if features.supports_update_conflicts_with_target:
+            kwargs['unique_fields'] = unique_fields
+
+        model.objects.using(using).bulk_create(
+            objs,
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            update_fields=update_fields,
+            **kwargs
+        )
+        logger.debug(f"{model.__name__} {len(objs)}건 upsert")
+        return len(objs)
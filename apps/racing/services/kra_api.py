@@ -9,13 +9,30 @@
 """
 
 import requests
-import json
+import copy
 import logging
-import xml.etree.ElementTree as ET
+import math
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Tuple
 from django.conf import settings
-from django.core.cache import cache
+
+from .budget import BudgetExceeded, Priority, get_call_budget
+from .deadline import Deadline, DeadlineExceeded, get_hedge_executor, get_latency_tracker
+from .decoders import DecodeError, KRAAPIError, decode_response, get_preferred_format
+from .http_client import get_http_client
+from .resilience import (
+    CircuitOpenError, RetryPolicy, get_circuit_breakers, is_retryable, trips_breaker
+)
+from .response_cache import build_cache_key, get_response_cache
+from .race_calendar import RaceCalendar
+from .race_card import RaceCardIndex
+from .range_planner import DateLike, RangeQueryPlanner
+from .singleflight import get_single_flight
+from .ttl_policy import CacheTTLPolicy
 
 
 logger = logging.getLogger(__name__)
@@ -44,173 +61,450 @@ class KRAAPIService:
         3: '부경'
     }
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Racing-Prediction-System/1.0',
-            'Accept': 'application/json',
-        })
+    # 페이지 조회 설정
+    NUM_OF_ROWS = 1000       # 페이지당 행 수
+    MAX_PAGE_WORKERS = 4     # 페이지 병렬 조회 최대 개수
+    
+    # 장애 대응 설정
+    NEGATIVE_TTL = 30                    # 실패한 요청 재시도 보류 시간(초)
+    NEGATIVE_TTL_CLIENT_ERROR = 300      # 잘못된 요청(파라미터 오류 등) 재시도 보류 시간(초)
+    STALE_TTL = 7 * 24 * 60 * 60         # 장애 시 반환할 이전 데이터 보관 시간(초)
+    
+    def __init__(self, max_page_workers: int = None, priority: Priority = Priority.INTERACTIVE,
+                 deadline: Deadline = None, hedge: bool = None):
+        """
+        Args:
+            max_page_workers: 페이지 병렬 조회 최대 개수
+            priority: 호출 우선순위 (화면 요청 > 미리 가져오기 > 백필), 호출 한도 관리에 사용
+            deadline: 응답 마감 시각 (뷰에서 전달, 타임아웃/재시도/대기가 이를 넘지 않음)
+            hedge: 응답이 p95보다 늦으면 같은 요청을 한 번 더 보냄 (기본값: 화면 요청만)
+        """
+        self.max_page_workers = max(1, max_page_workers or getattr(
+            settings, 'KRA_MAX_PAGE_WORKERS', self.MAX_PAGE_WORKERS
+        ))
+        # 워커 프로세스 공용 커넥션 풀 사용 (요청마다 TCP/TLS 핸드셰이크 방지)
+        self.session = get_http_client()
+        # L1(프로세스 LRU) + L2(워커 공유) 응답 캐시
+        self.cache = get_response_cache()
+        # 동일 요청 합치기 (동시에 들어온 같은 요청은 upstream 1회만 호출)
+        self.flight = get_single_flight()
+        # 엔드포인트/날짜 기반 캐시 TTL 정책
+        self.ttl_policy = CacheTTLPolicy(self.ENDPOINTS)
+        # 일시적 오류 재시도 정책과 엔드포인트별 서킷 브레이커
+        self.retry_policy = RetryPolicy(
+            max_attempts=getattr(settings, 'KRA_RETRY_MAX_ATTEMPTS', None)
+        )
+        self.breakers = get_circuit_breakers()
+        # API 키 일일 호출 한도/속도 제한
+        self.priority = priority
+        self.budget = get_call_budget()
+        # 응답 마감 시각과 헤지 요청
+        self.deadline = deadline
+        if hedge is None:
+            hedge = getattr(settings, 'KRA_HEDGE_REQUESTS', True) and priority == Priority.INTERACTIVE
+        self.hedge = hedge
+        self.latency = get_latency_tracker()
+        # 기간 조회를 월/일 단위 호출로 나누는 계획기
+        self.range_planner = RangeQueryPlanner()
+        # 경마장/날짜별 개최 여부 (경주 없는 날은 upstream 호출 생략)
+        self.calendar = RaceCalendar(self)
+        # (경마장, 날짜)별 경주번호 -> 출전마 색인
+        self.race_cards = RaceCardIndex(self)
     
     def _make_request(self, endpoint: str, params: Dict[str, Any], 
-                     cache_timeout: int = 300) -> Optional[Dict]:
+                     cache_timeout: Optional[int] = None, paginate: bool = False) -> Optional[Dict]:
         """
         API 요청 실행
         
         Args:
             endpoint: API 엔드포인트
             params: 요청 파라미터
-            cache_timeout: 캐시 유지 시간(초)
+            cache_timeout: 캐시 유지 시간(초), None이면 TTL 정책(엔드포인트/날짜 기준) 적용
+            paginate: True면 totalCount 기준으로 나머지 페이지까지 모두 조회
             
         Returns:
             API 응답 데이터 또는 None
         """
-        # 캐시 키 생성
-        cache_key = f"kra_api:{endpoint}:{hash(frozenset(params.items()))}"
-        cached_data = cache.get(cache_key)
+        # 캐시 키 생성 (파라미터 내용 기반이라 워커/재시작과 무관하게 동일)
+        cache_key = build_cache_key(endpoint, params, suffix='all' if paginate else '')
+        cached_data = self.cache.get(cache_key)
         if cached_data:
             logger.info(f"캐시에서 데이터 반환: {cache_key}")
             return cached_data
         
-        # 기본 파라미터 설정
+        # 최근 실패한 요청은 잠시 upstream 호출 없이 이전 데이터로 응답
+        failure = self.cache.get(self._negative_key(cache_key))
+        if failure is not None:
+            logger.warning(f"최근 실패한 요청, 재요청 생략: {endpoint} ({failure})")
+            return self._get_stale(cache_key)
+        
+        # 같은 요청이 이미 진행 중이면 그 결과를 기다려 공유 (마감 시각까지만 대기)
+        try:
+            parsed_data, shared = self.flight.do(
+                cache_key,
+                lambda: self._load(endpoint, params, cache_key, cache_timeout, paginate),
+                lookup=lambda: self.cache.get(cache_key),
+                timeout=self.deadline.remaining() if self.deadline else None
+            )
+        except TimeoutError:
+            logger.warning(f"선행 요청 대기 중 마감 시간 초과: {endpoint}")
+            return self._get_stale(cache_key)
+        if shared and parsed_data is not None:
+            # 호출자마다 결과를 수정할 수 있으므로 각자 복사본 사용
+            parsed_data = copy.deepcopy(parsed_data)
+        
+        return parsed_data
+    
+    def _load(self, endpoint: str, params: Dict[str, Any], cache_key: str,
+              cache_timeout: Optional[int], paginate: bool) -> Optional[Dict]:
+        """upstream 조회 후 캐시에 저장 (실패 시 이전 데이터 반환)"""
+        # 대기 중 선행 요청이 끝나 캐시가 채워졌을 수 있음
+        cached_data = self.cache.get(cache_key)
+        if cached_data:
+            return cached_data
+        
+        try:
+            parsed_data = self._fetch_page(endpoint, params, page_no=1, raise_errors=True)
+        except Exception as e:
+            self._remember_failure(cache_key, e)
+            return self._get_stale(cache_key)
+        
+        complete = True
+        if paginate:
+            parsed_data, complete = self._collect_pages(endpoint, params, parsed_data)
+        
+        # 캐시에 저장 (일부 페이지가 누락된 응답은 저장하지 않음)
+        if parsed_data and complete:
+            if cache_timeout is None:
+                cache_timeout = self.ttl_policy.ttl_for(endpoint, params, len(parsed_data.get('items', [])))
+            self.cache.set(cache_key, parsed_data, cache_timeout)
+            # 장애 시 사용할 이전 데이터는 L2에만 더 길게 보관
+            self.cache.set(self._stale_key(cache_key), parsed_data,
+                           max(cache_timeout, self.STALE_TTL), l1=False)
+            logger.info(f"응답 데이터 캐시 저장: {cache_key} (TTL {cache_timeout}초)")
+        
+        return parsed_data
+    
+    def _negative_key(self, cache_key: str) -> str:
+        return f"{cache_key}:failed"
+    
+    def _stale_key(self, cache_key: str) -> str:
+        return f"{cache_key}:stale"
+    
+    def _remember_failure(self, cache_key: str, error: Exception):
+        """실패한 요청을 잠시 기억해 같은 요청이 곧바로 다시 upstream을 기다리지 않도록 함"""
+        if isinstance(error, (CircuitOpenError, BudgetExceeded, DeadlineExceeded)):
+            return  # 서킷 브레이커/호출 한도/마감 시각 때문에 보내지 않은 요청
+        if isinstance(error, KRAAPIError) and error.client_error:
+            timeout = self.NEGATIVE_TTL_CLIENT_ERROR
+        else:
+            timeout = self.NEGATIVE_TTL
+        self.cache.set(self._negative_key(cache_key), str(error), timeout)
+    
+    def _get_stale(self, cache_key: str) -> Optional[Dict]:
+        """만료되었더라도 마지막으로 성공한 응답 반환"""
+        stale_data = self.cache.get(self._stale_key(cache_key), l1=False)
+        if stale_data is not None:
+            logger.warning(f"upstream 장애, 이전 데이터 반환: {cache_key}")
+        return stale_data
+    
+    def _fetch_page(self, endpoint: str, params: Dict[str, Any],
+                    page_no: int = 1, raise_errors: bool = False) -> Optional[Dict]:
+        """
+        단일 페이지 조회 (캐시 미사용)
+        
+        일시적 오류는 지터 포함 백오프로 재시도하고, 엔드포인트의 서킷 브레이커가
+        열려 있으면 요청하지 않고 바로 실패한다.
+        
+        Args:
+            endpoint: API 엔드포인트
+            params: 요청 파라미터
+            page_no: 페이지 번호
+            raise_errors: True면 실패 시 None 대신 마지막 오류를 발생시킴
+            
+        Returns:
+            파싱된 페이지 데이터 또는 None
+        """
+        # 기본 파라미터 설정 (응답 형식은 엔드포인트별 벤치마크 결과를 따름)
         request_params = {
             'ServiceKey': self.API_KEY,
-            'pageNo': 1,
-            'numOfRows': 1000,
-            '_type': 'xml',
+            'pageNo': page_no,
+            'numOfRows': self.NUM_OF_ROWS,
+            '_type': get_preferred_format(endpoint),
             **params
         }
         
         url = f"{self.BASE_URL}{endpoint}"
+        name = self._endpoint_name(endpoint)
+        breaker = self.breakers.get(endpoint)
+        delays = self.retry_policy.delays()
+        
+        while True:
+            if self.deadline is not None and self.deadline.expired():
+                error = DeadlineExceeded(f"마감 시간 초과: {url}")
+                logger.warning(str(error))
+                break
+            
+            # 호출 한도 확인 (낮은 우선순위는 한도에 가까우면 거부, 속도 제한 시 우선순위 순으로 대기)
+            try:
+                self.budget.acquire(name, self.priority, timeout=self._budget_wait())
+            except BudgetExceeded as e:
+                error = e
+                logger.warning(f"{str(e)} - {url}")
+                break
+            
+            if not breaker.allow():
+                error = CircuitOpenError(endpoint)
+                logger.warning(f"서킷 브레이커 열림, 요청 생략: {url}")
+                break
+            
+            try:
+                page = self._request_page(url, request_params, name)
+                breaker.record_success()
+                return page
+            except Exception as e:
+                error = e
+                self._log_request_error(e, url)
+                if trips_breaker(e):
+                    breaker.record_failure(e)
+                elif isinstance(e, DeadlineExceeded):
+                    # 호출 측 마감으로 끊긴 요청은 upstream 상태와 무관
+                    breaker.release()
+                else:
+                    # upstream은 응답했으므로 정상으로 집계
+                    breaker.record_success()
+            
+            delay = next(delays, None) if is_retryable(error) else None
+            if delay is None:
+                break
+            if self.deadline is not None and delay >= self.deadline.remaining():
+                logger.warning(f"마감 시간 안에 재시도할 수 없음: {url}")
+                break
+            logger.info(f"{delay:.2f}초 후 재시도: {url}")
+            time.sleep(delay)
+        
+        if raise_errors:
+            raise error
+        return None
+    
+    def _budget_wait(self) -> Optional[float]:
+        """호출 한도 토큰 대기 시간 (마감 시각이 있으면 남은 시간 이내)"""
+        if self.deadline is None:
+            return -1  # 우선순위별 기본값
+        default = self.budget.WAIT_TIMEOUT[self.priority]
+        remaining = self.deadline.remaining()
+        return remaining if default is None else min(default, remaining)
+    
+    def _request_page(self, url: str, request_params: Dict[str, Any], name: str) -> Dict:
+        """HTTP 요청 1회 실행 (응답이 p95보다 늦으면 헤지 요청 추가)"""
+        p95 = self.latency.percentile(name) if self.hedge else None
+        if p95 is None:
+            return self._send(url, request_params, name)
+        return self._send_hedged(url, request_params, name, p95)
+    
+    def _send(self, url: str, request_params: Dict[str, Any], name: str) -> Dict:
+        """HTTP 요청 전송 후 응답 디코딩"""
+        logger.info(f"API 요청: {url}, 파라미터: {request_params}")
+        self.budget.record_call(name)
         
+        timeout = self.deadline.timeout(30) if self.deadline else 30
+        if timeout <= 0:
+            raise DeadlineExceeded(f"마감 시간 초과: {url}")
+        
+        started = time.monotonic()
         try:
-            logger.info(f"API 요청: {url}, 파라미터: {request_params}")
-            
             response = self.session.get(
                 url, 
                 params=request_params, 
-                timeout=30
+                timeout=timeout,
+                stream=True
             )
-            response.raise_for_status()
-            
-            # XML 응답 파싱
             try:
-                root = ET.fromstring(response.content)
-                parsed_data = self._parse_xml_response(root)
-            except ET.ParseError:
-                # JSON 응답 시도
-                try:
-                    data = response.json()
-                    parsed_data = self._parse_json_response(data)
-                except json.JSONDecodeError:
-                    logger.error(f"XML/JSON 파싱 모두 실패: {url}")
-                    return None
-            
-            # 캐시에 저장
-            if parsed_data:
-                cache.set(cache_key, parsed_data, cache_timeout)
-                logger.info(f"응답 데이터 캐시 저장: {cache_key}")
-            
-            return parsed_data
-            
-        except requests.exceptions.Timeout:
+                response.raise_for_status()
+                # 소켓에서 읽는 대로 item 단위로 파싱
+                page = decode_response(self.session.iter_chunks(response))
+            finally:
+                response.close()
+        except requests.exceptions.Timeout as e:
+            # 마감 시간에 맞춰 줄인 타임아웃이면 upstream 지연이 아니라 마감 초과
+            if timeout < 30:
+                raise DeadlineExceeded(f"마감 시간 초과: {url}") from e
+            raise
+        
+        self.latency.record(name, time.monotonic() - started)
+        return page
+    
+    def _send_hedged(self, url: str, request_params: Dict[str, Any], name: str, p95: float) -> Dict:
+        """
+        헤지 요청: 첫 요청이 p95 안에 끝나지 않으면 같은 요청을 한 번 더 보내고
+        먼저 성공한 응답을 사용한다 (늦은 쪽은 백그라운드에서 끝나도록 둠).
+        """
+        executor = get_hedge_executor()
+        primary = executor.submit(self._send, url, request_params, name)
+        try:
+            return primary.result(timeout=p95)
+        except FutureTimeoutError:
+            pass
+        
+        if self.deadline is not None and self.deadline.expired():
+            raise DeadlineExceeded(f"마감 시간 초과: {url}")
+        
+        try:
+            self.budget.acquire(name, self.priority, timeout=0)
+        except BudgetExceeded:
+            # 헤지할 여유가 없으면 첫 요청만 기다림
+            try:
+                return primary.result(timeout=self.deadline.remaining() if self.deadline else None)
+            except FutureTimeoutError:
+                raise DeadlineExceeded(f"마감 시간 초과: {url}")
+        
+        logger.info(f"헤지 요청 전송 (p95 {p95:.2f}초 초과): {url}")
+        hedge = executor.submit(self._send, url, request_params, name)
+        
+        pending = {primary, hedge}
+        first_error = None
+        while pending:
+            done, pending = wait(
+                pending, timeout=self.deadline.remaining() if self.deadline else None,
+                return_when=FIRST_COMPLETED
+            )
+            if not done:
+                raise DeadlineExceeded(f"마감 시간 초과: {url}")
+            for future in done:
+                if future.exception() is None:
+                    self.latency.record_hedge(name, won=future is hedge)
+                    return future.result()
+                first_error = first_error or future.exception()
+        
+        self.latency.record_hedge(name, won=False)
+        raise first_error
+    
+    def _log_request_error(self, error: Exception, url: str):
+        """오류 종류별 로그"""
+        if isinstance(error, DeadlineExceeded):
+            logger.warning(f"마감 시간 안에 응답 없음: {url}")
+        elif isinstance(error, requests.exceptions.Timeout):
             logger.error(f"API 요청 타임아웃: {url}")
-        except requests.exceptions.ConnectionError:
+        elif isinstance(error, requests.exceptions.ConnectionError):
             logger.error(f"API 연결 오류: {url}")
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP 오류: {e.response.status_code} - {url}")
-        except json.JSONDecodeError:
-            logger.error(f"JSON 파싱 오류: {url}")
-        except Exception as e:
-            logger.error(f"예상치 못한 오류: {str(e)} - {url}")
-        
-        return None
+        elif isinstance(error, requests.exceptions.HTTPError):
+            logger.error(f"HTTP 오류: {error.response.status_code} - {url}")
+        elif isinstance(error, KRAAPIError):
+            logger.error(f"API 오류 응답: {error} - {url}")
+        elif isinstance(error, DecodeError):
+            logger.error(f"XML/JSON 파싱 실패: {str(error)} - {url}")
+        else:
+            logger.error(f"예상치 못한 오류: {str(error)} - {url}")
     
-    def _parse_xml_response(self, root) -> Optional[Dict]:
-        """XML 응답 파싱"""
-        try:
-            # 에러 확인
-            fault = root.find('.//{http://schemas.xmlsoap.org/soap/envelope/}Fault')
-            if fault is not None:
-                fault_string = fault.find('.//faultstring')
-                if fault_string is not None:
-                    logger.error(f"SOAP Fault: {fault_string.text}")
-                return None
-            
-            # response 구조 찾기
-            header = root.find('.//header')
-            body = root.find('.//body')
-            
-            if header is None or body is None:
-                logger.error("XML 응답에서 header 또는 body를 찾을 수 없음")
-                return None
-            
-            # 결과 코드 확인
-            result_code = header.find('resultCode')
-            result_msg = header.find('resultMsg')
-            
-            if result_code is not None and result_code.text != '00':
-                msg = result_msg.text if result_msg is not None else '알 수 없는 오류'
-                logger.error(f"API 오류 응답: {result_code.text} - {msg}")
-                return None
-            
-            # items 파싱
-            items_element = body.find('items')
-            if items_element is None:
-                logger.warning("items 요소를 찾을 수 없음")
-                return {'items': []}
-            
-            items = []
-            for item in items_element.findall('item'):
-                item_dict = {}
-                for child in item:
-                    item_dict[child.tag] = child.text
-                items.append(item_dict)
-            
-            # 페이징 정보
-            total_count = body.find('totalCount')
-            page_no = body.find('pageNo')
-            num_of_rows = body.find('numOfRows')
-            
-            result = {
-                'items': items,
-                'totalCount': int(total_count.text) if total_count is not None else len(items),
-                'pageNo': int(page_no.text) if page_no is not None else 1,
-                'numOfRows': int(num_of_rows.text) if num_of_rows is not None else len(items)
-            }
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"XML 파싱 오류: {str(e)}")
-            return None
+    def _page_count(self, page: Dict) -> int:
+        """첫 페이지의 totalCount/numOfRows로 전체 페이지 수 계산"""
+        total_count = int(page.get('totalCount') or 0)
+        num_of_rows = self.NUM_OF_ROWS
+        return max(1, math.ceil(total_count / num_of_rows))
     
-    def _parse_json_response(self, data) -> Optional[Dict]:
-        """JSON 응답 파싱 (기존 로직)"""
-        try:
-            # 응답 구조 검증
-            if 'response' not in data:
-                logger.error(f"응답 구조 오류: {data}")
-                return None
-                
-            response_body = data['response'].get('body', {})
-            
-            # 에러 코드 확인
-            header = data['response'].get('header', {})
-            result_code = header.get('resultCode', '00')
+    def _collect_pages(self, endpoint: str, params: Dict[str, Any],
+                       first_page: Dict) -> Tuple[Dict, bool]:
+        """
+        첫 페이지 이후의 나머지 페이지를 병렬로 조회해 하나로 합침
+        
+        Args:
+            endpoint: API 엔드포인트
+            params: 요청 파라미터
+            first_page: 이미 조회한 1페이지 데이터
             
-            if result_code != '00':
-                result_msg = header.get('resultMsg', '알 수 없는 오류')
-                logger.error(f"API 오류 응답: {result_code} - {result_msg}")
-                return None
+        Returns:
+            (합쳐진 응답 데이터, 모든 페이지 조회 성공 여부)
+        """
+        page_count = self._page_count(first_page)
+        if page_count <= 1:
+            return first_page, True
+        
+        logger.info(f"페이지 병렬 조회: {endpoint}, 총 {first_page.get('totalCount')}건 / {page_count}페이지")
+        
+        items = list(first_page.get('items', []))
+        missing_pages = []
+        workers = min(self.max_page_workers, page_count - 1)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pages = executor.map(
+                lambda page_no: self._fetch_page(endpoint, params, page_no),
+                range(2, page_count + 1)
+            )
+            for page_no, page in enumerate(pages, start=2):
+                if page is None:
+                    missing_pages.append(page_no)
+                    continue
+                items.extend(page.get('items', []))
+        
+        if missing_pages:
+            logger.error(f"일부 페이지 조회 실패: {endpoint}, 누락 페이지 {missing_pages}")
+        
+        result = {
+            'items': items,
+            'totalCount': first_page.get('totalCount', len(items)),
+            'pageNo': 1,
+            'numOfRows': len(items),
+        }
+        return result, not missing_pages
+    
+    def iter_pages(self, endpoint: str, params: Dict[str, Any]) -> Iterator[Dict]:
+        """
+        페이지 단위 스트리밍 조회 (캐시 미사용)
+        
+        최대 max_page_workers개 페이지만 미리 받아두므로 전체 결과를
+        메모리에 올리지 않고 순서대로 처리할 수 있다.
+        
+        Args:
+            endpoint: ENDPOINTS 키(예: 'horse_info') 또는 API 경로
+            params: 요청 파라미터
             
-            return response_body
+        Yields:
+            파싱된 페이지 데이터 (pageNo 순)
+        """
+        endpoint = self.ENDPOINTS.get(endpoint, endpoint)
+        
+        first_page = self._fetch_page(endpoint, params, page_no=1)
+        if first_page is None:
+            return
+        yield first_page
+        
+        page_count = self._page_count(first_page)
+        if page_count <= 1:
+            return
+        
+        next_page = 2
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.max_page_workers) as executor:
+            while next_page <= page_count or pending:
+                # 동시 조회 한도만큼 다음 페이지를 미리 요청
+                while next_page <= page_count and len(pending) < self.max_page_workers:
+                    pending.append((next_page, executor.submit(self._fetch_page, endpoint, params, next_page)))
+                    next_page += 1
+                
+                page_no, future = pending.popleft()
+                page = future.result()
+                if page is None:
+                    logger.error(f"페이지 조회 실패: {endpoint}, {page_no}페이지")
+                    continue
+                yield page
+    
+    def iter_items(self, endpoint: str, params: Dict[str, Any]) -> Iterator[Dict]:
+        """
+        전체 페이지의 item을 하나씩 반환하는 제너레이터 (캐시 미사용)
+        
+        Args:
+            endpoint: ENDPOINTS 키(예: 'horse_info') 또는 API 경로
+            params: 요청 파라미터
             
-        except Exception as e:
-            logger.error(f"JSON 파싱 오류: {str(e)}")
-            return None
+        Yields:
+            item 딕셔너리
+        """
+        for page in self.iter_pages(endpoint, params):
+            yield from page.get('items', [])
     
     def get_race_schedule(self, meet: int = 1, rc_date: str = None, 
-                         rc_month: str = None, rc_year: str = None) -> List[Dict]:
+                         rc_month: str = None, rc_year: str = None,
+                         cache_timeout: int = None) -> List[Dict]:
         """
         경주 계획표 조회
         
@@ -219,6 +513,7 @@ class KRAAPIService:
             rc_date: 경주일자 (YYYYMMDD)
             rc_month: 경주년월 (YYYYMM)
             rc_year: 경주년도 (YYYY)
+            cache_timeout: 캐시 유지 시간(초), None이면 TTL 정책 적용
             
         Returns:
             경주 계획 리스트
@@ -232,7 +527,9 @@ class KRAAPIService:
         elif rc_year:
             params['rc_year'] = rc_year
         
-        data = self._make_request(self.ENDPOINTS['race_schedule'], params)
+        # 월/연 단위 조회는 1000건을 넘을 수 있으므로 전체 페이지 조회
+        data = self._make_request(self.ENDPOINTS['race_schedule'], params,
+                                  cache_timeout=cache_timeout, paginate=not rc_date)
         
         if data and 'items' in data:
             races = data['items']
@@ -242,13 +539,15 @@ class KRAAPIService:
         logger.warning(f"경주 계획표 조회 실패 ({self.TRACKS.get(meet, meet)})")
         return []
     
-    def get_horse_info(self, meet: int = 1, hr_no: str = None) -> List[Dict]:
+    def get_horse_info(self, meet: int = 1, hr_no: str = None,
+                       cache_timeout: int = None) -> List[Dict]:
         """
         경주마 상세정보 조회
         
         Args:
             meet: 경마장 (1:서울, 2:제주, 3:부경)  
             hr_no: 마번
+            cache_timeout: 캐시 유지 시간(초), None이면 TTL 정책 적용
             
         Returns:
             경주마 정보 리스트
@@ -258,7 +557,9 @@ class KRAAPIService:
         if hr_no:
             params['hr_no'] = hr_no
         
-        data = self._make_request(self.ENDPOINTS['horse_info'], params)
+        # 마번 없이 조회하면 전체 등록마 목록이므로 전체 페이지 조회
+        data = self._make_request(self.ENDPOINTS['horse_info'], params,
+                                  cache_timeout=cache_timeout, paginate=not hr_no)
         
         if data and 'items' in data:
             horses = data['items']
@@ -269,7 +570,8 @@ class KRAAPIService:
         return []
     
     def get_race_results(self, meet: int = 1, race_date: str = None,
-                        rc_date: str = None) -> List[Dict]:
+                        rc_date: str = None,
+                        cache_timeout: int = None) -> List[Dict]:
         """
         경주 성적정보 조회
         
@@ -277,6 +579,7 @@ class KRAAPIService:
             meet: 경마장 (1:서울, 2:제주, 3:부경)
             race_date: 경주일자 (YYYYMMDD) 
             rc_date: 경주년월 (YYYYMM)
+            cache_timeout: 캐시 유지 시간(초), None이면 TTL 정책 적용
             
         Returns:
             경주 성적 리스트
@@ -288,7 +591,9 @@ class KRAAPIService:
         elif rc_date:
             params['rc_date'] = rc_date
         
-        data = self._make_request(self.ENDPOINTS['race_results'], params)
+        # 월 단위 조회는 1000건을 넘을 수 있으므로 전체 페이지 조회
+        data = self._make_request(self.ENDPOINTS['race_results'], params,
+                                  cache_timeout=cache_timeout, paginate=not race_date)
         
         if data and 'items' in data:
             results = data['items']
@@ -299,14 +604,16 @@ class KRAAPIService:
         return []
     
     def get_race_records(self, meet: int = 1, race_date: str = None,
-                        rc_date: str = None) -> List[Dict]:
+                        rc_date: str = None,
+                        cache_timeout: int = None) -> List[Dict]:
         """
         경주 기록정보 조회
         
         Args:
             meet: 경마장 (1:서울, 2:제주, 3:부경)
             race_date: 경주일자 (YYYYMMDD)
-            rc_date: 경주년월 (YYYYMM) 
+            rc_date: 경주년월 (YYYYMM)
+            cache_timeout: 캐시 유지 시간(초), None이면 TTL 정책 적용
             
         Returns:
             경주 기록 리스트
@@ -318,7 +625,9 @@ class KRAAPIService:
         elif rc_date:
             params['rc_date'] = rc_date
         
-        data = self._make_request(self.ENDPOINTS['race_records'], params)
+        # 월 단위 조회는 1000건을 넘을 수 있으므로 전체 페이지 조회
+        data = self._make_request(self.ENDPOINTS['race_records'], params,
+                                  cache_timeout=cache_timeout, paginate=not race_date)
         
         if data and 'items' in data:
             records = data['items']
@@ -332,10 +641,23 @@ class KRAAPIService:
         """
         오늘 요일에 해당하는 경주 계획 조회 (금/토/일만 경마 개최)
         
+        경마장별 조회는 AsyncKRAAPIService를 통해 병렬로 실행된다.
+        
         Returns:
             경마장별 오늘 경주 계획, 시간순 정렬
         """
+        from .kra_async import AsyncKRAAPIService, run_sync
+        return run_sync(AsyncKRAAPIService(self).get_today_races())
+    
+    def _today_race_date(self) -> str:
+        """오늘 기준 조회할 경주일자(YYYYMMDD) 결정 (오늘 또는 다음 개최일)"""
         today = datetime.now()
+        race_date_str = self.calendar.next_race_day(today)
+        if race_date_str:
+            logger.info(f"경주 일정 조회 날짜: {race_date_str} (경주 달력)")
+            return race_date_str
+        
+        # 달력을 쓸 수 없으면 금/토/일 규칙으로 결정
         weekday = today.weekday()  # 0=월, 1=화, 2=수, 3=목, 4=금, 5=토, 6=일
         
         # 경주일 결정
@@ -354,28 +676,30 @@ class KRAAPIService:
         
         race_date_str = race_date.strftime('%Y%m%d')
         logger.info(f"경주 일정 조회 날짜: {race_date_str} ({['월','화','수','목','금','토','일'][race_date.weekday()]}요일)")
-        
+        return race_date_str
+    
+    def _meets_racing_on(self, rc_date: str) -> List[int]:
+        """해당 날짜에 경주가 있는 경마장 목록 (경주 달력 기준)"""
+        return [meet for meet in self.TRACKS if self.calendar.is_race_day(meet, rc_date)]
+    
+    def _merge_today_races(self, races_by_meet: Dict[int, List[Dict]]) -> Dict:
+        """경마장별 경주 계획을 시간순 전체 목록과 함께 하나로 합침"""
         all_races = {}
         all_races_list = []  # 전체 경주를 시간순으로 정렬하기 위한 리스트
         
-        for meet in self.TRACKS.keys():
-            try:
-                races = self.get_race_schedule(meet=meet, rc_date=race_date_str)
-                if races:
-                    # 각 경주에 경마장 정보와 정렬용 키 추가
-                    for race in races:
-                        race['meet'] = meet
-                        race['meet_name'] = self.TRACKS[meet]
-                        # 시간 정렬을 위한 키 생성
-                        start_time = race.get('schStTime') or race.get('rcTime') or '0000'
-                        race['sort_time'] = start_time.zfill(4)  # 4자리로 패딩
-                        all_races_list.append(race)
-                    
-                    all_races[meet] = races
-                    logger.info(f"{self.TRACKS[meet]}: {len(races)}경주")
-            except Exception as e:
-                logger.error(f"{self.TRACKS[meet]} 경주 조회 실패: {e}")
-                continue
+        for meet, races in races_by_meet.items():
+            if races:
+                # 각 경주에 경마장 정보와 정렬용 키 추가
+                for race in races:
+                    race['meet'] = meet
+                    race['meet_name'] = self.TRACKS[meet]
+                    # 시간 정렬을 위한 키 생성
+                    start_time = race.get('schStTime') or race.get('rcTime') or '0000'
+                    race['sort_time'] = start_time.zfill(4)  # 4자리로 패딩
+                    all_races_list.append(race)
+                
+                all_races[meet] = races
+                logger.info(f"{self.TRACKS[meet]}: {len(races)}경주")
         
         # 전체 경주를 시간순으로 정렬
         all_races_list.sort(key=lambda x: (x['sort_time'], x['meet'], x.get('rcNo', '1')))
@@ -389,7 +713,7 @@ class KRAAPIService:
     
     def get_recent_results(self, days: int = 7) -> Dict[int, List[Dict]]:
         """
-        최근 경주 결과 조회
+        최근 경주 결과 조회 (경마장별 기간 조회, get_results_between 참고)
         
         Args:
             days: 조회할 일수
@@ -397,23 +721,58 @@ class KRAAPIService:
         Returns:
             경마장별 최근 경주 결과
         """
-        all_results = {}
+        from .kra_async import AsyncKRAAPIService, run_sync
+        return run_sync(AsyncKRAAPIService(self).get_recent_results(days=days))
+    
+    def get_results_between(self, meet: int, start: DateLike, end: DateLike) -> List[Dict]:
+        """
+        기간 경주 성적 조회
         
-        for meet in self.TRACKS.keys():
-            meet_results = []
+        월 단위/일 단위 중 호출이 적은 조합으로 나눠 병렬 조회한 뒤 기간 밖의 행을 잘라낸다.
+        월 단위 응답은 캐시되므로 겹치는 기간 조회는 이를 재사용한다.
+        
+        Args:
+            meet: 경마장 (1:서울, 2:제주, 3:부경)
+            start: 시작일 (YYYYMMDD 또는 date)
+            end: 종료일 (포함)
             
-            for i in range(days):
-                target_date = (datetime.now() - timedelta(days=i)).strftime('%Y%m%d')
-                results = self.get_race_results(meet=meet, race_date=target_date)
-                meet_results.extend(results)
+        Returns:
+            경주 성적 리스트 (경주일 순)
+        """
+        from .kra_async import AsyncKRAAPIService, run_sync
+        return run_sync(AsyncKRAAPIService(self).get_results_between(meet, start, end))
+    
+    def get_records_between(self, meet: int, start: DateLike, end: DateLike) -> List[Dict]:
+        """
+        기간 경주 기록 조회 (get_results_between과 같은 방식)
+        
+        Args:
+            meet: 경마장 (1:서울, 2:제주, 3:부경)
+            start: 시작일 (YYYYMMDD 또는 date)
+            end: 종료일 (포함)
             
-            if meet_results:
-                all_results[meet] = meet_results
+        Returns:
+            경주 기록 리스트 (경주일 순)
+        """
+        from .kra_async import AsyncKRAAPIService, run_sync
+        return run_sync(AsyncKRAAPIService(self).get_records_between(meet, start, end))
+    
+    def is_cached(self, endpoint: str, params: Dict[str, Any], paginate: bool = False) -> bool:
+        """
+        응답이 캐시에 있는지 확인
         
-        return all_results
+        Args:
+            endpoint: ENDPOINTS 키 또는 API 경로
+            params: 요청 파라미터 (get_* 메서드가 만드는 것과 같은 형태)
+            paginate: 전체 페이지 조회 여부
+        """
+        endpoint = self.ENDPOINTS.get(endpoint, endpoint)
+        cache_key = build_cache_key(endpoint, params, suffix='all' if paginate else '')
+        return self.cache.get(cache_key) is not None
     
     def get_entry_sheet(self, meet: int = 1, rc_date: str = None, 
-                       rc_month: str = None, rc_no: str = None) -> List[Dict]:
+                       rc_month: str = None, rc_no: str = None,
+                       cache_timeout: int = None) -> List[Dict]:
         """
         출전표 상세정보 조회 (예정된 경주의 출전마 정보)
         
@@ -422,6 +781,7 @@ class KRAAPIService:
             rc_date: 경주일자 (YYYYMMDD)
             rc_month: 경주년월 (YYYYMM)
             rc_no: 경주번호
+            cache_timeout: 캐시 유지 시간(초), None이면 TTL 정책 적용
             
         Returns:
             출전표 정보 리스트
@@ -435,7 +795,8 @@ class KRAAPIService:
         if rc_no:
             params['rc_no'] = rc_no
         
-        data = self._make_request(self.ENDPOINTS['entry_sheet'], params)
+        data = self._make_request(self.ENDPOINTS['entry_sheet'], params,
+                                  cache_timeout=cache_timeout, paginate=not rc_no)
         
         if data and 'items' in data:
             entries = data['items']
@@ -445,6 +806,32 @@ class KRAAPIService:
         logger.warning(f"출전표 정보 조회 실패 ({self.TRACKS.get(meet, meet)})")
         return []
 
+    def _endpoint_name(self, endpoint: str) -> str:
+        """API 경로를 ENDPOINTS 이름으로 변환"""
+        for name, path in self.ENDPOINTS.items():
+            if path == endpoint:
+                return name
+        return endpoint
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        서비스 운영 통계
+        
+        Returns:
+            커넥션 풀 등 구성 요소별 통계
+        """
+        return {
+            'http_pool': self.session.stats(),
+            'response_cache': self.cache.stats(),
+            'single_flight': self.flight.stats(),
+            'latency': self.latency.snapshot(),
+            'call_budget': self.budget.stats(list(self.ENDPOINTS.keys())),
+            'circuit_breakers': {
+                self._endpoint_name(endpoint): state
+                for endpoint, state in self.breakers.snapshot().items()
+            },
+        }
+    
     def test_connection(self) -> bool:
         """
         API 연결 테스트
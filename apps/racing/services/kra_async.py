@@ -0,0 +1,263 @@
+"""
+한국마사회 API 비동기 서비스
+
+KRAAPIService와 같은 메서드를 asyncio 코루틴으로 제공한다.
+개별 조회는 기존 동기 서비스를 스레드에서 실행하고, 여러 경마장/여러 날짜를
+묶어 조회하는 메서드는 세마포어로 동시 실행 수를 제한하면서 병렬로 처리한다.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, TypeVar
+
+from django.conf import settings
+
+from .deadline import DeadlineExceeded
+from .kra_api import KRAAPIService
+from .range_planner import DateLike, RangeChunk
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# upstream 호출용 공용 스레드 풀 (프로세스당 1개)
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """비동기 서비스가 공유하는 I/O 스레드 풀 반환"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'KRA_MAX_CONCURRENCY', AsyncKRAAPIService.MAX_CONCURRENCY),
+                    thread_name_prefix='kra-async'
+                )
+    return _executor
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    동기 코드에서 코루틴 실행
+    
+    실행 중인 이벤트 루프가 있으면(ASGI 등) 별도 스레드에서 새 루프로 실행한다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class AsyncKRAAPIService:
+    """한국마사회 API 비동기 서비스 클래스"""
+    
+    MAX_CONCURRENCY = 24  # 동시 upstream 요청 최대 개수 (3개 경마장 x 7일 조회가 한 번에 실행되도록)
+    
+    TRACKS = KRAAPIService.TRACKS
+    ENDPOINTS = KRAAPIService.ENDPOINTS
+    
+    def __init__(self, service: KRAAPIService = None, max_concurrency: int = None):
+        self.service = service or KRAAPIService()
+        self.max_concurrency = max(1, max_concurrency or getattr(
+            settings, 'KRA_MAX_CONCURRENCY', self.MAX_CONCURRENCY
+        ))
+        self._semaphore = None
+        self._semaphore_loop = None
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프에 묶인 세마포어 반환"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    async def _call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """동기 메서드를 동시 실행 제한 안에서 스레드로 실행"""
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+    
+    async def get_race_schedule(self, meet: int = 1, rc_date: str = None,
+                                rc_month: str = None, rc_year: str = None,
+                                cache_timeout: int = None) -> List[Dict]:
+        """경주 계획표 조회"""
+        return await self._call(self.service.get_race_schedule, meet=meet, rc_date=rc_date,
+                                rc_month=rc_month, rc_year=rc_year, cache_timeout=cache_timeout)
+    
+    async def get_horse_info(self, meet: int = 1, hr_no: str = None,
+                             cache_timeout: int = None) -> List[Dict]:
+        """경주마 상세정보 조회"""
+        return await self._call(self.service.get_horse_info, meet=meet, hr_no=hr_no,
+                                cache_timeout=cache_timeout)
+    
+    async def get_race_results(self, meet: int = 1, race_date: str = None,
+                               rc_date: str = None, cache_timeout: int = None) -> List[Dict]:
+        """경주 성적정보 조회"""
+        return await self._call(self.service.get_race_results, meet=meet, race_date=race_date,
+                                rc_date=rc_date, cache_timeout=cache_timeout)
+    
+    async def get_race_records(self, meet: int = 1, race_date: str = None,
+                               rc_date: str = None, cache_timeout: int = None) -> List[Dict]:
+        """경주 기록정보 조회"""
+        return await self._call(self.service.get_race_records, meet=meet, race_date=race_date,
+                                rc_date=rc_date, cache_timeout=cache_timeout)
+    
+    async def get_entry_sheet(self, meet: int = 1, rc_date: str = None,
+                              rc_month: str = None, rc_no: str = None,
+                              cache_timeout: int = None) -> List[Dict]:
+        """출전표 상세정보 조회"""
+        return await self._call(self.service.get_entry_sheet, meet=meet, rc_date=rc_date,
+                                rc_month=rc_month, rc_no=rc_no, cache_timeout=cache_timeout)
+    
+    async def _gather_until_deadline(self, coros: List[Awaitable]) -> List[Any]:
+        """
+        코루틴을 병렬 실행하고 마감 시각까지 끝난 결과만 반환
+        
+        Returns:
+            입력 순서대로의 결과 (예외 또는 마감 시각까지 끝나지 않은 항목은 해당 예외 객체)
+        """
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        deadline = self.service.deadline
+        if not tasks:
+            return []
+        
+        done, pending = await asyncio.wait(tasks, timeout=deadline.remaining() if deadline else None)
+        for task in pending:
+            # 스레드에서 진행 중인 요청은 마감 시각 기준 타임아웃으로 정리됨
+            task.cancel()
+        
+        results = []
+        for task in tasks:
+            if task in pending:
+                results.append(DeadlineExceeded('마감 시간 초과'))
+            elif task.exception() is not None:
+                results.append(task.exception())
+            else:
+                results.append(task.result())
+        return results
+    
+    async def get_today_races(self) -> Dict[int, List[Dict]]:
+        """
+        오늘 요일에 해당하는 경주 계획 조회 (경마장별 병렬 조회)
+        
+        마감 시각이 있으면 그때까지 끝난 경마장만 반환하고 partial 플래그를 세운다.
+        
+        Returns:
+            경마장별 오늘 경주 계획, 시간순 정렬 (partial, missing_tracks 포함)
+        """
+        race_date_str = await self._call(self.service._today_race_date)
+        # 그날 경주가 없는 경마장은 조회하지 않음
+        meets = await self._call(self.service._meets_racing_on, race_date_str)
+        
+        responses = await self._gather_until_deadline(
+            [self.get_race_schedule(meet=meet, rc_date=race_date_str) for meet in meets]
+        )
+        
+        races_by_meet = {}
+        missing_tracks = []
+        for meet, races in zip(meets, responses):
+            if isinstance(races, Exception):
+                logger.error(f"{self.TRACKS[meet]} 경주 조회 실패: {races}")
+                missing_tracks.append(meet)
+                continue
+            races_by_meet[meet] = races
+        
+        result = self.service._merge_today_races(races_by_meet)
+        result['partial'] = bool(missing_tracks)
+        result['missing_tracks'] = missing_tracks
+        return result
+    
+    async def get_recent_results(self, days: int = 7) -> Dict[int, List[Dict]]:
+        """
+        최근 경주 결과 조회 (경마장별 기간 조회를 병렬 실행)
+        
+        Args:
+            days: 조회할 일수
+            
+        Returns:
+            경마장별 최근 경주 결과 (마감 시각이 있으면 그때까지 끝난 조회 단위만 포함)
+        """
+        end = datetime.now().date()
+        start = end - timedelta(days=max(1, days) - 1)
+        all_results = await self._get_between('race_results', list(self.TRACKS.keys()), start, end)
+        return {meet: results for meet, results in all_results.items() if results}
+    
+    async def get_results_between(self, meet: int, start: DateLike, end: DateLike) -> List[Dict]:
+        """기간 경주 성적 조회"""
+        return (await self._get_between('race_results', [meet], start, end))[meet]
+    
+    async def get_records_between(self, meet: int, start: DateLike, end: DateLike) -> List[Dict]:
+        """기간 경주 기록 조회"""
+        return (await self._get_between('race_records', [meet], start, end))[meet]
+    
+    async def _get_between(self, endpoint: str, meets: List[int],
+                           start: DateLike, end: DateLike) -> Dict[int, List[Dict]]:
+        """
+        경마장별 기간 조회를 월/일 단위 호출로 계획해 한 번에 병렬 실행
+        
+        Args:
+            endpoint: 'race_results' 또는 'race_records'
+            meets: 경마장 코드 목록
+            start: 시작일
+            end: 종료일 (포함)
+            
+        Returns:
+            경마장별 기간 내 행 (조회 단위 순)
+        """
+        getter = {
+            'race_results': self.get_race_results,
+            'race_records': self.get_race_records,
+        }[endpoint]
+        planner = self.service.range_planner
+        # 달력/캐시 확인은 동기 I/O이므로 스레드에서 계획
+        tasks = await self._call(self._plan_between, endpoint, meets, start, end)
+        
+        responses = await self._gather_until_deadline([
+            getter(meet=meet, rc_date=chunk.value) if chunk.kind == 'month'
+            else getter(meet=meet, race_date=chunk.value)
+            for meet, chunk in tasks
+        ])
+        
+        rows_by_meet = {meet: [] for meet in meets}
+        for (meet, chunk), rows in zip(tasks, responses):
+            if isinstance(rows, Exception):
+                logger.error(f"{self.TRACKS.get(meet, meet)} {chunk.value} {endpoint} 조회 실패: {rows}")
+                continue
+            rows_by_meet[meet].extend(rows)
+        
+        return {
+            meet: planner.slice_rows(rows, start, end)
+            for meet, rows in rows_by_meet.items()
+        }
+    
+    def _plan_between(self, endpoint: str, meets: List[int],
+                      start: DateLike, end: DateLike) -> List[Tuple[int, RangeChunk]]:
+        """경마장별 조회 단위 계획 (경주 달력의 개최일만, 캐시된 월 단위 응답 우선)"""
+        planner = self.service.range_planner
+        calendar = self.service.calendar
+        tasks = []
+        for meet in meets:
+            chunks = planner.plan(
+                start, end,
+                is_month_cached=lambda month, meet=meet: self.service.is_cached(
+                    endpoint, {'meet': meet, 'rc_date': month}, paginate=True
+                ),
+                is_race_day=lambda day, meet=meet: calendar.is_race_day(meet, day),
+            )
+            tasks.extend((meet, chunk) for chunk in chunks)
+        return tasks
+    
+    async def test_connection(self) -> bool:
+        """API 연결 테스트"""
+        return await self._call(self.service.test_connection)
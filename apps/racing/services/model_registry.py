@@ -0,0 +1,248 @@
+"""
+학습된 예측 모델 보관소 (model registry)
+
+버전별 학습 결과(모델 파일 + 메타데이터)를 디스크에 보관하고, 워커마다 사용 중인 버전을
+처음 쓸 때 한 번 읽어 메모리에 둔다.
+
+- 경로: {root}/{name}/{version}/model.joblib, metadata.json
+        {root}/{name}/CURRENT (사용 중인 버전 이름)
+- 게시: 새 버전 디렉터리를 임시 이름으로 모두 쓴 뒤 이름을 바꾸고, CURRENT는 임시 파일에 쓴 뒤
+  os.replace로 교체하므로 읽는 쪽은 항상 완전한 버전만 본다
+- 로드: joblib mmap_mode='r' (압축하지 않은 NumPy 배열은 메모리 매핑되어 같은 호스트의 워커들이
+  페이지 캐시를 공유)
+- 교체: 각 워커가 CURRENT를 주기적으로 확인해 바뀌면 새 버전을 읽고 참조만 바꿈 (재시작 없음,
+  진행 중인 예측은 이전 버전 객체로 끝남, 새 버전 로드에 실패하면 이전 버전 유지)
+
+joblib(scikit-learn 의존성)이 없거나 게시된 버전이 없으면 예측 모델은 기존 가중합을 사용한다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+from django.conf import settings
+
+try:
+    import joblib
+except ImportError:  # scikit-learn과 함께 설치됨
+    joblib = None
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILE = 'model.joblib'
+METADATA_FILE = 'metadata.json'
+CURRENT_FILE = 'CURRENT'
+
+
+class ModelArtifact:
+    """로드된 모델 버전 하나"""
+
+    __slots__ = ('name', 'version', 'estimator', 'metadata')
+
+    def __init__(self, name: str, version: str, estimator, metadata: Dict):
+        self.name = name
+        self.version = version
+        self.estimator = estimator
+        self.metadata = metadata
+
+    @property
+    def features(self) -> List[str]:
+        """모델 입력 특성 이름 (열 순서)"""
+        return list(self.metadata.get('features', []))
+
+    @property
+    def accuracy(self) -> float:
+        return float(self.metadata.get('accuracy') or 0.0)
+
+    def score(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        특성 행렬 -> 0~100 점수
+
+        분류기는 1착 확률 x 100, 회귀 모델은 예측값 그대로.
+        """
+        estimator = self.estimator
+        if hasattr(estimator, 'predict_proba'):
+            proba = estimator.predict_proba(matrix)
+            classes = list(getattr(estimator, 'classes_', [0, 1]))
+            column = classes.index(1) if 1 in classes else proba.shape[1] - 1
+            return np.asarray(proba[:, column], dtype=np.float64) * 100
+        return np.asarray(estimator.predict(matrix), dtype=np.float64)
+
+    def __repr__(self):
+        return f"ModelArtifact({self.name} {self.version})"
+
+
+class ModelRegistry:
+    """버전별 학습 모델 보관소"""
+
+    VERSION_CHECK_INTERVAL = 30  # CURRENT 변경 확인 주기(초)
+
+    def __init__(self, root: str = None):
+        self.root = str(root or getattr(settings, 'KRA_MODEL_DIR', None)
+                        or os.path.join(settings.BASE_DIR, 'models', 'kra'))
+        self._loaded: Dict[str, ModelArtifact] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available() -> bool:
+        return joblib is not None
+
+    # ---- 경로/조회 ----
+
+    def model_dir(self, name: str, version: str = None) -> str:
+        path = os.path.join(self.root, name)
+        return os.path.join(path, version) if version else path
+
+    def versions(self, name: str) -> List[str]:
+        """게시된 버전 목록 (오래된 순)"""
+        base = self.model_dir(name)
+        if not os.path.isdir(base):
+            return []
+        return sorted(
+            entry for entry in os.listdir(base)
+            if not entry.startswith('.') and os.path.exists(os.path.join(base, entry, METADATA_FILE))
+        )
+
+    def current_version(self, name: str) -> Optional[str]:
+        """사용 중인 버전 (없으면 None)"""
+        try:
+            with open(os.path.join(self.model_dir(name), CURRENT_FILE), encoding='utf-8') as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def metadata(self, name: str, version: str) -> Dict:
+        with open(os.path.join(self.model_dir(name, version), METADATA_FILE), encoding='utf-8') as f:
+            return json.load(f)
+
+    # ---- 게시/교체 ----
+
+    def publish(self, name: str, estimator, metadata: Dict, activate: bool = True) -> str:
+        """
+        새 버전 게시
+
+        Args:
+            name: 모델 이름
+            estimator: 학습된 모델 (predict_proba 또는 predict 지원)
+            metadata: features(입력 특성 순서), accuracy 등
+            activate: 게시 후 바로 사용 중인 버전으로 교체
+
+        Returns:
+            버전 이름 (게시 시각 YYYYMMDDHHMMSS)
+        """
+        if joblib is None:
+            raise ImportError('joblib 패키지가 설치되어 있지 않습니다 (pip install scikit-learn)')
+        if not metadata.get('features'):
+            raise ValueError('metadata에 features(입력 특성 순서)가 필요합니다')
+
+        base = self.model_dir(name)
+        os.makedirs(base, exist_ok=True)
+        version = datetime.now().strftime('%Y%m%d%H%M%S')
+        suffix = 1
+        while os.path.exists(os.path.join(base, version)):
+            suffix += 1
+            version = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{suffix}"
+
+        tmp_dir = os.path.join(base, f".tmp-{version}-{os.getpid()}")
+        os.makedirs(tmp_dir)
+        # 압축하지 않아야 로드 시 메모리 매핑 가능
+        joblib.dump(estimator, os.path.join(tmp_dir, MODEL_FILE))
+        metadata = dict(
+            metadata,
+            name=name,
+            version=version,
+            estimator=type(estimator).__name__,
+            published_at=datetime.now().isoformat(timespec='seconds'),
+        )
+        with open(os.path.join(tmp_dir, METADATA_FILE), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=2, default=str)
+        os.rename(tmp_dir, os.path.join(base, version))
+
+        logger.info(f"모델 게시: {name} {version}")
+        if activate:
+            self.activate(name, version)
+        return version
+
+    def activate(self, name: str, version: str):
+        """사용 중인 버전 교체 (각 워커는 다음 확인 주기에 새 버전을 읽음)"""
+        if version not in self.versions(name):
+            raise ValueError(f"게시되지 않은 모델 버전: {name} {version}")
+        path = os.path.join(self.model_dir(name), CURRENT_FILE)
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(version)
+        os.replace(tmp_path, path)
+        self._checked_at.pop(name, None)
+        logger.info(f"모델 버전 교체: {name} -> {version}")
+
+    # ---- 로드 ----
+
+    def load(self, name: str, version: str) -> ModelArtifact:
+        """버전 하나를 읽기 (NumPy 배열은 메모리 매핑)"""
+        if joblib is None:
+            raise ImportError('joblib 패키지가 설치되어 있지 않습니다 (pip install scikit-learn)')
+        path = self.model_dir(name, version)
+        metadata = self.metadata(name, version)
+        estimator = joblib.load(os.path.join(path, MODEL_FILE), mmap_mode='r')
+        return ModelArtifact(name, version, estimator, metadata)
+
+    def get(self, name: str) -> Optional[ModelArtifact]:
+        """
+        사용 중인 버전 (처음 호출 시 로드, 이후 CURRENT가 바뀌면 교체)
+
+        Returns:
+            ModelArtifact, 게시된 버전이 없거나 joblib이 없으면 None
+        """
+        if joblib is None:
+            return None
+        now = time.monotonic()
+        checked_at = self._checked_at.get(name)
+        if checked_at is not None and now - checked_at < self.VERSION_CHECK_INTERVAL:
+            return self._loaded.get(name)
+
+        with self._lock:
+            checked_at = self._checked_at.get(name)
+            if checked_at is not None and now - checked_at < self.VERSION_CHECK_INTERVAL:
+                return self._loaded.get(name)
+            try:
+                version = self.current_version(name)
+                current = self._loaded.get(name)
+                if version is None:
+                    self._loaded.pop(name, None)
+                elif current is None or current.version != version:
+                    started = time.perf_counter()
+                    self._loaded[name] = self.load(name, version)
+                    logger.info(
+                        f"모델 로드: {name} {version} ({(time.perf_counter() - started) * 1000:.0f}ms)"
+                    )
+            except Exception as e:
+                # 이전 버전 유지, 다음 확인 주기에 다시 시도
+                logger.error(f"모델 로드 실패 ({name}): {str(e)}")
+            self._checked_at[name] = now
+        return self._loaded.get(name)
+
+    def warm(self, name: str) -> Optional[ModelArtifact]:
+        """확인 주기와 관계없이 사용 중인 버전을 바로 확인/로드 (워커 시작 시 예열용)"""
+        self._checked_at.pop(name, None)
+        return self.get(name)
+
+
+# 프로세스 공용 인스턴스
+_model_registry: Optional[ModelRegistry] = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """프로세스 공용 모델 보관소 반환"""
+    global _model_registry
+    if _model_registry is None:
+        with _model_registry_lock:
+            if _model_registry is None:
+                _model_registry = ModelRegistry()
+    return _model_registry
@@ -0,0 +1,299 @@
+"""
+마명/기수명/조교사명 자동완성 색인
+
+프로세스 메모리에 이름별 정렬 목록(접두어 검색)과 2-gram 역색인(부분 문자열 검색)을 두고,
+한글은 초성 문자열(예: '천둥번개' -> 'ㅊㄷㅂㄱ')로도 같은 색인을 만들어 초성 검색을 지원한다.
+
+- 데이터: 로컬 저장소의 경주마/기수/조교사 + 출전표/성적 응답에 새로 등장한 이름
+- 갱신: 전체 재생성 없이 새 이름만 추가 (DB는 updated_at 기준으로 이후 변경분만 읽음)
+"""
+
+import bisect
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+HANGUL_START, HANGUL_END = 0xAC00, 0xD7A3
+JAMO_START, JAMO_END = 0x3131, 0x314E  # 호환용 자음 ㄱ~ㅎ
+
+# 색인 대상: 종류 -> (API 번호 필드, API 이름 필드)
+KINDS = {
+    'horse': ('hrNo', 'hrName'),
+    'jockey': ('jkNo', 'jkName'),
+    'trainer': ('trNo', 'trName'),
+}
+
+
+def normalize(text: str) -> str:
+    """공백 제거 + 소문자"""
+    return ''.join(str(text or '').split()).lower()
+
+
+def choseong(text: str) -> str:
+    """한글 음절을 초성으로 변환 (그 외 문자는 그대로)"""
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_START <= code <= HANGUL_END:
+            chars.append(CHOSEONG[(code - HANGUL_START) // 588])
+        else:
+            chars.append(char)
+    return ''.join(chars)
+
+
+def is_choseong_query(text: str) -> bool:
+    """초성(자음)만으로 된 검색어인지"""
+    return bool(text) and all(JAMO_START <= ord(char) <= JAMO_END for char in text)
+
+
+def _bigrams(text: str) -> Set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class NameEntry(NamedTuple):
+    kind: str    # horse/jockey/trainer
+    id: str      # 마번/기수번호/조교사번호
+    name: str
+    meet: Optional[int]
+
+
+class _KeyIndex:
+    """문자열 키 하나에 대한 접두어(정렬 목록) + 2-gram 색인"""
+
+    def __init__(self):
+        self.sorted_keys: List[Tuple[str, int]] = []   # (키, 항목 번호)
+        self.postings: Dict[str, Set[int]] = {}
+
+    def add(self, key: str, entry_id: int):
+        bisect.insort(self.sorted_keys, (key, entry_id))
+        for gram in _bigrams(key):
+            self.postings.setdefault(gram, set()).add(entry_id)
+
+    def remove(self, key: str, entry_id: int):
+        position = bisect.bisect_left(self.sorted_keys, (key, entry_id))
+        if position < len(self.sorted_keys) and self.sorted_keys[position] == (key, entry_id):
+            del self.sorted_keys[position]
+        for gram in _bigrams(key):
+            ids = self.postings.get(gram)
+            if ids is not None:
+                ids.discard(entry_id)
+                if not ids:
+                    del self.postings[gram]
+
+    def prefix(self, query: str, limit: int) -> List[int]:
+        """접두어가 일치하는 항목 번호 (키 순)"""
+        position = bisect.bisect_left(self.sorted_keys, (query, -1))
+        ids = []
+        while position < len(self.sorted_keys) and len(ids) < limit:
+            key, entry_id = self.sorted_keys[position]
+            if not key.startswith(query):
+                break
+            ids.append(entry_id)
+            position += 1
+        return ids
+
+    def contains(self, query: str) -> Set[int]:
+        """query를 포함할 수 있는 후보 (2-gram 교집합, 호출 측에서 확인)"""
+        grams = _bigrams(query)
+        if not grams:
+            return set()
+        postings = sorted((self.postings.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates &= ids
+            if not candidates:
+                break
+        return candidates
+
+
+class NameIndex:
+    """마명/기수명/조교사명 자동완성 색인"""
+
+    REFRESH_INTERVAL = 60  # 로컬 저장소 변경분 확인 주기(초)
+
+    def __init__(self):
+        self._entries: Dict[int, NameEntry] = {}
+        self._keys: Dict[int, Tuple[str, str]] = {}            # 항목 번호 -> (이름 키, 초성 키)
+        self._by_ref: Dict[Tuple[str, str], int] = {}          # (종류, 번호) -> 항목 번호
+        self._names = {kind: _KeyIndex() for kind in KINDS}
+        self._choseong = {kind: _KeyIndex() for kind in KINDS}
+        self._next_id = 0
+        self._lock = threading.RLock()
+        self._watermark: Optional[datetime] = None
+        self._checked_at = 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ---- 추가 ----
+
+    def add(self, kind: str, ref: str, name: str, meet: Optional[int] = None) -> bool:
+        """
+        이름 추가 (같은 번호가 이미 같은 이름으로 있으면 무시, 이름이 바뀌었으면 교체)
+
+        Returns:
+            색인이 바뀌었는지 여부
+        """
+        ref, name = str(ref or '').strip(), str(name or '').strip()
+        key = normalize(name)
+        if not ref or not key:
+            return False
+
+        with self._lock:
+            entry_id = self._by_ref.get((kind, ref))
+            if entry_id is not None:
+                if self._entries[entry_id].name == name:
+                    return False
+                self._remove(entry_id)
+
+            entry_id = self._next_id
+            self._next_id += 1
+            cho_key = choseong(key)
+            self._entries[entry_id] = NameEntry(kind, ref, name, meet)
+            self._keys[entry_id] = (key, cho_key)
+            self._by_ref[(kind, ref)] = entry_id
+            self._names[kind].add(key, entry_id)
+            self._choseong[kind].add(cho_key, entry_id)
+            return True
+
+    def _remove(self, entry_id: int):
+        entry = self._entries.pop(entry_id)
+        key, cho_key = self._keys.pop(entry_id)
+        self._by_ref.pop((entry.kind, entry.id), None)
+        self._names[entry.kind].remove(key, entry_id)
+        self._choseong[entry.kind].remove(cho_key, entry_id)
+
+    def observe(self, items: Iterable[Dict], meet: int = None) -> int:
+        """
+        출전표/성적/경주마 정보 응답 행에 등장한 이름을 추가
+
+        Returns:
+            새로 추가(또는 변경)된 이름 수
+        """
+        added = 0
+        for item in items:
+            item_meet = meet
+            try:
+                item_meet = int(item.get('meet') or meet)
+            except (TypeError, ValueError):
+                pass
+            for kind, (ref_field, name_field) in KINDS.items():
+                if item.get(ref_field) and item.get(name_field):
+                    added += self.add(kind, item[ref_field], item[name_field], item_meet)
+        return added
+
+    def refresh_from_db(self, force: bool = False) -> int:
+        """
+        로컬 저장소의 경주마/기수/조교사 중 마지막 확인 이후 바뀐 행만 추가
+
+        Returns:
+            새로 추가(또는 변경)된 이름 수
+        """
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.REFRESH_INTERVAL:
+            return 0
+        self._checked_at = now
+
+        try:
+            from ..models import Horse, Jockey, Trainer
+            sources = (
+                ('horse', Horse, 'hr_no', 'hr_name'),
+                ('jockey', Jockey, 'jk_no', 'name'),
+                ('trainer', Trainer, 'tr_no', 'name'),
+            )
+            started_at = timezone.now()
+            added = 0
+            for kind, model, ref_field, name_field in sources:
+                queryset = model.objects.all()
+                if self._watermark is not None:
+                    queryset = queryset.filter(updated_at__gte=self._watermark)
+                rows = queryset.values_list(ref_field, name_field, 'meet')
+                for ref, name, meet in rows.iterator(chunk_size=5000):
+                    added += self.add(kind, ref, name, meet)
+            self._watermark = started_at
+        except Exception as e:
+            logger.warning(f"자동완성 색인 갱신 실패: {str(e)}")
+            return 0
+
+        if added:
+            logger.info(f"자동완성 색인 {added}건 추가 (전체 {len(self)}건)")
+        return added
+
+    # ---- 검색 ----
+
+    def search(self, query: str, kinds: Iterable[str] = None, meet: int = None,
+               limit: int = 10) -> List[NameEntry]:
+        """
+        자동완성 검색
+
+        일치 순서: 이름 완전 일치 > 접두어 > 부분 문자열, 같은 순위는 짧은 이름 우선.
+        검색어가 초성으로만 되어 있으면 초성 색인에서 찾는다.
+
+        Args:
+            query: 검색어 (예: '천둥', 'ㅊㄷ')
+            kinds: 검색할 종류 (기본: 전체)
+            meet: 경마장 코드로 제한
+            limit: 최대 결과 수
+        """
+        key = normalize(query)
+        if not key:
+            return []
+        kinds = [kind for kind in (kinds or KINDS) if kind in KINDS]
+        use_choseong = is_choseong_query(key)
+        position = 1 if use_choseong else 0
+
+        with self._lock:
+            scored = {}
+            for kind in kinds:
+                key_index = self._choseong[kind] if use_choseong else self._names[kind]
+                # 경마장 필터로 걸러질 수 있으므로 넉넉히 가져옴
+                for entry_id in key_index.prefix(key, limit * 4):
+                    scored[entry_id] = 0 if self._keys[entry_id][position] == key else 1
+                if len(key) >= 2:
+                    for entry_id in key_index.contains(key):
+                        if entry_id not in scored and key in self._keys[entry_id][position]:
+                            scored[entry_id] = 2
+
+            ranked = sorted(
+                scored.items(),
+                key=lambda pair: (pair[1], len(self._entries[pair[0]].name), self._entries[pair[0]].name)
+            )
+            results = []
+            for entry_id, _ in ranked:
+                entry = self._entries[entry_id]
+                if meet and entry.meet and entry.meet != meet:
+                    continue
+                results.append(entry)
+                if len(results) >= limit:
+                    break
+            return results
+
+
+# 프로세스 공용 인스턴스
+_name_index: Optional[NameIndex] = None
+_name_index_lock = threading.Lock()
+
+
+def get_name_index(refresh: bool = True) -> NameIndex:
+    """
+    프로세스 공용 자동완성 색인 반환
+
+    Args:
+        refresh: 로컬 저장소 변경분 반영 여부 (확인 주기 내에는 DB를 읽지 않음)
+    """
+    global _name_index
+    if _name_index is None:
+        with _name_index_lock:
+            if _name_index is None:
+                _name_index = NameIndex()
+    if refresh:
+        _name_index.refresh_from_db()
+    return _name_index
@@ -0,0 +1,118 @@
+"""
+예측 결과 캐시 (내용 주소 기반)
+
+두 모델의 예측과 베팅 추천 결과를 입력 내용의 해시를 키로 공유 캐시에 저장한다.
+같은 경주를 같은 가중치로 여는 모든 사용자는 한 번 계산한 결과를 같이 쓴다.
+
+키에 들어가는 입력 (이미 저장된 값만 사용, 모델 입력 데이터 조회는 캐시에 없을 때만)
+- 출전마 원본 행 해시 (출전번호순, 키 순서/값 타입과 무관한 row_hash)
+- 경주마 최근 성적(feature_store), 기수/조교사 레이팅의 버전 (성적이 반영될 때 바뀜)
+- AI 모델 버전 (학습 모델 교체 시 변경), 사용자 모델 버전과 정규화된 가중치
+
+출전표 내용, 누적 성적, 모델 버전이 바뀌면 키가 달라지므로 따로 무효화하지 않는다
+(이전 키는 TTL로 만료). 기본 가중치 결과는 경주일 동안 두 계층에 보관하고, 사용자 가중치
+결과는 조합이 많으므로 공유 캐시(L2)에만 짧게 보관한다.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Dict, List, Sequence
+
+from .feature_store import get_horse_form_store
+from .ingestion import row_hash
+from .ratings import get_rating_table
+from .response_cache import get_response_cache
+from .runners import Runner, to_runners
+from .ttl_policy import DAY
+
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionCache:
+    """내용 해시 키 예측 결과 캐시"""
+
+    TIMEOUT = 2 * DAY               # 기본 가중치
+    USER_WEIGHTS_TIMEOUT = 60 * 60  # 사용자 가중치
+
+    def __init__(self):
+        self.cache = get_response_cache()
+
+    @staticmethod
+    def _service(user_weights: Dict = None):
+        from .prediction_models import PredictionService
+        service = PredictionService()
+        if user_weights:
+            service.user_model.update_weights(user_weights)
+        return service
+
+    @staticmethod
+    def key(service, runners: Sequence[Runner]) -> str:
+        """
+        예측 입력 내용의 해시 키
+
+        경주마 최근 성적과 레이팅은 출전 행(마번/경주일자, 기수/조교사)과 누적 값 버전으로 정해지므로
+        출전마별 값을 조회하지 않고 버전만 키에 넣는다.
+        """
+        digest = hashlib.sha1()
+        digest.update(json.dumps({
+            'ai': str(service.ai_model.version),
+            'user': str(service.user_model.version),
+            'weights': sorted(service.user_model.user_weights.items()),
+            'forms': get_horse_form_store().version(),
+            'ratings': get_rating_table().version(),
+        }, sort_keys=True, default=str).encode('utf-8'))
+        for runner in runners:
+            digest.update(row_hash(runner.item).encode('ascii'))
+        return f"kra_prediction:{digest.hexdigest()}"
+
+    def get_or_compute(self, runners: Sequence, user_weights: Dict = None, refresh: bool = False) -> Dict:
+        """
+        경주 예측 (같은 입력의 저장된 결과가 있으면 재사용)
+
+        Args:
+            runners: 출전마 레코드 또는 출전표/성적 item 목록
+            user_weights: 사용자 가중치 (없으면 기본 가중치)
+            refresh: 저장된 결과를 무시하고 다시 계산해 저장
+
+        Returns:
+            PredictionService.get_predictions()와 같은 형식
+        """
+        runners = to_runners(runners)
+        service = self._service(user_weights)
+        key = self.key(service, runners)
+
+        if not refresh:
+            predictions = self.cache.get(key, l1=not user_weights)
+            if predictions is not None:
+                return predictions
+
+        predictions = service.get_predictions({'horses': [runner.item for runner in runners], 'runners': runners})
+        if 'error' not in predictions:
+            if user_weights:
+                self.cache.set(key, predictions, self.USER_WEIGHTS_TIMEOUT, l1=False)
+            else:
+                self.cache.set(key, predictions, self.TIMEOUT)
+        return predictions
+
+    def compute(self, runners: Sequence, user_weights: Dict = None) -> Dict:
+        """다시 계산해 저장 (출전표 변경 감지 후 미리 계산할 때 사용)"""
+        return self.get_or_compute(runners, user_weights, refresh=True)
+
+    def warm_day(self, race_cards, meet: int, date: str) -> List[str]:
+        """
+        하루치 경주의 기본 가중치 예측을 미리 계산 (이미 저장된 경주는 건너뜀)
+
+        Returns:
+            예측한 경주번호 목록
+        """
+        card = race_cards.get(meet, date)
+        races = card.get('runners') or card.get('races') or {}
+        warmed = []
+        for rc_no, runners in races.items():
+            if runners:
+                self.get_or_compute(runners)
+                warmed.append(rc_no)
+        logger.info(f"예측 캐시 예열 {meet} {date}: {len(warmed)}경주")
+        return warmed
@@ -15,6 +15,13 @@ from django.core.cache import cache
 from django.db import models
 import logging
 
+from .batch_scoring import (column_matrix, name_scores, py_max0, py_min100, rounded_scores,
+                            runner_columns, weighted_sum)
+from .feature_store import get_horse_form_store
+from .model_registry import ModelArtifact, get_model_registry
+from .ratings import get_rating_table
+from .runners import Runner, to_runners
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +36,31 @@ class PredictionModel:
     def predict(self, race_data: Dict) -> List[Dict]:
         """경주 예측 (서브클래스에서 구현)"""
         raise NotImplementedError
+    
+    def score_weights(self) -> Tuple[List[str], List[float]]:
+        """가중합에 쓰는 (특성 이름 목록, 가중치 목록) (서브클래스에서 구현)"""
+        raise NotImplementedError
+    
+    def feature_columns(self, runners: List[Runner]) -> Dict[str, np.ndarray]:
+        """출전마 레코드 목록의 특성 열 (출전마별 계산과 같은 값, 서브클래스에서 구현)"""
+        raise NotImplementedError
+    
+    def prepare(self, runners: List[Runner]) -> List[Runner]:
+        """특성 계산 전 출전마 레코드에 필요한 데이터 연결 (기본: 없음)"""
+        return runners
+    
+    def batch_scores(self, runners: List[Runner]) -> np.ndarray:
+        """출전마 전체의 점수 (일괄 계산용, 반올림 전)"""
+        keys, weights = self.score_weights()
+        return weighted_sum(column_matrix(self.feature_columns(runners), keys, len(runners)), weights)
+    
+    @staticmethod
+    def rank(predictions: List[Dict]) -> List[Dict]:
+        """승률 기준 순위 매기기 (동점은 출전 순서 유지)"""
+        predictions.sort(key=lambda x: x['win_probability'], reverse=True)
+        for i, pred in enumerate(predictions):
+            pred['rank_prediction'] = i + 1
+        return predictions
         
     def get_accuracy(self) -> float:
         """모델 정확도 반환"""
@@ -39,7 +71,26 @@ class PredictionModel:
 class AIPredictionModel(PredictionModel):
     """AI 자동 학습 예측 모델"""
     
-    def __init__(self):
+    # 모델 보관소 이름 (게시된 학습 모델이 있으면 사용, train_model 명령으로 학습/게시)
+    REGISTRY_NAME = 'ai_auto'
+    
+    # 학습 모델이 없을 때 사용하는 가중치 기반 점수 계산
+    SCORE_WEIGHTS = {
+        'recent_wins': 0.25,
+        'win_rate': 0.20, 
+        'jockey_rating': 0.15,
+        'trainer_rating': 0.10,
+        'weight_rating': 0.10,
+        'distance_fit': 0.05,
+        'track_condition': 0.05,
+        'odds_rating': 0.10
+    }
+    
+    def __init__(self, registry=None, forms=None, ratings=None):
+        self.registry = registry or get_model_registry()
+        self.forms = forms or get_horse_form_store()
+        # 기수/조교사 레이팅 (기본: 프로세스 공용 테이블, 학습 시에는 경주일 시점 RatingReplay)
+        self.ratings = ratings
         super().__init__("AI_AUTO")
         self.features = [
             'recent_wins',      # 최근 승수
@@ -52,20 +103,19 @@ class AIPredictionModel(PredictionModel):
             'odds_rating',      # 배당률 점수
         ]
         
-    def extract_features(self, horse_data: Dict) -> Dict[str, float]:
-        """말 데이터에서 특성 추출 (출전표/성적 API 모두 지원)"""
+    def extract_features(self, horse_data) -> Dict[str, float]:
+        """말 데이터(출전마 레코드 또는 출전표/성적 item)에서 특성 추출"""
         try:
-            features = {}
+            runner = horse_data if isinstance(horse_data, Runner) else Runner(horse_data)
+            if not runner.valid:
+                raise ValueError(f"수치 필드 변환 실패: {runner.hr_name}")
             
-            # API 데이터 타입 확인 (출전표 vs 성적)
-            is_entry_data = 'hrAge' in horse_data  # 출전표 API는 hrAge 필드 있음
-            
-            if is_entry_data:
+            if runner.is_entry:
                 # 출전표 데이터 처리 (예정된 경주)
-                features = self._extract_entry_features(horse_data)
+                features = self._extract_entry_features(runner)
             else:
                 # 성적 데이터 처리 (완료된 경주)
-                features = self._extract_result_features(horse_data)
+                features = self._extract_result_features(runner)
                 
             return features
             
@@ -73,29 +123,34 @@ class AIPredictionModel(PredictionModel):
             logger.error(f"특성 추출 오류: {str(e)}")
             return {feature: 50.0 for feature in self.features}
     
-    def _extract_entry_features(self, horse_data: Dict) -> Dict[str, float]:
+    def _extract_entry_features(self, runner: Runner) -> Dict[str, float]:
         """출전표 데이터에서 특성 추출"""
         features = {}
         
         # 출전표에서는 과거 성적이 제한적이므로 기본값 사용
-        features['recent_wins'] = 2.0  # 평균값
-        features['recent_races'] = 10.0  # 평균값  
-        features['win_rate'] = 0.2  # 20% 기본 승률
+        form = runner.form
+        if form:
+            # 경주마 최근 성적 (feature_store)
+            features['recent_wins'] = form['recent_wins']
+            features['recent_races'] = form['recent_races']
+            features['win_rate'] = form['win_rate']
+        else:
+            features['recent_wins'] = 2.0  # 평균값
+            features['recent_races'] = 10.0  # 평균값  
+            features['win_rate'] = 0.2  # 20% 기본 승률
         
         # 기수/조교사 레이팅
-        features['jockey_rating'] = self._calculate_person_rating(horse_data.get('jkName', ''))
-        features['trainer_rating'] = self._calculate_person_rating(horse_data.get('trName', ''))
+        features['jockey_rating'] = self._calculate_person_rating(runner.jk_name, 'jockey', runner.jk_no)
+        features['trainer_rating'] = self._calculate_person_rating(runner.tr_name, 'trainer', runner.tr_no)
         
         # 마체중 점수 (출전표에서는 예상 체중)
-        weight_str = horse_data.get('wgHr', '500')
-        try:
-            weight = float(weight_str.split('(')[0]) if '(' in weight_str else float(weight_str or 500)
-            features['weight_rating'] = max(0, 100 - abs(weight - 500) / 5)
-        except:
+        if runner.weight is not None:
+            features['weight_rating'] = max(0, 100 - abs(runner.weight - 500) / 5)
+        else:
             features['weight_rating'] = 70.0
         
         # 나이 기반 점수 (4-6세가 전성기)
-        age = int(horse_data.get('hrAge', 5) or 5)
+        age = runner.age
         if 4 <= age <= 6:
             age_score = 90.0
         elif age == 3 or age == 7:
@@ -105,7 +160,7 @@ class AIPredictionModel(PredictionModel):
         features['distance_fit'] = age_score
         
         # 성별 기반 점수 (수말이 일반적으로 유리)
-        sex = horse_data.get('hrSex', 'M')
+        sex = runner.sex
         sex_score = 80.0 if sex == 'M' else 70.0 if sex == 'F' else 60.0
         features['track_condition'] = sex_score
         
@@ -114,28 +169,26 @@ class AIPredictionModel(PredictionModel):
         
         return features
     
-    def _extract_result_features(self, horse_data: Dict) -> Dict[str, float]:
+    def _extract_result_features(self, runner: Runner) -> Dict[str, float]:
         """성적 데이터에서 특성 추출 (기존 로직)"""
         features = {}
         
         # 최근 성적 기반 특성
-        recent_wins = int(horse_data.get('win1', 0) or 0)
-        recent_races = int(horse_data.get('totCnt1', 0) or 0)
+        recent_wins = runner.wins
+        recent_races = runner.starts
         
         features['recent_wins'] = recent_wins
         features['recent_races'] = recent_races
         features['win_rate'] = recent_wins / max(recent_races, 1)
         
         # 기수/조교사 레이팅
-        features['jockey_rating'] = self._calculate_person_rating(horse_data.get('jkName', ''))
-        features['trainer_rating'] = self._calculate_person_rating(horse_data.get('trName', ''))
+        features['jockey_rating'] = self._calculate_person_rating(runner.jk_name, 'jockey', runner.jk_no)
+        features['trainer_rating'] = self._calculate_person_rating(runner.tr_name, 'trainer', runner.tr_no)
         
         # 마체중 점수 (450-550kg가 적정)
-        weight_str = horse_data.get('wgHr', '500')
-        try:
-            weight = float(weight_str.split('(')[0]) if '(' in weight_str else float(weight_str or 500)
-            features['weight_rating'] = max(0, 100 - abs(weight - 500) / 5)
-        except:
+        if runner.weight is not None:
+            features['weight_rating'] = max(0, 100 - abs(runner.weight - 500) / 5)
+        else:
             features['weight_rating'] = 70.0
         
         # 거리 적합도 (실제 성적 기반)
@@ -145,70 +198,137 @@ class AIPredictionModel(PredictionModel):
         features['track_condition'] = 50.0 + (features['win_rate'] * 30)
         
         # 배당률 점수 (낮을수록 유리)
-        odds = float(horse_data.get('winOdds', 10) or 10)
+        odds = runner.win_odds
         features['odds_rating'] = max(0, 100 - odds * 5)
         
         return features
     
-    def _calculate_person_rating(self, name: str) -> float:
-        """기수/조교사 레이팅 계산 (임시 구현)"""
-        if not name:
-            return 50.0
+    def feature_columns(self, runners: List[Runner]) -> Dict[str, np.ndarray]:
+        """
+        특성 열 (일괄 계산용, _extract_entry_features/_extract_result_features와 같은 계산식)
+        """
+        self.prepare(runners)
+        cols = runner_columns(runners)
+        has_form = cols['has_form']
+        entry = cols['is_entry']
+        jockey, jockey_ok = name_scores([(r.jk_name, 'jockey', r.jk_no) for r in runners], self._calculate_person_rating)
+        trainer, trainer_ok = name_scores([(r.tr_name, 'trainer', r.tr_no) for r in runners], self._calculate_person_rating)
+        
+        wins, starts = cols['wins'], cols['starts']
+        win_rate = wins / np.maximum(starts, 1)
+        age = cols['age']
+        
+        features = {
+            'recent_wins': np.where(entry, np.where(has_form, cols['form_recent_wins'], 2.0), wins),
+            'recent_races': np.where(entry, np.where(has_form, cols['form_recent_races'], 10.0), starts),
+            'win_rate': np.where(entry, np.where(has_form, cols['form_win_rate'], 0.2), win_rate),
+            'jockey_rating': jockey,
+            'trainer_rating': trainer,
+            'weight_rating': np.where(cols['has_weight'], py_max0(100 - np.abs(cols['weight'] - 500) / 5), 70.0),
+            'distance_fit': np.where(
+                entry,
+                np.where((age >= 4) & (age <= 6), 90.0, np.where((age == 3) | (age == 7), 70.0, 50.0)),
+                60.0 + wins * 5,
+            ),
+            'track_condition': np.where(
+                entry,
+                np.where(cols['is_male'], 80.0, np.where(cols['is_female'], 70.0, 60.0)),
+                50.0 + win_rate * 30,
+            ),
+            'odds_rating': np.where(entry, 50.0, py_max0(100 - cols['win_odds'] * 5)),
+        }
         
-        # 간단한 해시 기반 점수 (실제로는 성적 데이터 기반으로 계산)
-        hash_score = sum(ord(c) for c in name) % 50
-        return 30.0 + hash_score
+        # 특성 추출 실패 시 기본값 (extract_features와 같음: win_rate는 없음 -> 가중합에서 50)
+        fallback = ~(cols['valid'] & jockey_ok & trainer_ok)
+        for name in features:
+            features[name] = np.where(fallback, 50.0, features[name])
+        return features
+    
+    def _calculate_person_rating(self, name: str, kind: str = 'jockey', ref_no: str = None) -> float:
+        """기수/조교사 레이팅 (누적 승률 기반 30~80, 기록이 없으면 55)"""
+        return (self.ratings or get_rating_table()).score(kind, name, ref_no, low=30.0, high=80.0)
+    
+    def score_weights(self) -> Tuple[List[str], List[float]]:
+        return list(self.SCORE_WEIGHTS), list(self.SCORE_WEIGHTS.values())
+    
+    def prepare(self, runners: List[Runner]) -> List[Runner]:
+        """출전마 레코드에 경주일자 시점의 경주마 최근 성적 연결 (경주 출전마 전체를 한 번에 조회)"""
+        return self.forms.attach(runners)
+    
+    def artifact(self) -> Optional[ModelArtifact]:
+        """사용 중인 학습 모델 (없으면 None, 가중합 사용)"""
+        return self.registry.get(self.REGISTRY_NAME)
+    
+    @property
+    def version(self):
+        artifact = self.artifact()
+        return artifact.version if artifact is not None else self._version
+    
+    @version.setter
+    def version(self, value):
+        self._version = value
+    
+    def get_accuracy(self) -> float:
+        """모델 정확도 (학습 모델은 메타데이터의 검증 정확도)"""
+        artifact = self.artifact()
+        if artifact is not None:
+            return artifact.accuracy
+        return super().get_accuracy()
+    
+    def _artifact_scores(self, runners: List[Runner], artifact: ModelArtifact) -> np.ndarray:
+        matrix = column_matrix(self.feature_columns(runners), artifact.features, len(runners))
+        return artifact.score(matrix)
+    
+    def batch_scores(self, runners: List[Runner]) -> np.ndarray:
+        artifact = self.artifact()
+        if artifact is not None:
+            return self._artifact_scores(runners, artifact)
+        return super().batch_scores(runners)
     
     def predict(self, race_data: Dict) -> List[Dict]:
-        """AI 모델 예측"""
+        """AI 모델 예측 (race_data: {'horses': [...]} 또는 {'runners': [...]})"""
         try:
-            horses = race_data.get('horses', [])
-            if not horses:
+            runners = race_data.get('runners') or to_runners(race_data.get('horses', []))
+            if not runners:
                 return []
             
-            predictions = []
+            self.prepare(runners)
+            features_list = [self.extract_features(runner) for runner in runners]
             
-            for horse in horses:
-                features = self.extract_features(horse)
-                
-                # 간단한 가중치 기반 점수 계산 (실제로는 ML 모델 사용)
-                weights = {
-                    'recent_wins': 0.25,
-                    'win_rate': 0.20, 
-                    'jockey_rating': 0.15,
-                    'trainer_rating': 0.10,
-                    'weight_rating': 0.10,
-                    'distance_fit': 0.05,
-                    'track_condition': 0.05,
-                    'odds_rating': 0.10
-                }
-                
-                # 가중 평균 계산
-                total_score = sum(features.get(key, 50) * weight 
-                                for key, weight in weights.items())
-                
-                # 0-100 범위로 정규화
-                win_probability = max(0, min(100, total_score))
-                
-                predictions.append({
-                    'horse_name': horse.get('hrName', ''),
-                    'horse_no': horse.get('hrNo', ''),
-                    'chul_no': horse.get('chulNo', ''),  # 출전번호 추가
-                    'win_probability': round(win_probability, 1),
-                    'features': features,
-                    'rank_prediction': 0  # 나중에 순위 매김
-                })
+            artifact = self.artifact()
+            if artifact is not None:
+                # 학습 모델: 1착 확률 x 100
+                win_probabilities = rounded_scores(self._artifact_scores(runners, artifact), clip=True)
+            else:
+                # 가중 평균 계산 후 0-100 범위로 정규화 (여러 경주 일괄 계산은 BatchScorer)
+                weights = self.SCORE_WEIGHTS
+                win_probabilities = [
+                    round(max(0, min(100, sum(features.get(key, 50) * weight for key, weight in weights.items()))), 1)
+                    for features in features_list
+                ]
             
-            # 승률 기준 순위 매기기
-            predictions.sort(key=lambda x: x['win_probability'], reverse=True)
-            for i, pred in enumerate(predictions):
-                pred['rank_prediction'] = i + 1
-                
-            return predictions
+            return self.build_predictions(runners, features_list, win_probabilities)
             
         except Exception as e:
             logger.error(f"AI 예측 오류: {str(e)}")
             return []
+    
+    def build_predictions(self, runners: List[Runner], features_list: List[Dict],
+                          win_probabilities: List[float]) -> List[Dict]:
+        """예측 결과 목록 생성 (승률 기준 순위 매김)"""
+        predictions = []
+        for runner, features, win_probability in zip(runners, features_list, win_probabilities):
+            predictions.append({
+                'horse_name': runner.hr_name,
+                'horse_no': runner.hr_no,
+                'chul_no': runner.chul_no,  # 출전번호 추가
+                'win_probability': win_probability,
+                'features': features,
+                'rank_prediction': 0  # 나중에 순위 매김
+            })
+        
+        # 승률 기준 순위 매기기
+        return self.rank(predictions)
 
 
 class UserParameterModel(PredictionModel):
@@ -257,57 +377,63 @@ class UserParameterModel(PredictionModel):
             
         logger.info(f"사용자 가중치 업데이트 완료: {self.user_weights}")
     
+    def score_weights(self) -> Tuple[List[str], List[float]]:
+        return list(self.user_weights), [weight / 100 for weight in self.user_weights.values()]
+    
     def predict(self, race_data: Dict) -> List[Dict]:
-        """사용자 파라미터 모델 예측"""
+        """사용자 파라미터 모델 예측 (race_data: {'horses': [...]} 또는 {'runners': [...]})"""
         try:
-            horses = race_data.get('horses', [])
-            if not horses:
+            runners = race_data.get('runners') or to_runners(race_data.get('horses', []))
+            if not runners:
                 return []
             
-            predictions = []
+            scores_list = [self._calculate_parameter_scores(runner) for runner in runners]
             
-            for horse in horses:
-                scores = self._calculate_parameter_scores(horse)
-                
-                # 사용자 가중치 적용
-                weighted_score = sum(scores.get(param, 50) * (weight/100) 
-                                   for param, weight in self.user_weights.items())
-                
-                predictions.append({
-                    'horse_name': horse.get('hrName', ''),
-                    'horse_no': horse.get('hrNo', ''),
-                    'chul_no': horse.get('chulNo', ''),  # 출전번호 추가
-                    'win_probability': round(weighted_score, 1),
-                    'parameter_scores': scores,
-                    'applied_weights': self.user_weights.copy(),
-                    'rank_prediction': 0
-                })
+            # 사용자 가중치 적용 (여러 경주 일괄 계산은 BatchScorer)
+            weighted_scores = [
+                round(sum(scores.get(param, 50) * (weight/100) for param, weight in self.user_weights.items()), 1)
+                for scores in scores_list
+            ]
             
-            # 승률 기준 순위 매기기
-            predictions.sort(key=lambda x: x['win_probability'], reverse=True)
-            for i, pred in enumerate(predictions):
-                pred['rank_prediction'] = i + 1
-                
-            return predictions
+            return self.build_predictions(runners, scores_list, weighted_scores)
             
         except Exception as e:
             logger.error(f"사용자 파라미터 예측 오류: {str(e)}")
             return []
     
-    def _calculate_parameter_scores(self, horse: Dict) -> Dict[str, float]:
-        """각 파라미터별 점수 계산 (출전표/성적 API 모두 지원)"""
+    def build_predictions(self, runners: List[Runner], scores_list: List[Dict],
+                          weighted_scores: List[float]) -> List[Dict]:
+        """예측 결과 목록 생성 (승률 기준 순위 매김)"""
+        predictions = []
+        for runner, scores, weighted_score in zip(runners, scores_list, weighted_scores):
+            predictions.append({
+                'horse_name': runner.hr_name,
+                'horse_no': runner.hr_no,
+                'chul_no': runner.chul_no,  # 출전번호 추가
+                'win_probability': weighted_score,
+                'parameter_scores': scores,
+                'applied_weights': self.user_weights.copy(),
+                'rank_prediction': 0
+            })
+        
+        # 승률 기준 순위 매기기
+        return self.rank(predictions)
+    
+    def _calculate_parameter_scores(self, horse) -> Dict[str, float]:
+        """각 파라미터별 점수 계산 (출전마 레코드 또는 출전표/성적 item)"""
         scores = {}
         
         try:
-            # API 데이터 타입 확인 (출전표 vs 성적)
-            is_entry_data = 'hrAge' in horse  # 출전표 API는 hrAge 필드 있음
+            runner = horse if isinstance(horse, Runner) else Runner(horse)
+            if not runner.valid:
+                raise ValueError(f"수치 필드 변환 실패: {runner.hr_name}")
             
-            if is_entry_data:
+            if runner.is_entry:
                 # 출전표 데이터 처리
-                scores = self._calculate_entry_scores(horse)
+                scores = self._calculate_entry_scores(runner)
             else:
                 # 성적 데이터 처리 (기존 로직)
-                scores = self._calculate_result_scores(horse)
+                scores = self._calculate_result_scores(runner)
             
         except Exception as e:
             logger.error(f"파라미터 점수 계산 오류: {str(e)}")
@@ -317,7 +443,7 @@ class UserParameterModel(PredictionModel):
                 
         return scores
     
-    def _calculate_entry_scores(self, horse: Dict) -> Dict[str, float]:
+    def _calculate_entry_scores(self, runner: Runner) -> Dict[str, float]:
         """출전표 데이터로 파라미터 점수 계산"""
         scores = {}
         
@@ -325,23 +451,19 @@ class UserParameterModel(PredictionModel):
         scores['recent_performance'] = 60.0  # 기본값
         
         # 기수 실력 (이름 기반 점수)
-        jockey_name = horse.get('jkName', '')
-        scores['jockey_skill'] = self._get_person_score(jockey_name)
+        scores['jockey_skill'] = self._get_person_score(runner.jk_name, 'jockey', runner.jk_no)
         
         # 조교사 실력
-        trainer_name = horse.get('trName', '')
-        scores['trainer_skill'] = self._get_person_score(trainer_name)
+        scores['trainer_skill'] = self._get_person_score(runner.tr_name, 'trainer', runner.tr_no)
         
         # 말 컨디션 (마체중 + 나이 기반)
-        weight_str = horse.get('wgHr', '500')
-        try:
-            weight = float(weight_str.split('(')[0]) if '(' in weight_str else float(weight_str or 500)
-            weight_score = max(0, 100 - abs(weight - 500) / 2)
-        except:
+        if runner.weight is not None:
+            weight_score = max(0, 100 - abs(runner.weight - 500) / 2)
+        else:
             weight_score = 70.0
             
         # 나이 보정 (4-6세가 전성기)
-        age = int(horse.get('hrAge', 5) or 5)
+        age = runner.age
         if 4 <= age <= 6:
             age_bonus = 10.0
         elif age == 3 or age == 7:
@@ -352,7 +474,7 @@ class UserParameterModel(PredictionModel):
         scores['horse_condition'] = min(100, weight_score + age_bonus)
         
         # 거리 경험 (나이와 성별 기반 추정)
-        sex = horse.get('hrSex', 'M')
+        sex = runner.sex
         base_exp = 70.0 if age >= 4 else 50.0
         sex_bonus = 5.0 if sex == 'M' else 0.0
         scores['distance_experience'] = min(100, base_exp + sex_bonus)
@@ -365,31 +487,27 @@ class UserParameterModel(PredictionModel):
         
         return scores
     
-    def _calculate_result_scores(self, horse: Dict) -> Dict[str, float]:
+    def _calculate_result_scores(self, runner: Runner) -> Dict[str, float]:
         """성적 데이터로 파라미터 점수 계산 (기존 로직)"""
         scores = {}
         
         # 최근 성적 (승률 기반)
-        recent_wins = int(horse.get('win1', 0) or 0)
-        recent_races = int(horse.get('totCnt1', 0) or 0)
+        recent_wins = runner.wins
+        recent_races = runner.starts
         win_rate = (recent_wins / max(recent_races, 1)) * 100
         scores['recent_performance'] = min(100, win_rate * 5)  # 20% 승률 = 100점
         
         # 기수 실력 (이름 기반 임시 점수)
-        jockey_name = horse.get('jkName', '')
-        scores['jockey_skill'] = self._get_person_score(jockey_name)
+        scores['jockey_skill'] = self._get_person_score(runner.jk_name, 'jockey', runner.jk_no)
         
         # 조교사 실력
-        trainer_name = horse.get('trName', '')
-        scores['trainer_skill'] = self._get_person_score(trainer_name)
+        scores['trainer_skill'] = self._get_person_score(runner.tr_name, 'trainer', runner.tr_no)
         
         # 말 컨디션 (마체중 기반)
-        weight_str = horse.get('wgHr', '500')
-        try:
-            weight = float(weight_str.split('(')[0]) if '(' in weight_str else float(weight_str or 500)
-            weight_diff = abs(weight - 500)
+        if runner.weight is not None:
+            weight_diff = abs(runner.weight - 500)
             scores['horse_condition'] = max(0, 100 - weight_diff / 2)
-        except:
+        else:
             scores['horse_condition'] = 70.0
         
         # 거리 경험 (성적 기반)
@@ -399,19 +517,53 @@ class UserParameterModel(PredictionModel):
         scores['track_condition'] = 50.0 + (win_rate * 2)
         
         # 배당률 요소 (낮을수록 유리)
-        odds = float(horse.get('winOdds', 10) or 10)
+        odds = runner.win_odds
         scores['odds_factor'] = max(0, min(100, 100 - odds * 3))
         
         return scores
     
-    def _get_person_score(self, name: str) -> float:
-        """기수/조교사 점수 계산 (임시 구현)"""
-        if not name:
-            return 50.0
-            
-        # 실제로는 DB에서 성적 조회
-        hash_score = sum(ord(c) for c in name) % 40
-        return 40.0 + hash_score
+    def feature_columns(self, runners: List[Runner]) -> Dict[str, np.ndarray]:
+        """
+        파라미터 점수 열 (일괄 계산용, _calculate_entry_scores/_calculate_result_scores와 같은 계산식)
+        """
+        cols = runner_columns(runners)
+        entry = cols['is_entry']
+        jockey, jockey_ok = name_scores([(r.jk_name, 'jockey', r.jk_no) for r in runners], self._get_person_score)
+        trainer, trainer_ok = name_scores([(r.tr_name, 'trainer', r.tr_no) for r in runners], self._get_person_score)
+        
+        wins, starts, age, male = cols['wins'], cols['starts'], cols['age'], cols['is_male']
+        win_rate = (wins / np.maximum(starts, 1)) * 100
+        weight_score = py_max0(100 - np.abs(cols['weight'] - 500) / 2)
+        has_weight = cols['has_weight']
+        age_bonus = np.where((age >= 4) & (age <= 6), 10.0, np.where((age == 3) | (age == 7), 0.0, -10.0))
+        
+        scores = {
+            'recent_performance': np.where(entry, 60.0, py_min100(win_rate * 5)),
+            'jockey_skill': jockey,
+            'trainer_skill': trainer,
+            'horse_condition': np.where(
+                entry,
+                py_min100(np.where(has_weight, weight_score, 70.0) + age_bonus),
+                np.where(has_weight, weight_score, 70.0),
+            ),
+            'distance_experience': np.where(
+                entry,
+                py_min100(np.where(age >= 4, 70.0, 50.0) + np.where(male, 5.0, 0.0)),
+                50.0 + wins * 3,
+            ),
+            'track_condition': np.where(entry, np.where(male, 75.0, 70.0), 50.0 + win_rate * 2),
+            'odds_factor': np.where(entry, 50.0, py_max0(py_min100(100 - cols['win_odds'] * 3))),
+        }
+        
+        # 점수 계산 실패 시 기본 점수 (_calculate_parameter_scores와 같음)
+        fallback = ~(cols['valid'] & jockey_ok & trainer_ok)
+        for param in scores:
+            scores[param] = np.where(fallback, 50.0, scores[param])
+        return scores
+    
+    def _get_person_score(self, name: str, kind: str = 'jockey', ref_no: str = None) -> float:
+        """기수/조교사 점수 (누적 승률 기반 40~80, 기록이 없으면 60)"""
+        return get_rating_table().score(kind, name, ref_no, low=40.0, high=80.0)
 
 
 class BettingRecommendationService:
@@ -532,8 +684,16 @@ class PredictionService:
         self.betting_service = BettingRecommendationService()
     
     def get_predictions(self, race_data: Dict, user_weights: Dict = None) -> Dict:
-        """두 모델의 예측 결과 및 베팅 추천 반환"""
+        """
+        두 모델의 예측 결과 및 베팅 추천 반환
+
+        race_data: {'horses': [출전표/성적 item, ...]} 또는 {'runners': [Runner, ...]}
+        (item만 주어지면 한 번 변환해 두 모델이 같은 레코드를 사용)
+        """
         try:
+            if not race_data.get('runners'):
+                race_data = dict(race_data, runners=to_runners(race_data.get('horses', [])))
+            
             # AI 모델 예측
             ai_predictions = self.ai_model.predict(race_data)
             
@@ -562,7 +722,7 @@ class PredictionService:
                 },
                 'betting_recommendations': betting_recommendations,
                 'race_info': {
-                    'horse_count': len(race_data.get('horses', [])),
+                    'horse_count': len(race_data['runners']),
                     'predicted_at': datetime.now().isoformat()
                 }
             }
@@ -0,0 +1,131 @@
+"""
+경주 개최일 달력
+
+연 단위 경주계획표(racePlan_2, rc_year)로 (경마장, 날짜)별 경주 수를 만들어 공유 캐시에 보관한다.
+경주가 없는 날(공휴일, 제주만 열리는 날, 특별 경주일 등)은 upstream을 호출하지 않고 바로 답하고,
+다음/이전 개최일도 API 탐색 없이 찾는다.
+
+- 지난 해: 해가 끝난 뒤 한 번 만들면 다시 만들지 않음
+- 올해 이후: 월이 바뀌면 다시 만듦 (계획표가 월별로 추가/변경되므로)
+- 조회 실패 등으로 달력이 비어 있으면 '모름'(None)으로 보고 금/토/일 규칙으로 대체
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from .range_planner import DateLike, is_race_weekday, to_date
+from .response_cache import get_response_cache
+
+
+logger = logging.getLogger(__name__)
+
+DAY = 24 * 60 * 60
+
+
+class RaceCalendar:
+    """(경마장, 날짜)별 경주 수 색인"""
+
+    CACHE_TIMEOUT = 400 * DAY   # 연 단위 달력 보관 기간 (갱신 여부는 built_month로 판단)
+    EMPTY_TIMEOUT = 10 * 60     # 빈 달력(조회 실패 가능성)은 짧게
+    SEARCH_DAYS = 120           # 다음/이전 개최일 탐색 범위
+
+    def __init__(self, api_service):
+        self.api = api_service
+        self.cache = get_response_cache()
+        self._memo: Dict[tuple, Dict[str, int]] = {}  # 인스턴스 수명 동안의 (경마장, 연도) 색인
+
+    def _cache_key(self, meet: int, year: int) -> str:
+        return f"kra_calendar:{meet}:{year}"
+
+    def year_index(self, meet: int, year: int, refresh: bool = False) -> Dict[str, int]:
+        """
+        경마장의 연간 개최일 색인
+
+        Returns:
+            {'YYYYMMDD': 경주 수}, 달력을 만들 수 없으면 빈 딕셔너리
+        """
+        if not refresh and (meet, year) in self._memo:
+            return self._memo[(meet, year)]
+
+        key = self._cache_key(meet, year)
+        current_month = datetime.now().strftime('%Y%m')
+
+        cached = None if refresh else self.cache.get(key)
+        if cached is not None and self._is_fresh(cached, year, current_month):
+            self._memo[(meet, year)] = cached['days']
+            return cached['days']
+
+        races = self.api.get_race_schedule(meet=meet, rc_year=str(year))
+        days: Dict[str, set] = {}
+        for race in races:
+            rc_date = str(race.get('rcDate') or '').replace('-', '')[:8]
+            if len(rc_date) == 8:
+                days.setdefault(rc_date, set()).add(str(race.get('rcNo')))
+        index = {rc_date: len(rc_nos) for rc_date, rc_nos in days.items()}
+
+        if not index and cached is not None:
+            # 갱신 실패 시 이전 달력 유지
+            return cached['days']
+
+        timeout = self.CACHE_TIMEOUT if index else self.EMPTY_TIMEOUT
+        self.cache.set(key, {'built_month': current_month, 'days': index}, timeout)
+        logger.info(f"경주 달력 생성: {self.api.TRACKS.get(meet, meet)} {year}년 {len(index)}일")
+        if index:
+            self._memo[(meet, year)] = index
+        return index
+
+    @staticmethod
+    def _is_fresh(cached: Dict, year: int, current_month: str) -> bool:
+        """이번 달에 만들었거나, 해가 끝난 뒤에 만든 달력이면 최신"""
+        built_month = cached.get('built_month', '')
+        return built_month == current_month or int(built_month[:4] or 0) > year
+
+    def race_count(self, meet: int, day: DateLike) -> Optional[int]:
+        """
+        해당 날짜의 경주 수
+
+        Returns:
+            경주 수 (개최하지 않으면 0), 달력이 없거나 아직 계획이 게시되지 않은 날짜면 None
+        """
+        day = to_date(day)
+        index = self.year_index(meet, day.year)
+        day_str = day.strftime('%Y%m%d')
+        if not index or day_str > max(index):
+            return None
+        return index.get(day_str, 0)
+
+    def is_race_day(self, meet: int, day: DateLike) -> bool:
+        """개최일 여부 (달력이 없으면 금/토/일 규칙)"""
+        count = self.race_count(meet, day)
+        if count is None:
+            return is_race_weekday(to_date(day))
+        return count > 0
+
+    def race_days(self, meet: int, start: DateLike, end: DateLike) -> List[str]:
+        """기간 내 개최일 목록 (YYYYMMDD)"""
+        start, end = to_date(start), to_date(end)
+        days = []
+        day = start
+        while day <= end:
+            if self.is_race_day(meet, day):
+                days.append(day.strftime('%Y%m%d'))
+            day += timedelta(days=1)
+        return days
+
+    def next_race_day(self, day: DateLike = None, meets: Iterable[int] = None) -> Optional[str]:
+        """day 이후(당일 포함) 가장 가까운 개최일 (어느 경마장이든)"""
+        return self._search(day, meets, step=1)
+
+    def previous_race_day(self, day: DateLike = None, meets: Iterable[int] = None) -> Optional[str]:
+        """day 이전(당일 포함) 가장 가까운 개최일 (어느 경마장이든)"""
+        return self._search(day, meets, step=-1)
+
+    def _search(self, day: Optional[DateLike], meets: Optional[Iterable[int]], step: int) -> Optional[str]:
+        day = to_date(day) if day else datetime.now().date()
+        meets = list(meets or self.api.TRACKS.keys())
+        for _ in range(self.SEARCH_DAYS):
+            if any(self.is_race_day(meet, day) for meet in meets):
+                return day.strftime('%Y%m%d')
+            day += timedelta(days=step)
+        return None
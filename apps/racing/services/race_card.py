@@ -0,0 +1,206 @@
+"""
+경주별 출전마 색인 (race card)
+
+(경마장, 날짜)마다 하루치 출전표/경주성적을 한 번만 받아 경주번호(rcNo)별로
+중복 제거 + 출전번호순 정렬한 출전마 목록을 만들고 경주마다 따로 캐시한다
+(키: 경마장, 날짜, 경주번호 + 날짜별 경주번호 목록). 이후 한 경주의 출전마 조회는
+그 경주의 캐시 항목 하나만 읽는다. 예측 모델용 출전마 레코드(Runner)도 색인을 만들 때
+함께 변환해 같은 항목에 넣는다.
+
+- 예정 경주(오늘 이후): 출전표 API
+- 지난 경주: 로컬 저장소에 적재된 성적, 없으면 경주성적 API
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .name_index import get_name_index
+from .response_cache import get_response_cache
+from .runners import Runner, to_runners
+
+
+logger = logging.getLogger(__name__)
+
+
+def race_no_key(value) -> str:
+    """경주번호 정규화 ('01', 1, '1' -> '1')"""
+    try:
+        return str(int(str(value).strip()))
+    except (TypeError, ValueError):
+        return str(value or '').strip()
+
+
+def _chul_no_order(value) -> int:
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return 10 ** 6  # 출전번호가 없거나 잘못된 행은 뒤로
+
+
+def load_stored_results(meet: int, date: str) -> Optional[List[Dict]]:
+    """
+    로컬 저장소에 적재된 지난 경주 성적 조회 (없거나 DB 오류 시 None → API 조회)
+
+    지난 경주 성적은 바뀌지 않으므로 적재된 날짜는 upstream 호출 없이 응답한다.
+    """
+    if date >= datetime.now().strftime('%Y%m%d'):
+        return None
+    try:
+        from ..models import Result
+        rc_date = datetime.strptime(date, '%Y%m%d').date()
+        rows = list(
+            Result.objects.filter(meet=meet, rc_date=rc_date)
+            .order_by('rc_no', 'chul_no')
+            .values_list('raw', flat=True)
+        )
+        return rows or None
+    except Exception as e:
+        logger.warning(f"저장된 경주 성적 조회 실패, API 사용: {str(e)}")
+        return None
+
+
+class RaceCardIndex:
+    """(경마장, 날짜)별 경주번호 -> 출전마 목록 색인"""
+
+    def __init__(self, api_service):
+        self.api = api_service
+        self.cache = get_response_cache()
+
+    @staticmethod
+    def is_future(date: str) -> bool:
+        """오늘 이후 경주 여부 (출전표 사용)"""
+        return date >= datetime.now().strftime('%Y%m%d')
+
+    def _cache_key(self, meet: int, date: str, source: str) -> str:
+        """날짜별 경주번호 목록 키"""
+        return f"kra_race_card:index:{source}:{meet}:{date}"
+
+    def _race_key(self, meet: int, date: str, source: str, rc_no: str) -> str:
+        """경주별 출전마 키"""
+        return f"kra_race_card:race:{source}:{meet}:{date}:{rc_no}"
+
+    def _source(self, date: str) -> str:
+        return 'entry_sheet' if self.is_future(date) else 'race_results'
+
+    def get(self, meet: int, date: str) -> Dict:
+        """
+        하루치 경주별 출전마 색인 (하루 전체가 필요할 때, 한 경주는 race() 사용)
+
+        Returns:
+            {'source': 'entry_sheet'|'race_results', 'races': {rcNo: [출전마, ...]},
+             'runners': {rcNo: [Runner, ...]}}
+        """
+        source = self._source(date)
+        index = self.cache.get(self._cache_key(meet, date, source))
+        if index is not None:
+            card = {'source': source, 'races': {}, 'runners': {}}
+            for rc_no in index:
+                race = self.cache.get(self._race_key(meet, date, source, rc_no))
+                if race is None:
+                    break
+                card['races'][rc_no], card['runners'][rc_no] = race
+            else:
+                return card
+        return self._load(meet, date, source)
+
+    def race(self, meet: int, date: str, rc_no) -> Tuple[List[Dict], List[Runner], bool]:
+        """
+        한 경주의 출전마 (그 경주의 캐시 항목만 읽음)
+
+        Returns:
+            (출전번호순 출전마 목록, 예측용 출전마 레코드 목록, 예정 경주 여부)
+        """
+        source = self._source(date)
+        is_future = source == 'entry_sheet'
+        rc_no = race_no_key(rc_no)
+        race = self.cache.get(self._race_key(meet, date, source, rc_no))
+        if race is not None:
+            return race[0], race[1], is_future
+
+        # 하루치가 캐시되어 있는데 없는 경주 번호면 조회하지 않음
+        index = self.cache.get(self._cache_key(meet, date, source))
+        if index is not None and rc_no not in index:
+            return [], [], is_future
+
+        card = self._load(meet, date, source)
+        return card['races'].get(rc_no, []), card['runners'].get(rc_no, []), is_future
+
+    def _load(self, meet: int, date: str, source: str) -> Dict:
+        if source == 'entry_sheet':
+            rows = self.api.get_entry_sheet(meet=meet, rc_date=date)
+        else:
+            rows = load_stored_results(meet, date)
+            if rows is None:
+                rows = self.api.get_race_results(meet=meet, race_date=date)
+        return self.store(meet, date, rows, source)
+
+    def store(self, meet: int, date: str, rows: List[Dict], source: str = None) -> Dict:
+        """
+        하루치 행 목록으로 색인을 만들어 경주별로 캐시에 저장 (출전표 변경 감지 등에서 새 응답을 반영할 때 사용)
+
+        Returns:
+            get()과 같은 형식의 색인
+        """
+        source = source or self._source(date)
+        params = ({'meet': meet, 'rc_date': date} if source == 'entry_sheet'
+                  else {'meet': meet, 'race_date': date})
+
+        races = self.build(rows, date)
+        card = {
+            'source': source,
+            'races': races,
+            'runners': {rc_no: to_runners(runners) for rc_no, runners in races.items()},
+        }
+        # 새로 등장한 마명/기수명/조교사명을 자동완성 색인에 추가
+        get_name_index(refresh=False).observe(rows, meet)
+        if rows:
+            # 원본 응답과 같은 TTL (당일/미래는 짧게, 확정된 과거는 길게), 빈 응답은 조회 실패일 수 있어 저장 안 함
+            timeout = self.api.ttl_policy.ttl_for(self.api.ENDPOINTS[source], params, len(rows))
+            for rc_no, runners in races.items():
+                self.cache.set(self._race_key(meet, date, source, rc_no), (runners, card['runners'][rc_no]), timeout)
+            # 경주번호 목록은 경주 항목을 모두 넣은 뒤 저장
+            self.cache.set(self._cache_key(meet, date, source), list(races), timeout)
+        return card
+
+    @staticmethod
+    def build(rows: List[Dict], date: str = None) -> Dict[str, List[Dict]]:
+        """
+        행 목록을 경주번호별 출전마 목록으로 변환
+
+        다른 날짜의 행은 버리고, 같은 출전번호는 처음 나온 행만 남기며, 출전번호순으로 정렬한다.
+        """
+        races: Dict[str, Dict[str, Dict]] = {}
+        for row in rows:
+            if date and row.get('rcDate') and str(row['rcDate']).replace('-', '')[:8] != date:
+                continue
+            chul_no = row.get('chulNo')
+            if not chul_no:
+                continue
+            runners = races.setdefault(race_no_key(row.get('rcNo')), {})
+            runners.setdefault(str(chul_no), row)
+
+        return {
+            rc_no: sorted(runners.values(), key=lambda runner: _chul_no_order(runner.get('chulNo')))
+            for rc_no, runners in races.items()
+        }
+
+    def runners(self, meet: int, date: str, rc_no) -> Tuple[List[Dict], bool]:
+        """
+        한 경주의 출전마 목록
+
+        Returns:
+            (출전번호순 출전마 목록, 예정 경주 여부)
+        """
+        runners, _, is_future = self.race(meet, date, rc_no)
+        return runners, is_future
+
+    def records(self, meet: int, date: str, rc_no) -> Tuple[List[Runner], bool]:
+        """
+        한 경주의 예측용 출전마 레코드 (Runner.item으로 원본 item 참조)
+
+        Returns:
+            (출전번호순 출전마 레코드 목록, 예정 경주 여부)
+        """
+        _, records, is_future = self.race(meet, date, rc_no)
+        return records, is_future
@@ -0,0 +1,97 @@
+"""
+기간 조회 계획
+
+경주성적/경주기록 API는 일 단위(race_date=YYYYMMDD)와 월 단위(rc_date=YYYYMM) 조회를
+모두 지원한다. 기간 조회 시 월별로 필요한 경주일 수를 세어 월 단위 1회 조회와
+일 단위 여러 번 조회 중 upstream 호출이 적은 쪽을 고른다.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+DateLike = Union[str, date, datetime]
+
+
+class RangeChunk(NamedTuple):
+    """upstream 조회 단위"""
+    kind: str    # 'month' 또는 'day'
+    value: str   # YYYYMM 또는 YYYYMMDD
+
+
+def to_date(value: DateLike) -> date:
+    """YYYYMMDD 문자열/date/datetime을 date로 변환"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value).replace('-', '')[:8], '%Y%m%d').date()
+
+
+def is_race_weekday(day: date) -> bool:
+    """경마 개최 요일 여부 (금/토/일)"""
+    return day.weekday() in (4, 5, 6)
+
+
+class RangeQueryPlanner:
+    """기간을 월/일 조회 단위로 나누는 계획기"""
+
+    # 한 달에서 필요한 경주일이 이 수 이상이면 월 단위로 조회
+    # (월 단위 응답은 경마장당 보통 1~2페이지이므로 일 단위 3회 이상보다 싸다)
+    MONTH_MIN_DAYS = 3
+
+    def __init__(self, month_min_days: int = None,
+                 is_race_day: Callable[[date], bool] = None):
+        self.month_min_days = month_min_days or self.MONTH_MIN_DAYS
+        self.is_race_day = is_race_day or is_race_weekday
+
+    def plan(self, start: DateLike, end: DateLike,
+             is_month_cached: Optional[Callable[[str], bool]] = None,
+             is_race_day: Optional[Callable[[date], bool]] = None) -> List[RangeChunk]:
+        """
+        기간 조회 계획 수립
+
+        Args:
+            start: 시작일
+            end: 종료일 (포함)
+            is_month_cached: 월 단위 응답이 이미 캐시에 있는지 확인하는 함수 (있으면 호출 비용 0)
+            is_race_day: 개최일 판단 함수 (기본: 생성 시 지정한 함수, 예: 경마장별 경주 달력)
+
+        Returns:
+            시간순 조회 단위 목록
+        """
+        start, end = to_date(start), to_date(end)
+        if start > end:
+            return []
+        is_race_day = is_race_day or self.is_race_day
+
+        # 월별 경주일
+        days_by_month: Dict[str, List[str]] = {}
+        day = start
+        while day <= end:
+            if is_race_day(day):
+                days_by_month.setdefault(day.strftime('%Y%m'), []).append(day.strftime('%Y%m%d'))
+            day += timedelta(days=1)
+
+        chunks = []
+        for month, days in days_by_month.items():
+            cached = is_month_cached is not None and is_month_cached(month)
+            if cached or len(days) >= self.month_min_days:
+                chunks.append(RangeChunk('month', month))
+            else:
+                chunks.extend(RangeChunk('day', d) for d in days)
+
+        logger.debug(f"기간 조회 계획 {start}~{end}: {chunks}")
+        return chunks
+
+    @staticmethod
+    def slice_rows(rows: List[Dict], start: DateLike, end: DateLike) -> List[Dict]:
+        """월 단위 응답에서 기간 밖의 경주일 행 제외"""
+        start_str, end_str = to_date(start).strftime('%Y%m%d'), to_date(end).strftime('%Y%m%d')
+        return [
+            row for row in rows
+            if start_str <= str(row.get('rcDate', '')).replace('-', '')[:8] <= end_str
+        ]
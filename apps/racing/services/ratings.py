@@ -0,0 +1,295 @@
+"""
+기수/조교사 레이팅
+
+로컬 저장소의 경주 성적(Result)으로 기수/조교사별 출전/1착/3착 이내 수를 누적하고,
+승률을 전체 평균 쪽으로 축소(shrinkage)한 값으로 실력 지표(0~1)를 만든다.
+
+- 누적: 성적이 적재될 때 아직 반영하지 않은 경주만 더함 (RatedRace로 중복 방지, 전체 재계산 없음)
+- 지표: 축소 승률 p = (1착 + K x 평균 승률) / (출전 + K), 지표 = p / (p + 평균 승률)
+  (평균 수준 0.5, 출전이 적을수록 0.5에 가까움, 기록이 없으면 0.5)
+- 조회: 프로세스 메모리의 번호/이름 -> 지표 딕셔너리 (공유 캐시의 버전이 바뀐 경우에만 다시 읽음)
+- 시점: RatingReplay는 성적을 경주일 순으로 메모리에서 더해 가며 그 시점의 지표를 낸다 (학습 데이터)
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.db import router, transaction
+
+from .response_cache import get_response_cache
+
+
+logger = logging.getLogger(__name__)
+
+KINDS = ('jockey', 'trainer')
+
+RaceKey = Tuple[int, date, int]  # (경마장, 경주일자, 경주번호)
+
+
+def _models():
+    from ..models import Jockey, RatedRace, Result, Trainer
+    return {'jockey': (Jockey, 'jk_no'), 'trainer': (Trainer, 'tr_no')}, RatedRace, Result
+
+
+class RatingTable:
+    """기수/조교사 실력 지표 조회 테이블"""
+
+    PRIOR_STARTS = 30           # 축소 강도: 이 출전 수만큼의 평균 성적을 더한 것으로 봄
+    VERSION_CHECK_INTERVAL = 30  # 다른 프로세스의 갱신 여부 확인 주기(초)
+    VERSION_KEY = 'kra_ratings:version'
+
+    def __init__(self):
+        self.cache = get_response_cache()
+        self._by_ref: Dict[str, Dict[str, float]] = {kind: {} for kind in KINDS}
+        self._by_name: Dict[str, Dict[str, float]] = {kind: {} for kind in KINDS}
+        self._version = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    # ---- 조회 ----
+
+    def strength(self, kind: str, ref_no: str = None, name: str = None) -> float:
+        """
+        실력 지표 (0~1, 평균 0.5)
+
+        번호로 먼저 찾고, 번호가 없거나 기록이 없으면 이름으로 찾는다.
+        """
+        self._ensure_loaded()
+        if ref_no:
+            value = self._by_ref[kind].get(str(ref_no).strip())
+            if value is not None:
+                return value
+        if name:
+            value = self._by_name[kind].get(str(name).strip())
+            if value is not None:
+                return value
+        return 0.5
+
+    def version(self):
+        """지표 테이블 버전 (갱신 시 바뀜, 예측 캐시 키에 사용)"""
+        self._ensure_loaded()
+        return self._version
+
+    def score(self, kind: str, name: str, ref_no: str = None,
+              low: float = 30.0, high: float = 80.0) -> float:
+        """예측 모델용 점수 (low~high 범위, 이름이 없으면 50)"""
+        if not name:
+            return 50.0
+        return low + (high - low) * self.strength(kind, ref_no, name)
+
+    def _ensure_loaded(self):
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.VERSION_CHECK_INTERVAL:
+            return
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.VERSION_CHECK_INTERVAL:
+                return
+            version = self.cache.get(self.VERSION_KEY, l1=False)
+            if self._checked_at is None or version != self._version:
+                self._load()
+                self._version = version
+            self._checked_at = now
+
+    def _load(self):
+        """로컬 저장소의 누적 성적으로 지표 테이블 생성"""
+        try:
+            people, _, _ = _models()
+            for kind, (model, ref_field) in people.items():
+                rows = list(model.objects.filter(starts__gt=0).values_list(ref_field, 'name', 'starts', 'wins'))
+                self._by_ref[kind], self._by_name[kind] = self._tables(rows)
+            logger.info(
+                f"레이팅 테이블 로드: 기수 {len(self._by_ref['jockey'])}명, 조교사 {len(self._by_ref['trainer'])}명"
+            )
+        except Exception as e:
+            logger.warning(f"레이팅 테이블 로드 실패 (기본값 사용): {str(e)}")
+
+    @classmethod
+    def _tables(cls, rows) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """[(번호, 이름, 출전, 1착), ...] -> (번호 -> 지표, 이름 -> 지표)"""
+        total_starts = sum(row[2] for row in rows)
+        prior = sum(row[3] for row in rows) / total_starts if total_starts else 0.0
+
+        by_ref, by_name, name_starts = {}, {}, {}
+        for ref_no, name, starts, wins in rows:
+            value = cls._strength(starts, wins, prior)
+            by_ref[ref_no] = value
+            # 동명이인은 출전이 많은 쪽
+            if name and starts > name_starts.get(name, 0):
+                by_name[name], name_starts[name] = value, starts
+        return by_ref, by_name
+
+    @classmethod
+    def _strength(cls, starts: int, wins: int, prior: float) -> float:
+        if prior <= 0:
+            return 0.5
+        shrunk = (wins + cls.PRIOR_STARTS * prior) / (starts + cls.PRIOR_STARTS)
+        return shrunk / (shrunk + prior)
+
+    # ---- 갱신 ----
+
+    def apply_races(self, race_keys: Iterable[RaceKey]) -> int:
+        """
+        경주 성적을 누적 (이미 반영한 경주와 1착이 없는 미완료 경주는 건너뜀)
+
+        Args:
+            race_keys: (경마장, 경주일자, 경주번호) 목록
+
+        Returns:
+            새로 반영한 경주 수
+        """
+        race_keys = set(race_keys)
+        if not race_keys:
+            return 0
+        people, RatedRace, Result = _models()
+
+        meets = {key[0] for key in race_keys}
+        dates = {key[1] for key in race_keys}
+        with transaction.atomic(using=router.db_for_write(RatedRace)):
+            rated = set(
+                RatedRace.objects.filter(meet__in=meets, rc_date__in=dates)
+                .values_list('meet', 'rc_date', 'rc_no')
+            )
+            pending = race_keys - rated
+            if not pending:
+                return 0
+
+            races = defaultdict(list)
+            rows = Result.objects.filter(meet__in=meets, rc_date__in=dates).values_list(
+                'meet', 'rc_date', 'rc_no', 'jockey_id', 'trainer_id', 'ord'
+            )
+            for meet, rc_date, rc_no, jk_no, tr_no, ord_ in rows:
+                if (meet, rc_date, rc_no) in pending:
+                    races[(meet, rc_date, rc_no)].append((jk_no, tr_no, ord_))
+
+            # 1착이 있는 경주만 완료로 보고 반영 (착순이 없는 행은 출전 취소 등으로 제외)
+            finished = [race_key for race_key, runners in races.items() if any(ord_ == 1 for _, _, ord_ in runners)]
+            # 반영 기록을 먼저 넣고 넣은 경주만 반영 (동시에 실행된 다른 작업이 먼저 넣은 경주는 건너뜀)
+            claimed = [
+                (meet, rc_date, rc_no) for meet, rc_date, rc_no in finished
+                if RatedRace.objects.get_or_create(meet=meet, rc_date=rc_date, rc_no=rc_no)[1]
+            ]
+            if len(claimed) < len(finished):
+                logger.warning(f"레이팅 반영 중복 실행: 다른 작업이 먼저 반영한 경주 {len(finished) - len(claimed)}개 건너뜀")
+            finished = claimed
+
+            deltas = {kind: defaultdict(lambda: [0, 0, 0]) for kind in KINDS}
+            for race_key in finished:
+                for jk_no, tr_no, ord_ in races[race_key]:
+                    if not ord_:
+                        continue
+                    for kind, ref_no in (('jockey', jk_no), ('trainer', tr_no)):
+                        if ref_no:
+                            counts = deltas[kind][ref_no]
+                            counts[0] += 1
+                            counts[1] += ord_ == 1
+                            counts[2] += ord_ <= 3
+
+            for kind, (model, ref_field) in people.items():
+                self._add_counts(model, ref_field, deltas[kind])
+
+        if finished:
+            self._bump_version()
+            logger.info(f"레이팅 반영: 경주 {len(finished)}개")
+        return len(finished)
+
+    @staticmethod
+    def _add_counts(model, ref_field: str, deltas: Dict[str, list]):
+        if not deltas:
+            return
+        # 동시에 다른 경주를 반영하는 작업과 누적 값이 엇갈리지 않도록 행 잠금
+        rows = model.objects.select_for_update().filter(**{f"{ref_field}__in": list(deltas)})
+        existing = {getattr(obj, ref_field): obj for obj in rows}
+        updated, created = [], []
+        for ref_no, (starts, wins, places) in deltas.items():
+            obj = existing.get(ref_no)
+            if obj is None:
+                created.append(model(**{ref_field: ref_no}, starts=starts, wins=wins, places=places))
+                continue
+            obj.starts += starts
+            obj.wins += wins
+            obj.places += places
+            updated.append(obj)
+        model.objects.bulk_update(updated, ['starts', 'wins', 'places'], batch_size=500)
+        model.objects.bulk_create(created, batch_size=500)
+
+    def apply_pending(self, batch_days: int = 30) -> int:
+        """로컬 저장소의 성적 중 아직 반영하지 않은 경주를 모두 반영"""
+        _, RatedRace, Result = _models()
+        rated = set(RatedRace.objects.values_list('meet', 'rc_date', 'rc_no'))
+        pending = set(Result.objects.values_list('meet', 'rc_date', 'rc_no').distinct()) - rated
+
+        by_date = defaultdict(list)
+        for race_key in pending:
+            by_date[race_key[1]].append(race_key)
+
+        applied = 0
+        days = sorted(by_date)
+        for i in range(0, len(days), batch_days):
+            applied += self.apply_races(key for day in days[i:i + batch_days] for key in by_date[day])
+        return applied
+
+    def rebuild(self) -> int:
+        """누적 성적을 지우고 전체 성적으로 다시 계산"""
+        people, RatedRace, _ = _models()
+        with transaction.atomic(using=router.db_for_write(RatedRace)):
+            for model, _ in people.values():
+                model.objects.filter(starts__gt=0).update(starts=0, wins=0, places=0)
+            RatedRace.objects.all().delete()
+        self._bump_version()
+        return self.apply_pending()
+
+    def _bump_version(self):
+        self.cache.set(self.VERSION_KEY, time.time(), None, l1=False)
+        self._checked_at = None
+
+
+class RatingReplay(RatingTable):
+    """
+    메모리에서 성적을 경주일 순으로 더해 가는 레이팅 (저장하지 않음)
+
+    과거 경주를 학습 데이터로 만들 때 경주일마다 score()로 그 날짜 전 성적의 지표를 읽은 뒤
+    그 날짜의 성적을 add()로 더한다 (저장소의 누적 테이블은 이후 경주 결과까지 포함하므로 쓰지 않음).
+    지표 계산은 RatingTable과 같다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._counts: Dict[str, Dict[str, list]] = {kind: {} for kind in KINDS}
+        self._dirty = False
+
+    def add(self, runs: Iterable[tuple]):
+        """출전 기록 더하기 [(구분, 번호, 이름, 착순), ...] (착순이 있는 완료 경주)"""
+        for kind, ref_no, name, ord_ in runs:
+            if not ref_no or not ord_:
+                continue
+            counts = self._counts[kind].setdefault(str(ref_no).strip(), [name or '', 0, 0])
+            counts[0] = counts[0] or name or ''
+            counts[1] += 1
+            counts[2] += ord_ == 1
+            self._dirty = True
+
+    def _ensure_loaded(self):
+        if self._dirty:
+            for kind in KINDS:
+                rows = [(ref_no, name, starts, wins) for ref_no, (name, starts, wins) in self._counts[kind].items()]
+                self._by_ref[kind], self._by_name[kind] = self._tables(rows)
+            self._dirty = False
+
+
+# 프로세스 공용 인스턴스
+_rating_table: Optional[RatingTable] = None
+_rating_table_lock = threading.Lock()
+
+
+def get_rating_table() -> RatingTable:
+    """프로세스 공용 기수/조교사 레이팅 테이블 반환"""
+    global _rating_table
+    if _rating_table is None:
+        with _rating_table_lock:
+            if _rating_table is None:
+                _rating_table = RatingTable()
+    return _rating_table
@@ -0,0 +1,205 @@
+"""
+한국마사회 API 장애 대응
+
+- RetryPolicy: 일시적 오류에 대한 지터 포함 지수 백오프 재시도
+- CircuitBreaker: 엔드포인트별 연속 실패 시 일정 시간 즉시 실패 처리 (이 동안은 이전 캐시 데이터 사용)
+- is_retryable / trips_breaker: 오류 종류별 처리 기준
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+import requests
+
+from .deadline import DeadlineExceeded
+from .decoders import DecodeError, KRAAPIError
+
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어 upstream 호출을 생략함"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        super().__init__(f"서킷 브레이커 열림: {name}")
+
+
+def is_retryable(error: Exception) -> bool:
+    """재시도하면 성공할 수 있는 일시적 오류인지 여부"""
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError, DecodeError)):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError):
+        status = getattr(error.response, 'status_code', 0) or 0
+        return status >= 500 or status == 429
+    if isinstance(error, KRAAPIError):
+        return error.retryable
+    return False
+
+
+def trips_breaker(error: Exception) -> bool:
+    """
+    서킷 브레이커 실패로 집계할 오류인지 여부
+
+    잘못된 요청 파라미터 등 upstream 상태와 무관한 오류, 호출 측 마감 시간 초과(DeadlineExceeded)는 제외
+    """
+    if isinstance(error, DeadlineExceeded):
+        return False
+    if isinstance(error, KRAAPIError):
+        return not error.client_error
+    if isinstance(error, requests.exceptions.HTTPError):
+        status = getattr(error.response, 'status_code', 0) or 0
+        return status not in (400, 404)
+    return True
+
+
+class RetryPolicy:
+    """지터 포함 지수 백오프 재시도 정책"""
+    
+    MAX_ATTEMPTS = 3
+    BASE_DELAY = 0.5   # 첫 재시도 최대 대기(초)
+    MAX_DELAY = 4.0    # 재시도 대기 상한(초)
+    
+    def __init__(self, max_attempts: int = None, base_delay: float = None, max_delay: float = None):
+        self.max_attempts = max(1, max_attempts or self.MAX_ATTEMPTS)
+        self.base_delay = base_delay if base_delay is not None else self.BASE_DELAY
+        self.max_delay = max_delay if max_delay is not None else self.MAX_DELAY
+    
+    def delays(self) -> Iterator[float]:
+        """
+        재시도 전 대기 시간 (full jitter)
+        
+        max_attempts - 1 개의 값을 반환한다.
+        """
+        for attempt in range(self.max_attempts - 1):
+            yield random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """엔드포인트별 서킷 브레이커"""
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    FAILURE_THRESHOLD = 5    # 연속 실패 횟수
+    RECOVERY_TIMEOUT = 30    # open 유지 시간(초), 이후 시험 요청 1건 허용
+    
+    def __init__(self, name: str, failure_threshold: int = None, recovery_timeout: float = None):
+        self.name = name
+        self.failure_threshold = failure_threshold or self.FAILURE_THRESHOLD
+        self.recovery_timeout = recovery_timeout or self.RECOVERY_TIMEOUT
+        
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.last_error = None
+        self.total_failures = 0
+        self.rejected = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 여부 (open 상태면 False)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            
+            # half-open 상태에서는 시험 요청 1건만 통과
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            
+            self.rejected += 1
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"서킷 브레이커 복구: {self.name}")
+            self.state = self.CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+    
+    def release(self):
+        """결과로 upstream 상태를 판단할 수 없는 요청 (집계하지 않고 half-open 시험 기회만 반환)"""
+        with self._lock:
+            self._probe_in_flight = False
+    
+    def record_failure(self, error: Exception = None):
+        with self._lock:
+            self.failures += 1
+            self.total_failures += 1
+            self.last_error = str(error) if error else None
+            
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.error(f"서킷 브레이커 열림: {self.name} (연속 실패 {self.failures}회)")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._probe_in_flight = False
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태"""
+        with self._lock:
+            retry_in = None
+            if self.state == self.OPEN:
+                retry_in = max(0.0, round(self.recovery_timeout - (time.monotonic() - self.opened_at), 1))
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'total_failures': self.total_failures,
+                'rejected': self.rejected,
+                'retry_in': retry_in,
+                'last_error': self.last_error,
+            }
+
+
+class CircuitBreakerRegistry:
+    """엔드포인트별 서킷 브레이커 모음 (프로세스 단위)"""
+    
+    def __init__(self, failure_threshold: int = None, recovery_timeout: float = None):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    name, CircuitBreaker(name, self.failure_threshold, self.recovery_timeout)
+                )
+        return breaker
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: breaker.snapshot() for name, breaker in list(self._breakers.items())}
+
+
+# 프로세스 공용 인스턴스
+_breakers: Optional[CircuitBreakerRegistry] = None
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """프로세스 공용 서킷 브레이커 모음 반환"""
+    global _breakers
+    if _breakers is None:
+        with _breakers_lock:
+            if _breakers is None:
+                from django.conf import settings
+                _breakers = CircuitBreakerRegistry(
+                    failure_threshold=getattr(settings, 'KRA_BREAKER_FAILURE_THRESHOLD', None),
+                    recovery_timeout=getattr(settings, 'KRA_BREAKER_RECOVERY_TIMEOUT', None),
+                )
+    return _breakers
@@ -0,0 +1,189 @@
+"""
+한국마사회 API 응답 캐시
+
+- 캐시 키: 엔드포인트와 파라미터 내용으로 만든 결정적 해시 (프로세스/재시작과 무관)
+- L1: 프로세스 내부의 크기 제한 LRU 캐시
+- L2: 모든 gunicorn 워커가 공유하는 Django 캐시 ('kra' 별칭, 파일/Redis 기반)
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+
+
+logger = logging.getLogger(__name__)
+
+# 캐시 미스 표시용 객체
+MISSING = object()
+
+
+def build_cache_key(endpoint: str, params: Dict[str, Any], suffix: str = '') -> str:
+    """
+    엔드포인트와 파라미터로 결정적인 캐시 키 생성
+    
+    파라미터 순서나 값의 타입(1 / '1')과 무관하게 같은 요청이면 같은 키가 된다.
+    """
+    normalized = json.dumps(
+        {str(k): str(v) for k, v in params.items() if v is not None},
+        sort_keys=True, ensure_ascii=False
+    )
+    digest = hashlib.sha1(f"{endpoint}?{normalized}".encode('utf-8')).hexdigest()
+    key = f"kra_api:{endpoint}:{digest}"
+    if suffix:
+        key += f":{suffix}"
+    return key
+
+
+class LRUCache:
+    """크기 제한 LRU 캐시 (스레드 안전)"""
+    
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        """값 반환, 없거나 만료되었으면 MISSING"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, payload = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[key]
+                return MISSING
+            self._data.move_to_end(key)
+        # 호출 측에서 수정해도 캐시 원본이 바뀌지 않도록 복사본 반환
+        return pickle.loads(payload)
+    
+    def set(self, key: str, value: Any, expires_at: Optional[float]):
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._data[key] = (expires_at, payload)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+    
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TwoTierCache:
+    """L1(프로세스 LRU) + L2(워커 공유 캐시) 2단계 캐시"""
+    
+    L1_MAX_ENTRIES = 512
+    L2_ALIAS = 'kra'
+    
+    def __init__(self, l1_max_entries: int = None, l2_alias: str = None):
+        self.l1 = LRUCache(l1_max_entries or getattr(
+            settings, 'KRA_CACHE_L1_MAX_ENTRIES', self.L1_MAX_ENTRIES
+        ))
+        alias = l2_alias or self.L2_ALIAS
+        try:
+            self.l2 = caches[alias]
+        except InvalidCacheBackendError:
+            logger.warning(f"'{alias}' 캐시 설정이 없어 default 캐시를 L2로 사용")
+            self.l2 = caches['default']
+        
+        self._lock = threading.Lock()
+        self._counters = {
+            'l1_hits': 0, 'l1_misses': 0,
+            'l2_hits': 0, 'l2_misses': 0,
+            'sets': 0,
+        }
+    
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+    
+    def get(self, key: str, default: Any = None, l1: bool = True) -> Any:
+        """
+        L1 → L2 순서로 조회, L2 적중 시 L1에 채워 넣음
+        
+        Args:
+            l1: False면 L2만 조회 (자주 쓰지 않는 큰 값을 L1에 올리지 않을 때)
+        """
+        if l1:
+            value = self.l1.get(key)
+            if value is not MISSING:
+                self._count('l1_hits')
+                return value
+            self._count('l1_misses')
+        
+        # L2에는 (만료 시각, 값) 형태로 저장해 L1에 남은 유효시간만큼만 채운다
+        envelope = self.l2.get(key)
+        if envelope is None:
+            self._count('l2_misses')
+            return default
+        self._count('l2_hits')
+        
+        expires_at, value = envelope
+        if l1:
+            self.l1.set(key, value, expires_at)
+        return value
+    
+    def set(self, key: str, value: Any, timeout: Optional[int], l1: bool = True):
+        """
+        두 단계 캐시에 모두 저장
+        
+        Args:
+            timeout: 유지 시간(초), None이면 만료 없음, 0 이하면 저장하지 않음
+            l1: False면 L2에만 저장
+        """
+        if timeout is not None and timeout <= 0:
+            return
+        expires_at = time.time() + timeout if timeout is not None else None
+        if l1:
+            self.l1.set(key, value, expires_at)
+        self.l2.set(key, (expires_at, value), timeout)
+        self._count('sets')
+    
+    def delete(self, key: str):
+        self.l1.delete(key)
+        self.l2.delete(key)
+    
+    def stats(self) -> Dict[str, Any]:
+        """단계별 적중/미스 통계 (현재 프로세스 기준)"""
+        with self._lock:
+            counters = dict(self._counters)
+        l1_total = counters['l1_hits'] + counters['l1_misses']
+        l2_total = counters['l2_hits'] + counters['l2_misses']
+        return {
+            **counters,
+            'l1_entries': len(self.l1),
+            'l1_hit_ratio': round(counters['l1_hits'] / l1_total, 3) if l1_total else 0.0,
+            'l2_hit_ratio': round(counters['l2_hits'] / l2_total, 3) if l2_total else 0.0,
+            'l2_backend': type(self.l2).__name__,
+        }
+
+
+# 프로세스 공용 인스턴스
+_response_cache: Optional[TwoTierCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> TwoTierCache:
+    """프로세스 공용 2단계 응답 캐시 반환"""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = TwoTierCache()
+    return _response_cache
@@ -0,0 +1,83 @@
+"""
+출전마 레코드
+
+출전표/경주성적 API item(dict)을 예측 모델이 쓰는 형태로 한 번만 파싱한 레코드.
+마체중('500(+3)'), 연령, 승수/출주수, 단승 배당 같은 문자열 필드를 경주 색인을 만들 때
+변환해 두고, 두 예측 모델은 같은 레코드를 그대로 사용한다.
+
+파싱 규칙은 기존 모델의 변환식과 같다.
+- 마체중을 읽을 수 없으면 weight는 None (모델에서 기본 점수 사용)
+- 모델이 필요로 하는 수치 필드(출전표: 연령, 성적: 승수/출주수/배당)를 읽을 수 없으면
+  valid가 False (모델에서 전체 기본 점수 사용)
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+
+def parse_weight(value) -> Optional[float]:
+    """마체중 문자열('500(+3)', '500', '') 변환 (읽을 수 없으면 None)"""
+    try:
+        return float(value.split('(')[0]) if '(' in value else float(value or 500)
+    except Exception:
+        return None
+
+
+# 나중에 추가된 필드의 기본값 (이전에 캐시된 레코드를 읽을 때)
+_LATE_DEFAULTS = {'jk_no': '', 'tr_no': '', 'form': None}
+
+
+class Runner:
+    """예측용 출전마 레코드"""
+
+    __slots__ = (
+        'item', 'hr_no', 'hr_name', 'chul_no', 'jk_name', 'tr_name', 'is_entry',
+        'weight', 'age', 'sex', 'wins', 'starts', 'win_odds', 'valid', 'jk_no', 'tr_no', 'form',
+    )
+
+    def __init__(self, item: Dict):
+        self.item = item
+        self.hr_no = item.get('hrNo', '')
+        self.hr_name = item.get('hrName', '')
+        self.chul_no = item.get('chulNo', '')
+        self.jk_name = item.get('jkName', '')
+        self.tr_name = item.get('trName', '')
+        self.jk_no = str(item.get('jkNo') or '').strip()
+        self.tr_no = str(item.get('trNo') or '').strip()
+        # 경주마 최근 성적 특성 (feature_store가 경주일자 시점으로 연결, 기록이 없으면 {})
+        self.form = None
+        # 출전표 API는 hrAge 필드가 있음 (성적 API는 없음)
+        self.is_entry = 'hrAge' in item
+        self.weight = parse_weight(item.get('wgHr', '500'))
+        self.sex = item.get('hrSex', 'M')
+        self.age = 5
+        self.wins = 0
+        self.starts = 0
+        self.win_odds = 10.0
+        self.valid = True
+        try:
+            if self.is_entry:
+                self.age = int(item.get('hrAge', 5) or 5)
+            else:
+                self.wins = int(item.get('win1', 0) or 0)
+                self.starts = int(item.get('totCnt1', 0) or 0)
+                self.win_odds = float(item.get('winOdds', 10) or 10)
+        except Exception:
+            self.valid = False
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+        # 필드가 추가되기 전에 캐시된 레코드
+        for name in self.__slots__[len(state):]:
+            setattr(self, name, _LATE_DEFAULTS.get(name, ''))
+
+    def __repr__(self):
+        return f"Runner({self.chul_no} {self.hr_name} {'entry' if self.is_entry else 'result'})"
+
+
+def to_runners(items: Iterable) -> List[Runner]:
+    """item 목록을 출전마 레코드 목록으로 변환 (이미 변환된 레코드는 그대로)"""
+    return [item if isinstance(item, Runner) else Runner(item) for item in items]
@@ -0,0 +1,164 @@
+"""
+동일 요청 합치기 (single-flight)
+
+같은 엔드포인트/파라미터로 동시에 들어온 요청은 하나의 upstream 요청만
+실행하고 나머지 호출자는 그 결과를 기다렸다가 공유한다.
+
+- 워커 내부: 스레드 간 threading.Event 로 대기
+- 워커 간(선택): 공유 캐시의 add() 를 잠금으로 사용하고, 잠금을 얻지 못한
+  워커는 선행 워커가 캐시에 결과를 저장할 때까지 폴링
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """진행 중인 요청"""
+    
+    __slots__ = ('event', 'result', 'error', 'waiters')
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """키 단위로 동시 실행을 하나로 합치는 실행기"""
+    
+    LOCK_TIMEOUT = 35      # 워커 간 잠금 유지 시간(초), upstream 타임아웃보다 길게
+    POLL_INTERVAL = 0.1    # 다른 워커 결과 폴링 간격(초)
+    
+    def __init__(self, lock_cache=None, lock_timeout: int = None, poll_interval: float = None):
+        """
+        Args:
+            lock_cache: 워커 간 잠금에 사용할 Django 캐시 (None이면 워커 내부에서만 합침)
+            lock_timeout: 워커 간 잠금 유지 시간(초)
+            poll_interval: 다른 워커 결과 폴링 간격(초)
+        """
+        self.lock_cache = lock_cache
+        self.lock_timeout = lock_timeout or self.LOCK_TIMEOUT
+        self.poll_interval = poll_interval or self.POLL_INTERVAL
+        
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._counters = {'leaders': 0, 'coalesced': 0, 'cross_worker_waits': 0}
+    
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+    
+    def do(self, key: str, fn: Callable[[], Any], lookup: Callable[[], Any] = None,
+           timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """
+        키가 같은 동시 호출을 하나로 합쳐 실행
+        
+        Args:
+            key: 요청 식별 키
+            fn: 실제 요청 함수
+            lookup: 다른 워커가 저장한 결과를 조회하는 함수 (워커 간 합치기용)
+            timeout: 선행 요청 결과를 기다릴 최대 시간(초)
+            
+        Returns:
+            (결과, 다른 호출자와 공유된 결과인지 여부)
+            
+        Raises:
+            TimeoutError: timeout 안에 선행 요청이 끝나지 않은 경우
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._counters['coalesced'] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._counters['leaders'] += 1
+                leader = True
+        
+        if not leader:
+            if not call.event.wait(timeout):
+                raise TimeoutError(f"선행 요청 대기 시간 초과: {key}")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        
+        try:
+            if self.lock_cache is not None and lookup is not None:
+                call.result = self._do_cross_worker(key, fn, lookup, timeout)
+            else:
+                call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        
+        return call.result, call.waiters > 0
+    
+    def _do_cross_worker(self, key: str, fn: Callable[[], Any],
+                         lookup: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """공유 캐시 잠금으로 워커 간 요청 합치기"""
+        lock_key = f"singleflight:{key}"
+        
+        if self.lock_cache.add(lock_key, os.getpid(), self.lock_timeout):
+            try:
+                return fn()
+            finally:
+                self.lock_cache.delete(lock_key)
+        
+        # 다른 워커가 요청 중: 결과가 캐시에 저장되거나 잠금이 풀릴 때까지 대기
+        self._count('cross_worker_waits')
+        wait = self.lock_timeout if timeout is None else min(self.lock_timeout, timeout)
+        deadline = time.monotonic() + wait
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            result = lookup()
+            if result:
+                return result
+            if self.lock_cache.get(lock_key) is None:
+                break
+        
+        logger.info(f"다른 워커 결과 없음, 직접 요청: {key}")
+        return fn()
+    
+    def stats(self) -> Dict[str, Any]:
+        """요청 합치기 통계 (현재 프로세스 기준)"""
+        with self._lock:
+            return {
+                **self._counters,
+                'in_flight': len(self._calls),
+                'cross_worker': self.lock_cache is not None,
+            }
+
+
+# 프로세스 공용 인스턴스
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """프로세스 공용 SingleFlight 반환 (KRA_SINGLEFLIGHT_CROSS_WORKER 설정 시 워커 간 합치기 사용)"""
+    global _single_flight
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                from django.conf import settings
+                from .response_cache import get_response_cache
+                
+                lock_cache = None
+                if getattr(settings, 'KRA_SINGLEFLIGHT_CROSS_WORKER', False):
+                    lock_cache = get_response_cache().l2
+                _single_flight = SingleFlight(lock_cache=lock_cache)
+    return _single_flight
@@ -0,0 +1,133 @@
+"""
+한국마사회 API 응답 캐시 유지시간(TTL) 정책
+
+엔드포인트와 조회 날짜로 TTL을 결정한다.
+- 확정된 과거 경주 데이터: 바뀌지 않으므로 사실상 영구 캐시
+- 경주 당일 출전표/성적: 수시로 바뀌므로 짧게
+- 경주 계획표, 경주마 정보: 중간
+"""
+
+import calendar
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+
+class CacheTTLPolicy:
+    """엔드포인트/날짜 기반 캐시 TTL 정책"""
+    
+    PERMANENT = 30 * DAY     # 확정 데이터 (사실상 영구)
+    DEFAULT = 5 * MINUTE     # 분류할 수 없는 요청
+    EMPTY = 10 * MINUTE      # 빈 응답 (아직 게시 전일 수 있어 길게 두지 않음)
+    SETTLED_DAYS = 2         # 경주일로부터 이 일수가 지나면 확정 데이터로 간주
+    
+    # 엔드포인트 이름별 시점 구분 TTL
+    #   upcoming: 미래 날짜, today: 당일, current: 오늘이 포함된 월/연 단위 조회,
+    #   recent: 확정 전 과거, settled: 확정된 과거, undated: 날짜 조건 없음
+    TTLS = {
+        'entry_sheet': {
+            'upcoming': 10 * MINUTE, 'today': 1 * MINUTE, 'current': 10 * MINUTE,
+            'recent': 1 * HOUR, 'settled': PERMANENT, 'undated': 5 * MINUTE,
+        },
+        'race_results': {
+            'upcoming': 5 * MINUTE, 'today': 2 * MINUTE, 'current': 10 * MINUTE,
+            'recent': 30 * MINUTE, 'settled': PERMANENT, 'undated': 10 * MINUTE,
+        },
+        'race_records': {
+            'upcoming': 5 * MINUTE, 'today': 2 * MINUTE, 'current': 10 * MINUTE,
+            'recent': 30 * MINUTE, 'settled': PERMANENT, 'undated': 10 * MINUTE,
+        },
+        'race_schedule': {
+            'upcoming': 1 * HOUR, 'today': 10 * MINUTE, 'current': 1 * HOUR,
+            'recent': 1 * HOUR, 'settled': PERMANENT, 'undated': 1 * HOUR,
+        },
+        'horse_info': {
+            'undated': 6 * HOUR,
+        },
+    }
+    
+    # 날짜 파라미터 (엔드포인트마다 이름/형식이 다름)
+    DATE_PARAMS = ('race_date', 'rc_date', 'rc_month', 'rc_year')
+    
+    def __init__(self, endpoints: Dict[str, str], overrides: Dict[str, int] = None):
+        """
+        Args:
+            endpoints: 엔드포인트 이름 → 경로 (KRAAPIService.ENDPOINTS)
+            overrides: '<엔드포인트 이름>.<구분>' → TTL(초), 예: {'entry_sheet.today': 30}
+        """
+        self.names = {path: name for name, path in endpoints.items()}
+        self.overrides = overrides if overrides is not None else getattr(
+            settings, 'KRA_CACHE_TTL_OVERRIDES', {}
+        )
+    
+    def ttl_for(self, endpoint: str, params: Dict[str, Any],
+                item_count: Optional[int] = None, today: date = None) -> int:
+        """
+        요청에 맞는 캐시 TTL(초) 계산
+        
+        Args:
+            endpoint: API 경로
+            params: 요청 파라미터
+            item_count: 응답 건수 (빈 응답은 짧게 캐시)
+            today: 기준 날짜 (기본값: 오늘)
+        """
+        name = self.names.get(endpoint, endpoint)
+        period = self.classify(params, today or timezone.localdate())
+        
+        ttl = self.overrides.get(f"{name}.{period}")
+        if ttl is None:
+            ttl = self.TTLS.get(name, {}).get(period, self.DEFAULT)
+        
+        if item_count == 0:
+            ttl = min(ttl, self.EMPTY)
+        return ttl
+    
+    def classify(self, params: Dict[str, Any], today: date) -> str:
+        """조회 기간이 오늘 기준 어느 시점인지 구분"""
+        period = self._parse_period(params)
+        if period is None:
+            return 'undated'
+        
+        first_day, last_day = period
+        if first_day > today:
+            return 'upcoming'
+        if first_day == last_day == today:
+            return 'today'
+        if last_day >= today:
+            return 'current'
+        if (today - last_day).days >= self.SETTLED_DAYS:
+            return 'settled'
+        return 'recent'
+    
+    def _parse_period(self, params: Dict[str, Any]):
+        """날짜 파라미터를 (시작일, 종료일)로 변환 (YYYYMMDD/YYYYMM/YYYY 지원)"""
+        for key in self.DATE_PARAMS:
+            value = params.get(key)
+            if not value:
+                continue
+            value = str(value)
+            try:
+                if len(value) == 8:
+                    day = datetime.strptime(value, '%Y%m%d').date()
+                    return day, day
+                if len(value) == 6:
+                    year, month = int(value[:4]), int(value[4:])
+                    last = calendar.monthrange(year, month)[1]
+                    return date(year, month, 1), date(year, month, last)
+                if len(value) == 4:
+                    year = int(value)
+                    return date(year, 1, 1), date(year, 12, 31)
+            except ValueError:
+                logger.warning(f"날짜 파라미터 형식 오류: {key}={value}")
+                return None
+        return None
@@ -8,10 +8,13 @@ urlpatterns = [
     path('schedule/', views.schedule_view, name='schedule'),
     path('prediction/', views.prediction_view, name='prediction'),
     path('api/test/', views.api_test, name='api_test'), 
+    path('api/stats/', views.api_service_stats, name='api_stats'),
     path('api/today-races/', views.today_races, name='today_races'),
     path('api/schedule/', views.api_schedule_data, name='api_schedule'),
     path('api/results/', views.api_race_results, name='api_results'),
     path('api/race-horses/', views.api_race_horses, name='api_race_horses'),
     path('api/horse-detail/', views.api_horse_detail, name='api_horse_detail'),
+    path('api/autocomplete/', views.api_autocomplete, name='api_autocomplete'),
+    path('api/entry-changes/', views.api_entry_changes, name='api_entry_changes'),
     path('api/prediction/', views.api_race_prediction, name='api_prediction'),
 ]
\ No newline at end of file
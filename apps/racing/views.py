@@ -4,13 +4,30 @@ from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.utils import timezone
 from django.contrib import messages
+from django.conf import settings
 from .services import KRAAPIService
+from .services.change_feed import EntryChangeFeed
+from .services.deadline import Deadline
+from .services.horse_registry import get_horse_registry
+from .services.name_index import get_name_index
+from .services.prediction_cache import PredictionCache
+from .services.race_card import load_stored_results
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def get_api_service(deadline: float = None) -> KRAAPIService:
+    """
+    뷰용 API 서비스 생성
+    
+    프론트엔드 AJAX 타임아웃(10~15초)보다 먼저 응답하도록 upstream 호출에 마감 시각을 둔다.
+    """
+    seconds = deadline or getattr(settings, 'KRA_VIEW_DEADLINE', 12)
+    return KRAAPIService(deadline=Deadline.after(seconds))
+
+
 def index(request):
     """메인 대시보드 페이지"""
     context = {
@@ -24,7 +41,7 @@ def index(request):
 def api_test(request):
     """API 연결 테스트"""
     try:
-        api_service = KRAAPIService()
+        api_service = get_api_service(deadline=8)  # 프론트엔드 타임아웃 10초
         success = api_service.test_connection()
         
         if success:
@@ -46,17 +63,36 @@ def api_test(request):
         }, status=500)
 
 
+@require_http_methods(["GET"])
+def api_service_stats(request):
+    """KRA API 서비스 운영 통계 (커넥션 풀 등)"""
+    try:
+        api_service = KRAAPIService()
+        return JsonResponse({
+            'success': True,
+            'data': api_service.get_stats()
+        })
+        
+    except Exception as e:
+        logger.error(f"서비스 통계 조회 오류: {str(e)}")
+        return JsonResponse({
+            'success': False,
+            'message': f'오류 발생: {str(e)}'
+        }, status=500)
+
+
 @require_http_methods(["GET"]) 
 def today_races(request):
     """오늘의 경주 정보 조회"""
     try:
-        api_service = KRAAPIService()
+        api_service = get_api_service()
         races = api_service.get_today_races()
         
         return JsonResponse({
             'success': True,
             'data': races,
-            'tracks': KRAAPIService.TRACKS
+            'tracks': KRAAPIService.TRACKS,
+            'partial': races.get('partial', False)
         })
         
     except Exception as e:
@@ -80,29 +116,36 @@ def schedule_view(request):
 def api_schedule_data(request):
     """AJAX로 경주 일정 데이터 조회"""
     try:
-        api_service = KRAAPIService()
+        api_service = get_api_service()
         
         # 파라미터 받기
         meet = int(request.GET.get('meet', 1))  # 기본값: 서울
         date = request.GET.get('date', '')
         
         if not date:
-            # 기본값: 최근 금요일 찾기
+            # 기본값: 경주 달력 기준 가장 최근 개최일 (오늘 경주는 오후 6시 이후부터)
             today = datetime.now()
-            days_since_friday = (today.weekday() - 4) % 7
-            if days_since_friday == 0 and today.hour < 18:  # 오늘이 금요일인데 오후 6시 전이면 지난 주 금요일
-                days_since_friday = 7
-            last_friday = today - timedelta(days=days_since_friday)
-            date = last_friday.strftime('%Y%m%d')
-        
-        # 금,토,일 여부 확인
+            since = today if today.hour >= 18 else today - timedelta(days=1)
+            date = api_service.calendar.previous_race_day(since, meets=[meet])
+            if not date:
+                # 달력을 쓸 수 없으면 최근 금요일
+                days_since_friday = (today.weekday() - 4) % 7
+                if days_since_friday == 0 and today.hour < 18:  # 오늘이 금요일인데 오후 6시 전이면 지난 주 금요일
+                    days_since_friday = 7
+                last_friday = today - timedelta(days=days_since_friday)
+                date = last_friday.strftime('%Y%m%d')
+        
+        # 경주 달력으로 개최 여부 확인 (경주 없는 날은 upstream 호출 없이 응답)
         date_obj = datetime.strptime(date, '%Y%m%d')
-        weekday = date_obj.weekday()  # 0=월요일, 6=일요일
-        
-        if weekday not in [4, 5, 6]:  # 금(4), 토(5), 일(6)이 아닌 경우
+        if not api_service.calendar.is_race_day(meet, date_obj):
+            next_day = api_service.calendar.next_race_day(date_obj + timedelta(days=1), meets=[meet])
+            message = f'{date[:4]}-{date[4:6]}-{date[6:8]}은 {api_service.TRACKS.get(meet, meet)} 경마가 없는 날입니다.'
+            if next_day:
+                message += f' (다음 개최일: {next_day[:4]}-{next_day[4:6]}-{next_day[6:8]})'
             return JsonResponse({
                 'success': False,
-                'error': f'{date[:4]}-{date[4:6]}-{date[6:8]}은 경마가 없는 날입니다. (금, 토, 일요일만 경마 개최)'
+                'error': message,
+                'next_race_day': next_day
             })
         
         # API 호출
@@ -129,7 +172,7 @@ def api_schedule_data(request):
 def api_race_results(request):
     """AJAX로 경주 성적 데이터 조회"""
     try:
-        api_service = KRAAPIService()
+        api_service = get_api_service()
         
         # 파라미터 받기
         meet = int(request.GET.get('meet', 1))
@@ -142,8 +185,10 @@ def api_race_results(request):
                 'error': '날짜가 필요합니다.'
             })
         
-        # API 호출
-        results = api_service.get_race_results(meet=meet, race_date=date)
+        # 적재된 성적 우선, 없으면 API 호출
+        results = load_stored_results(meet, date)
+        if results is None:
+            results = api_service.get_race_results(meet=meet, race_date=date)
         
         # 특정 경주번호가 지정된 경우 필터링
         if race_no:
@@ -171,7 +216,7 @@ def api_race_results(request):
 def api_race_horses(request):
     """AJAX로 특정 경주의 출전마 리스트 조회"""
     try:
-        api_service = KRAAPIService()
+        api_service = get_api_service()
         
         # 파라미터 받기
         meet = int(request.GET.get('meet', 1))
@@ -184,41 +229,9 @@ def api_race_horses(request):
                 'error': '날짜와 경주번호가 필요합니다.'
             })
         
-        # 현재 날짜와 비교하여 예정/완료 경주 판단
-        from datetime import datetime
-        today = datetime.now().strftime('%Y%m%d')
-        is_future_race = date >= today
-        
-        sorted_horses = []
-        
-        if is_future_race:
-            # 예정된 경주: 출전표 API 사용
-            logger.info(f"예정 경주 - 출전표 API 사용: {meet}, {date}, {race_no}")
-            entries = api_service.get_entry_sheet(meet=meet, rc_date=date, rc_no=race_no)
-            
-            # 해당 경주번호의 출전마만 필터링
-            race_horses = [e for e in entries if e.get('rcNo') == race_no]
-            
-            # 출전번호순 정렬
-            sorted_horses = sorted(race_horses, key=lambda x: int(x.get('chulNo', 0)))
-            
-        else:
-            # 완료된 경주: 기존 성적 API 사용
-            logger.info(f"완료 경주 - 성적 API 사용: {meet}, {date}, {race_no}")
-            results = api_service.get_race_results(meet=meet, race_date=date)
-            
-            # 특정 경주번호와 날짜에 해당하는 말들만 필터링
-            race_horses_raw = [r for r in results if r.get('rcNo') == race_no and r.get('rcDate') == date]
-            
-            # 출전번호별로 중복 제거
-            race_horses = {}
-            for horse in race_horses_raw:
-                chul_no = horse.get('chulNo')
-                if chul_no and chul_no not in race_horses:
-                    race_horses[chul_no] = horse
-            
-            # 출전번호순으로 정렬
-            sorted_horses = [race_horses[chul_no] for chul_no in sorted(race_horses.keys(), key=lambda x: int(x))]
+        # 하루치 출전표(예정)/성적(완료)으로 만든 경주별 출전마 색인에서 조회
+        sorted_horses, is_future_race = api_service.race_cards.runners(meet, date, race_no)
+        logger.info(f"{'예정' if is_future_race else '완료'} 경주 출전마 조회: {meet}, {date}, {race_no} ({len(sorted_horses)}두)")
         
         return JsonResponse({
             'success': True,
@@ -243,7 +256,7 @@ def api_race_horses(request):
 def api_horse_detail(request):
     """AJAX로 경주마 상세정보 조회"""
     try:
-        api_service = KRAAPIService()
+        api_service = get_api_service()
         
         # 파라미터 받기
         meet = int(request.GET.get('meet', 1))
@@ -256,12 +269,8 @@ def api_horse_detail(request):
                 'error': '마번 또는 마명이 필요합니다.'
             })
         
-        # API 호출
-        horses = api_service.get_horse_info(meet=meet, hr_no=hr_no)
-        
-        # 마명으로 검색한 경우 필터링
-        if hr_name and not hr_no:
-            horses = [h for h in horses if h.get('hrName') == hr_name]
+        # 로컬 등록부 미러에서 조회, 없는 말만 upstream 조회
+        horses = get_horse_registry().lookup(api_service, meet, hr_no=hr_no, hr_name=hr_name)
         
         return JsonResponse({
             'success': True,
@@ -280,6 +289,71 @@ def api_horse_detail(request):
         })
 
 
+@require_http_methods(["GET"])
+def api_autocomplete(request):
+    """마명/기수명/조교사명 자동완성 (초성 검색 지원)"""
+    try:
+        query = request.GET.get('q', '').strip()
+        kind = request.GET.get('kind', '')
+        meet = int(request.GET.get('meet', 0) or 0)
+        limit = min(int(request.GET.get('limit', 10) or 10), 50)
+        
+        if not query:
+            return JsonResponse({'success': True, 'data': [], 'query': query})
+        
+        entries = get_name_index().search(
+            query, kinds=[kind] if kind else None, meet=meet or None, limit=limit
+        )
+        
+        return JsonResponse({
+            'success': True,
+            'data': [
+                {
+                    'kind': entry.kind,
+                    'id': entry.id,
+                    'name': entry.name,
+                    'meet': entry.meet,
+                    'meet_name': KRAAPIService.TRACKS.get(entry.meet, '') if entry.meet else '',
+                }
+                for entry in entries
+            ],
+            'query': query
+        })
+        
+    except Exception as e:
+        logger.error(f"자동완성 조회 오류: {str(e)}")
+        return JsonResponse({
+            'success': False,
+            'error': str(e)
+        })
+
+
+@require_http_methods(["GET"])
+def api_entry_changes(request):
+    """출전표 변경 내역 (출전 취소, 기수 변경, 중량 변경)"""
+    try:
+        meet = int(request.GET.get('meet', 1))
+        date = request.GET.get('date', '') or datetime.now().strftime('%Y%m%d')
+        since = int(request.GET.get('since', 0) or 0)
+        
+        events = EntryChangeFeed(get_api_service()).events(meet, date, since=since)
+        
+        return JsonResponse({
+            'success': True,
+            'data': events,
+            'meet': KRAAPIService.TRACKS.get(meet, str(meet)),
+            'date': date,
+            'last_seq': events[-1]['seq'] if events else since
+        })
+        
+    except Exception as e:
+        logger.error(f"출전표 변경 내역 조회 오류: {str(e)}")
+        return JsonResponse({
+            'success': False,
+            'error': str(e)
+        })
+
+
 def prediction_view(request):
     """예측 모델 페이지"""
     context = {
@@ -294,7 +368,6 @@ def prediction_view(request):
 def api_race_prediction(request):
     """AJAX로 경주 예측 수행"""
     try:
-        from .services.prediction_models import PredictionService
         import json
         
         # 파라미터 받기
@@ -308,42 +381,11 @@ def api_race_prediction(request):
                 'error': '날짜와 경주번호가 필요합니다.'
             })
         
-        # 경주 데이터 조회 (미래/과거 경주 자동 판단)
-        api_service = KRAAPIService()
-        from datetime import datetime
-        today = datetime.now().strftime('%Y%m%d')
-        is_future_race = date >= today
-        
-        race_horses = []
-        
-        if is_future_race:
-            # 예정된 경주: 출전표 API 사용
-            logger.info(f"예정 경주 예측 - 출전표 API 사용: {meet}, {date}, {race_no}")
-            entries = api_service.get_entry_sheet(meet=meet, rc_date=date, rc_no=race_no)
-            
-            # 해당 경주번호의 출전마만 필터링
-            race_horses_raw = [e for e in entries if e.get('rcNo') == race_no]
-            
-            # 출전번호순 정렬
-            race_horses = sorted(race_horses_raw, key=lambda x: int(x.get('chulNo', 0)))
-            
-        else:
-            # 완료된 경주: 기존 성적 API 사용
-            logger.info(f"완료 경주 예측 - 성적 API 사용: {meet}, {date}, {race_no}")
-            race_results = api_service.get_race_results(meet=meet, race_date=date)
-            
-            # 특정 경주번호와 날짜에 해당하는 말들만 필터링
-            race_horses_raw = [r for r in race_results if r.get('rcNo') == race_no and r.get('rcDate') == date]
-            
-            # 출전번호별로 중복 제거
-            race_horses_dict = {}
-            for horse in race_horses_raw:
-                chul_no = horse.get('chulNo')
-                if chul_no and chul_no not in race_horses_dict:
-                    race_horses_dict[chul_no] = horse
-            
-            # 출전번호순으로 정렬된 리스트
-            race_horses = [race_horses_dict[chul_no] for chul_no in sorted(race_horses_dict.keys(), key=lambda x: int(x))]
+        # 경주 데이터 조회 (미래/과거 경주 자동 판단, 경주별 출전마 색인 사용)
+        api_service = get_api_service()
+        runners, is_future_race = api_service.race_cards.records(meet, date, race_no)
+        race_horses = [runner.item for runner in runners]
+        logger.info(f"{'예정' if is_future_race else '완료'} 경주 예측: {meet}, {date}, {race_no} ({len(race_horses)}두)")
         
         if not race_horses:
             return JsonResponse({
@@ -366,10 +408,8 @@ def api_race_prediction(request):
                 logger.error(f"사용자 가중치 파싱 오류: {e}")
                 user_weights = None
         
-        # 예측 수행
-        race_data = {'horses': race_horses}
-        prediction_service = PredictionService()
-        predictions = prediction_service.get_predictions(race_data, user_weights)
+        # 예측 수행 (출전마/모델 입력/모델 버전/가중치가 같으면 저장된 예측 재사용)
+        predictions = PredictionCache().get_or_compute(runners, user_weights)
         
         return JsonResponse({
             'success': True,
@@ -181,8 +181,44 @@ CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'unique-snowflake',
-    }
+    },
+    # 한국마사회 API 응답 공유 캐시 (모든 워커가 공유하는 L2)
+    'kra': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('REDIS_URL'),
+        'TIMEOUT': 300,
+    } if os.environ.get('REDIS_URL') else {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'cache', 'kra'),
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 50000,
+            'CULL_FREQUENCY': 10,
+        },
+    },
 }
+KRA_CACHE_L1_MAX_ENTRIES = int(os.environ.get('KRA_CACHE_L1_MAX_ENTRIES', 512))  # 프로세스 내 LRU 크기
+KRA_SINGLEFLIGHT_CROSS_WORKER = os.environ.get('KRA_SINGLEFLIGHT_CROSS_WORKER', 'False') == 'True'  # 워커 간 동일 요청 합치기
+# 캐시 TTL 정책 재정의: '<엔드포인트 이름>.<구분>' → 초 (구분: upcoming/today/current/recent/settled/undated)
+KRA_CACHE_TTL_OVERRIDES = {}
+KRA_RETRY_MAX_ATTEMPTS = int(os.environ.get('KRA_RETRY_MAX_ATTEMPTS', 3))              # 일시적 오류 최대 시도 횟수
+KRA_BREAKER_FAILURE_THRESHOLD = int(os.environ.get('KRA_BREAKER_FAILURE_THRESHOLD', 5))  # 서킷 브레이커 연속 실패 기준
+KRA_BREAKER_RECOVERY_TIMEOUT = int(os.environ.get('KRA_BREAKER_RECOVERY_TIMEOUT', 30))   # 서킷 브레이커 open 유지 시간(초)
+KRA_DAILY_QUOTA = int(os.environ.get('KRA_DAILY_QUOTA', 10000))    # 엔드포인트별 일일 호출 한도 (API 키 기준)
+KRA_DAILY_QUOTAS = {}                                               # 엔드포인트 이름별 일일 한도 재정의, 예: {'horse_info': 1000}
+KRA_RATE_LIMIT = float(os.environ.get('KRA_RATE_LIMIT', 20))        # 워커당 초당 호출 수
+KRA_RATE_BURST = int(os.environ.get('KRA_RATE_BURST', 40))          # 순간 최대 호출 수
+KRA_VIEW_DEADLINE = float(os.environ.get('KRA_VIEW_DEADLINE', 12))  # 뷰의 upstream 응답 마감 시간(초), 프론트엔드 타임아웃 15초
+KRA_HEDGE_REQUESTS = os.environ.get('KRA_HEDGE_REQUESTS', 'True') == 'True'  # p95 초과 시 헤지 요청 사용
+KRA_ARCHIVE_DIR = os.environ.get('KRA_ARCHIVE_DIR', os.path.join(BASE_DIR, 'archive', 'kra'))  # 백필 원본 응답 아카이브
+KRA_EXPORT_DIR = os.environ.get('KRA_EXPORT_DIR', os.path.join(BASE_DIR, 'export', 'kra'))     # 분석/학습용 Arrow/Parquet 파티션
+KRA_MODEL_DIR = os.environ.get('KRA_MODEL_DIR', os.path.join(BASE_DIR, 'models', 'kra'))       # 학습된 예측 모델 버전 보관소
+
+# 한국마사회 API 설정
+KRA_MAX_PAGE_WORKERS = int(os.environ.get('KRA_MAX_PAGE_WORKERS', 4))      # 페이지 병렬 조회 수
+KRA_MAX_CONCURRENCY = int(os.environ.get('KRA_MAX_CONCURRENCY', 24))       # 비동기 동시 요청 수
+KRA_HTTP_POOL_SIZE = int(os.environ.get('KRA_HTTP_POOL_SIZE', 32))         # 커넥션 풀 크기
+KRA_HTTP2 = os.environ.get('KRA_HTTP2', 'False') == 'True'                 # HTTP/2 사용 (httpx[http2] 필요)
 
 # CORS 설정
 CORS_ALLOWED_ORIGINS = [
@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_wsgi_application()
+
+# 학습된 예측 모델 예열 (gunicorn --preload면 fork 전에 한 번 로드되어 워커들이 페이지 캐시를 공유)
+from apps.racing.services.model_registry import get_model_registry  # noqa: E402
+from apps.racing.services.prediction_models import AIPredictionModel  # noqa: E402
+
+get_model_registry().warm(AIPredictionModel.REGISTRY_NAME)